@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+MyPDF Library - 명령줄 도구 (화면 없이 실행, Qt 불필요)
+
+사용법:
+  python cli.py ingest 폴더_또는_PDF... [--category 분류] [--workers N]
+  python cli.py covers [--force] [--workers N]
+  python cli.py export 파일.json|파일.csv
+  python cli.py pages 책.pdf --out 폴더 [--range 1-10,15] [--width 1600] [--format png|jpg] [--workers N]
+
+ingest/covers/pages는 CPU 코어 수만큼 작업 프로세스를 띄워 나눠 처리하고, 끝나면 처리량을 출력합니다.
+프로그램과 같은 데이터 폴더(도서 목록, 표지)를 사용하므로 프로그램을 닫은 상태에서 실행하세요.
+"""
+
+import argparse
+import csv
+import os
+import sys
+import time
+import multiprocessing
+from functools import partial
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+EXPORT_FIELDS = ('title', 'path', 'category', 'total_pages', 'last_page', 'last_read', 'favorite', 'missing')
+
+
+class _Progress:
+    """한 줄짜리 진행 표시 (0.5초마다 갱신)"""
+
+    def __init__(self, label):
+        self.label = label
+        self._last = 0.0
+
+    def __call__(self, done, total, path=None):
+        now = time.perf_counter()
+        if now - self._last >= 0.5 or done == total:
+            self._last = now
+            print(f"\r{self.label} {done}/{total}", end="", file=sys.stderr, flush=True)
+        return True
+
+    def finish(self):
+        print(file=sys.stderr)
+
+
+def _page_ranges(text):
+    """--range 형식 검사 (페이지 수는 PDF를 연 뒤에 맞춤)"""
+    from render_core import parse_page_ranges
+    try:
+        parse_page_ranges(text, 0)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+    return text
+
+
+def _rate(count, seconds, unit):
+    return f"{count / seconds:.1f}{unit}/s" if seconds > 0 else f"-{unit}/s"
+
+
+def _collect_pdfs(targets):
+    """PDF 파일과 폴더(하위 폴더 포함)를 PDF 경로 목록으로"""
+    from folder_scan import scan_pdfs
+    paths = []
+    for target in targets:
+        if os.path.isdir(target):
+            paths.extend(sorted(scan_pdfs(os.path.abspath(target))[0]))
+        elif target.lower().endswith(".pdf") and os.path.isfile(target):
+            paths.append(os.path.normpath(os.path.abspath(target)))
+        else:
+            print(f"건너뜀 (PDF나 폴더가 아님): {target}")
+    return paths
+
+
+def cmd_ingest(args):
+    from library_manager import LibraryManager
+    paths = _collect_pdfs(args.targets)
+    manager = LibraryManager()
+    if args.category != "전체 보기":
+        manager.add_category(args.category)
+    progress = _Progress("등록")
+    start = time.perf_counter()
+    count = manager.add_books(paths, args.category, progress_callback=progress, max_workers=args.workers)
+    manager.flush()
+    elapsed = time.perf_counter() - start
+    progress.finish()
+    books = [manager.get_book(p) for p in paths]
+    pages = sum(b['total_pages'] for b in books if b)
+    mb = sum(b['file_size'] or 0 for b in books if b) / (1024 * 1024)
+    print(f"{count}권 등록 ({len(paths) - count}권 건너뜀, {pages}쪽, {mb:.1f}MB), {elapsed:.1f}초 - "
+          f"{_rate(len(paths), elapsed, '권')}, {_rate(pages, elapsed, '쪽')}, {_rate(mb, elapsed, 'MB')}")
+    return 0
+
+
+def cmd_covers(args):
+    from library_manager import LibraryManager
+    manager = LibraryManager()
+    total = len(manager.get_books())
+    progress = _Progress("표지")
+    start = time.perf_counter()
+    count = manager.regenerate_covers(force=args.force, progress_callback=progress, max_workers=args.workers)
+    elapsed = time.perf_counter() - start
+    progress.finish()
+    removed = manager.collect_orphan_covers()
+    print(f"{total}권 확인, {count}권 표지 갱신, 쓰지 않는 표지 {removed}개 삭제, {elapsed:.1f}초 - "
+          f"{_rate(total, elapsed, '권')}")
+    return 0
+
+
+def cmd_export(args):
+    from library_manager import LibraryManager
+    manager = LibraryManager()
+    if args.output.lower().endswith(".csv"):
+        books = manager.get_books()
+        with open(args.output, 'w', encoding='utf-8-sig', newline='') as f:  # utf-8-sig: 엑셀에서 한글이 깨지지 않게
+            writer = csv.DictWriter(f, fieldnames=EXPORT_FIELDS, extrasaction='ignore')
+            writer.writeheader()
+            writer.writerows(books)
+    else:
+        manager.export_json(args.output)
+        books = manager.get_books()
+    print(f"{len(books)}권 내보냄: {args.output}")
+    return 0
+
+
+def cmd_pages(args):
+    import fitz  # PyMuPDF
+    from render_core import parse_page_ranges, export_page_images
+    from ingest import process_pool
+    try:
+        doc = fitz.open(args.pdf)
+        total_pages = len(doc)
+        doc.close()
+    except Exception as e:
+        print(f"PDF를 열 수 없습니다 ({args.pdf}): {e}", file=sys.stderr)
+        return 2
+    pages = parse_page_ranges(args.range or f"1-{total_pages}", total_pages)
+    if not pages:
+        print(f"내보낼 페이지가 없습니다 (전체 {total_pages}쪽)")
+        return 1
+    os.makedirs(args.out, exist_ok=True)
+
+    # 페이지를 번갈아 나눠서(0, n, 2n...) 무거운 구간이 한 프로세스에 몰리지 않게 하고, 프로세스마다 문서는 한 번만 엶
+    workers = max(1, min(args.workers or os.cpu_count() or 1, len(pages)))
+    chunks = [pages[i::workers] for i in range(workers)]
+    job = partial(export_page_images, args.pdf, target_width=args.width, out_dir=args.out,
+                  image_format=args.format)
+    start = time.perf_counter()
+    if workers == 1:
+        results = [job(chunks[0])]
+    else:
+        with process_pool(workers) as executor:
+            results = list(executor.map(job, chunks))
+    elapsed = time.perf_counter() - start
+    written = sum(r[0] for r in results)
+    mb = sum(r[1] for r in results) / (1024 * 1024)
+    print(f"{written}쪽 저장 ({mb:.1f}MB, 프로세스 {workers}개), {elapsed:.1f}초 - {_rate(written, elapsed, '쪽')}")
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="MyPDF Library 명령줄 도구 (화면 없이 일괄 작업)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("ingest", help="PDF 파일/폴더를 서재에 일괄 등록")
+    p.add_argument("targets", nargs="+", help="PDF 파일 또는 폴더 (하위 폴더 포함)")
+    p.add_argument("--category", default="전체 보기", help="등록할 분류 (없으면 만듦)")
+    p.add_argument("--workers", type=int, default=None, help="작업 프로세스 수 (기본: CPU 코어 수)")
+    p.set_defaults(func=cmd_ingest)
+
+    p = sub.add_parser("covers", help="표지 이미지 다시 만들기")
+    p.add_argument("--force", action="store_true", help="이미 있는 표지도 새로 렌더링")
+    p.add_argument("--workers", type=int, default=None, help="작업 프로세스 수 (기본: CPU 코어 수)")
+    p.set_defaults(func=cmd_covers)
+
+    p = sub.add_parser("export", help="도서 목록 내보내기 (.json 또는 .csv)")
+    p.add_argument("output", help="저장할 파일 (.csv면 표 형식, 그 밖에는 books.json 형식)")
+    p.set_defaults(func=cmd_export)
+
+    p = sub.add_parser("pages", help="PDF의 페이지 범위를 이미지 파일로 저장")
+    p.add_argument("pdf", help="PDF 파일")
+    p.add_argument("--out", required=True, help="이미지를 저장할 폴더")
+    p.add_argument("--range", type=_page_ranges, default=None, help="페이지 범위 (1부터, 예: 1-10,15,20-) - 기본: 전체")
+    p.add_argument("--width", type=int, default=1600, help="이미지 너비 px (기본 1600)")
+    p.add_argument("--format", choices=("png", "jpg"), default="png")
+    p.add_argument("--workers", type=int, default=None, help="작업 프로세스 수 (기본: CPU 코어 수)")
+    p.set_defaults(func=cmd_pages)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    sys.exit(main())
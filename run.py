@@ -12,12 +12,14 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 import sys
 import os
+import multiprocessing
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from PyQt6.QtWidgets import QApplication
 from main import MainApp
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support() # 빌드된 실행 파일에서 병렬 등록(작업 프로세스) 지원
     app = QApplication(sys.argv)
     window = MainApp()
     window.show()
@@ -0,0 +1,96 @@
+"""
+PyMuPDF -> Qt 이미지 전달 과정의 복사량 측정 (화면 없이 실행)
+
+사용법: python scripts/bench_pixmap_copy.py 책.pdf [반복 횟수]
+
+한 쪽 보기에서 페이지를 화면에 올릴 때까지 픽셀 버퍼가 몇 바이트 복사되는지, 걸린 시간과 함께 비교합니다.
+  - before: 예전 PDFEngine.get_page_image 그대로 - pix.samples(bytes 복사) -> QImage(RGB888) -> QPixmap.fromImage
+  - after : 지금 PDFEngine.get_page_image (display_image도 같은 변환) - pix.samples_mv(복사 없음)
+            -> RGB32 변환 -> QPixmap.fromImage
+QPixmap.fromImage가 실제로 복사했는지는 결과 픽스맵이 원본 QImage 버퍼를 공유하는지로 판단합니다
+(래스터 백엔드에서는 RGB32 이미지를 복사 없이 공유하고, RGB888은 RGB32로 변환하며 복사).
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import fitz  # PyMuPDF
+from PyQt6.QtGui import QGuiApplication, QImage, QPixmap
+from pdf_engine import PDFEngine
+
+WIDTHS = (1200, 2400, 4800)
+
+
+def _pixmap_copy_bytes(pixmap, source):
+    """fromImage가 source와 따로 버퍼를 만들었으면 그 크기, 공유했으면 0"""
+    image = pixmap.toImage()
+    if int(image.constBits()) == int(source.constBits()):
+        return 0
+    return image.sizeInBytes()
+
+
+def render_before(engine, page_num, target_width):
+    """예전 방식 (pix.samples 복사 + RGB888 그대로 QPixmap 변환). 복사한 바이트 수도 함께 반환"""
+    page = engine.doc.load_page(page_num)
+    zoom = target_width / page.rect.width
+    pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False, colorspace=fitz.csRGB)
+    samples = pix.samples
+    q_img = QImage(samples, pix.width, pix.height, pix.stride, QImage.Format.Format_RGB888)
+    pixmap = QPixmap.fromImage(q_img)
+    return pixmap, len(samples) + _pixmap_copy_bytes(pixmap, q_img)
+
+
+def render_after(engine, page_num, target_width):
+    """지금 방식 - 캐시를 비우고 실제 get_page_image 경로로 렌더링"""
+    engine.cache.invalidate()
+    pixmap = engine.get_page_image(page_num, 1.0, target_width)
+    image = engine.cache.get(engine.cache_key(page_num, target_width))
+    return pixmap, image.sizeInBytes() + _pixmap_copy_bytes(pixmap, image)
+
+
+def measure(func, engine, target_width, repeat):
+    page_count = min(engine.get_total_pages(), repeat)
+    tracemalloc.start()
+    start = time.perf_counter()
+    copied = 0
+    pixels = 0
+    for i in range(repeat):
+        pixmap, n = func(engine, i % page_count, target_width)
+        copied += n
+        pixels += pixmap.width() * pixmap.height()
+    elapsed = time.perf_counter() - start
+    _, python_peak = tracemalloc.get_traced_memory()  # 파이썬 쪽 bytes 복사본이 있으면 여기 잡힘
+    tracemalloc.stop()
+    return {
+        'ms_per_render': elapsed / repeat * 1000,
+        'bytes_copied_per_render': copied // repeat,
+        'bytes_copied_per_pixel': copied / pixels if pixels else 0.0,
+        'python_peak_bytes': python_peak,
+    }
+
+
+def main():
+    if len(sys.argv) < 2:
+        print(__doc__)
+        return
+    pdf_path = sys.argv[1]
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    app = QGuiApplication(sys.argv[:1])  # QPixmap을 만들려면 필요
+    engine = PDFEngine()
+    engine.open(pdf_path)
+    print(f"{'width':>6} {'path':>7} {'ms/render':>10} {'copied MB':>10} {'B/px':>5} {'py peak MB':>11}")
+    for width in WIDTHS:
+        for name, func in (('before', render_before), ('after', render_after)):
+            r = measure(func, engine, width, repeat)
+            print(f"{width:>6} {name:>7} {r['ms_per_render']:>10.1f} {r['bytes_copied_per_render'] / 2**20:>10.1f} "
+                  f"{r['bytes_copied_per_pixel']:>5.1f} {r['python_peak_bytes'] / 2**20:>11.1f}")
+    engine.close_all()
+
+
+if __name__ == "__main__":
+    main()
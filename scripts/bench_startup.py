@@ -0,0 +1,84 @@
+"""
+프로그램 시작 시간 측정 (화면 없이 실행)
+
+사용법: python scripts/bench_startup.py [반복 횟수]
+
+매번 새 프로세스로 시작해서 아래 시점까지 걸린 시간(ms)을 잽니다.
+  - import   : main 모듈을 불러오기까지
+  - window   : MainApp 생성까지
+  - paint    : 서재 화면이 처음 그려지기까지
+  - catalog  : 도서 목록을 불러와 목록이 채워지기까지
+PyMuPDF(fitz)가 서재 화면을 띄우는 동안 불러와졌는지도 함께 표시합니다.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import time
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+
+
+def measure_once():
+    start = time.perf_counter()
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    sys.path.insert(0, SRC_DIR)
+
+    from PyQt6.QtWidgets import QApplication
+    from PyQt6.QtCore import QObject, QEvent
+    import main
+    result = {'import': (time.perf_counter() - start) * 1000}
+
+    # 도서 목록을 다 불러온 시점을 재기 위해 refresh_all을 감쌈 (MainApp이 만들어지기 전에)
+    original_refresh = main.LibraryWidget.refresh_all
+
+    def timed_refresh(self, *args, **kwargs):
+        original_refresh(self, *args, **kwargs)
+        result.setdefault('catalog', (time.perf_counter() - start) * 1000)
+    main.LibraryWidget.refresh_all = timed_refresh
+
+    class PaintWatcher(QObject):
+        def eventFilter(self, obj, event):
+            if event.type() == QEvent.Type.Paint:
+                result.setdefault('paint', (time.perf_counter() - start) * 1000)
+            return False
+
+    app = QApplication(sys.argv[:1])
+    window = main.MainApp()
+    result['window'] = (time.perf_counter() - start) * 1000
+    watcher = PaintWatcher()
+    window.library_widget.installEventFilter(watcher)
+    window.show()
+    deadline = time.perf_counter() + 10
+    while ('paint' not in result or 'catalog' not in result) and time.perf_counter() < deadline:
+        app.processEvents()
+    result['fitz_loaded'] = 'fitz' in sys.modules
+    result['books'] = window.library_widget.book_model.rowCount()
+    window.close()
+    return result
+
+
+def main_bench():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    runs = []
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, __file__, "--child"], capture_output=True, text=True)
+        line = out.stdout.strip().splitlines()[-1] if out.stdout.strip() else ""
+        if out.returncode != 0 or not line.startswith("{"):
+            print(out.stderr)
+            return
+        runs.append(json.loads(line))
+
+    print(f"runs: {repeat}, books: {runs[0]['books']}, fitz loaded at startup: {runs[0]['fitz_loaded']}")
+    for name in ('import', 'window', 'paint', 'catalog'):
+        values = sorted(r[name] for r in runs if name in r)
+        if values:
+            print(f"{name:>8}: median {values[len(values) // 2]:7.1f} ms  (min {values[0]:.1f}, max {values[-1]:.1f})")
+
+
+if __name__ == "__main__":
+    if "--child" in sys.argv:
+        print(json.dumps(measure_once()))
+    else:
+        main_bench()
@@ -0,0 +1,305 @@
+"""
+엔진/도서 목록/책 등록 성능 측정 모음 (화면 없이 실행)
+
+사용법:
+  python scripts/bench_suite.py [--books 20] [--pages 30] [--catalog-sizes 1000,10000,100000]
+                                [--repeat 5] [--scanned] [--out bench_results.json] [--compare 이전결과.json]
+
+임시 폴더에 가짜 PDF 묶음과 가짜 도서 목록을 만들어 측정하므로 실제 서재 데이터는 건드리지 않습니다.
+결과는 JSON으로 저장되며, --compare로 이전 결과를 주면 항목별 변화율을 함께 출력합니다.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+ZOOMS = (0.5, 1.0, 2.0, 4.0)
+AVAILABLE_WIDTH = 1000  # 독서 화면 너비 (px)
+WORDS = ("alpha", "bravo", "charlie", "delta", "echo", "foxtrot", "golf", "hotel",
+         "india", "juliet", "kilo", "lima", "mike", "november", "oscar", "papa")
+
+
+def stats(samples_ms):
+    return {
+        'n': len(samples_ms),
+        'mean_ms': statistics.fmean(samples_ms),
+        'median_ms': statistics.median(samples_ms),
+        'min_ms': min(samples_ms),
+        'max_ms': max(samples_ms),
+    }
+
+
+def timed(func, repeat=1):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+# ---------------------------------------------------------
+# 가짜 데이터 만들기
+# ---------------------------------------------------------
+def make_pdf(path, pages, rng, scanned=False):
+    """글자와 도형(scanned면 페이지 전체 크기의 잡음 이미지까지) 들어간 PDF 생성"""
+    import fitz
+    doc = fitz.open()
+    noise = None
+    if scanned:
+        # 압축이 잘 안 되는 이미지 = 스캔본처럼 디코딩 비용이 큰 페이지
+        noise = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 1240, 1754), False)
+        noise.set_rect(noise.irect, (255, 255, 255))
+        for _ in range(400):
+            x, y = rng.randrange(1200), rng.randrange(1700)
+            noise.set_rect(fitz.IRect(x, y, x + 40, y + 50), tuple(rng.randrange(256) for _ in range(3)))
+    for p in range(pages):
+        page = doc.new_page(width=595, height=842)
+        if noise is not None:
+            page.insert_image(page.rect, pixmap=noise)
+        text = "\n".join(" ".join(rng.choice(WORDS) for _ in range(10)) for _ in range(40))
+        page.insert_text((40, 50), f"Page {p + 1}\n{text}", fontsize=10)
+        for _ in range(5):
+            x, y = rng.randrange(500), rng.randrange(750)
+            page.draw_rect(fitz.Rect(x, y, x + 80, y + 60), color=(0, 0, 1), fill=(0.8, 0.9, 1.0))
+    doc.save(path)
+    doc.close()
+
+
+def make_corpus(folder, books, pages, scanned, seed=1):
+    rng = random.Random(seed)
+    os.makedirs(folder, exist_ok=True)
+    paths = []
+    for i in range(books):
+        path = os.path.join(folder, f"book_{i:04d}.pdf")
+        make_pdf(path, pages, rng, scanned)
+        paths.append(path)
+    return paths
+
+
+def make_catalog(manager, size, seed=1):
+    """PDF 없이 도서 목록(SQLite)만 size권으로 채움"""
+    rng = random.Random(seed)
+    categories = [f"분류 {i}" for i in range(10)]
+    for name in categories:
+        manager.store.add_category(name)
+    books = [{
+        'path': f"/bench/catalog/book_{i:06d}.pdf",
+        'title': f"{rng.choice(WORDS)} {rng.choice(WORDS)} {i}.pdf",
+        'cover': None,
+        'category': rng.choice(categories),
+        'last_page': 0,
+        'total_pages': rng.randrange(10, 900),
+        'last_read': None if rng.random() < 0.7 else f"2025-01-{rng.randrange(1, 29):02d} 10:00:00",
+        'favorite': rng.random() < 0.05,
+        'content_hash': None,
+    } for i in range(size)]
+    manager.store.insert_books(books)
+    manager.load_data()
+    return books
+
+
+# ---------------------------------------------------------
+# 측정 항목
+# ---------------------------------------------------------
+def bench_engine(corpus, repeat, results):
+    from pdf_engine import PDFEngine
+    engine = PDFEngine()
+    engine.open(corpus[0])
+    pages = min(engine.get_total_pages(), 5)
+    for zoom in ZOOMS:
+        def cold():
+            engine.cache.invalidate()
+            for p in range(pages):
+                engine.get_page_image(p, zoom, AVAILABLE_WIDTH)
+        samples = [s / pages for s in timed(cold, repeat)]
+        results[f"engine.get_page_image.zoom_{zoom}.cold"] = stats(samples)
+        # 캐시 적중은 한 페이지로 측정 (크게 확대하면 여러 페이지가 캐시 예산을 넘어 모두 다시 렌더링됨)
+        engine.get_page_image(0, zoom, AVAILABLE_WIDTH)
+        misses = engine.cache.misses
+        samples = [s / pages for s in timed(lambda: [engine.get_page_image(0, zoom, AVAILABLE_WIDTH)
+                                                     for _ in range(pages)], repeat)]
+        if engine.cache.misses == misses:
+            results[f"engine.get_page_image.zoom_{zoom}.cached"] = stats(samples)
+        else:
+            print(f"zoom {zoom}: 한 페이지도 캐시 예산({engine.cache.max_bytes // 2**20}MB)을 넘어 cached 항목은 건너뜀")
+    engine.close_all()
+
+    out_dir = tempfile.mkdtemp(prefix="thumbs_")
+    samples = []
+    for path in corpus:
+        samples += timed(lambda: engine.create_thumbnail(path, os.path.join(out_dir, "thumb.png")))
+    results["engine.create_thumbnail"] = stats(samples)
+    shutil.rmtree(out_dir, ignore_errors=True)
+
+
+def bench_add_books(corpus, results):
+    from library_manager import LibraryManager
+    manager = LibraryManager(filename="bench_add.json")
+    samples = timed(lambda: manager.add_books(corpus))
+    results["library.add_books.total"] = stats(samples)
+    results["library.add_books.per_book"] = stats([s / len(corpus) for s in samples])
+    manager.store.close()
+    manager.text_index.close()
+
+
+def bench_catalog(size, repeat, results):
+    from library_manager import LibraryManager
+    manager = LibraryManager(filename=f"bench_catalog_{size}.json")
+    books = make_catalog(manager, size)
+    rng = random.Random(2)
+    prefix = f"catalog_{size}"
+
+    targets = [rng.choice(books)['path'] for _ in range(200)]
+
+    def update_pages():
+        for i, path in enumerate(targets):
+            manager.update_last_page(path, i)
+    results[f"{prefix}.update_last_page"] = stats([s / len(targets) for s in timed(update_pages, repeat)])
+    results[f"{prefix}.flush"] = stats(timed(lambda: (manager.update_last_page(targets[0], 1), manager.flush()),
+                                             repeat))
+
+    for category in ("전체 보기", "최근 읽은 책", "즐겨찾기", "분류 3"):
+        results[f"{prefix}.get_books.{category}"] = stats(timed(lambda: manager.get_books(category), repeat))
+
+    bench_title_filter(manager, prefix, repeat, results)
+    results[f"{prefix}.load_data"] = stats(timed(manager.load_data, repeat))
+    manager.store.close()
+    manager.text_index.close()
+
+
+def bench_title_filter(manager, prefix, repeat, results):
+    # 서재 화면의 제목 검색 (모델/프록시 거르기)
+    from library_model import BookListModel, BookFilterProxyModel
+    model = BookListModel()
+    proxy = BookFilterProxyModel()
+    proxy.setSourceModel(model)
+    results[f"{prefix}.model.set_books"] = stats(timed(lambda: model.set_books(manager.get_books("전체 보기")),
+                                                       repeat))
+    results[f"{prefix}.search.title_filter"] = stats(timed(lambda: (proxy.set_search("delta"),
+                                                                    proxy.set_search("")), repeat))
+
+
+def bench_rescan(work_dir, files, repeat, results):
+    """연결한 폴더에 바뀐 것이 없을 때 다시 검사하는 시간 (빈 .pdf 파일 + 같은 크기/시각으로 등록된 목록)"""
+    from library_manager import LibraryManager
+    root = os.path.join(work_dir, "linked")
+    books = []
+    for i in range(files):
+        folder = os.path.join(root, f"dir_{i // 200:04d}")
+        if i % 200 == 0:
+            os.makedirs(folder, exist_ok=True)
+        path = os.path.join(folder, f"book_{i:06d}.pdf")
+        with open(path, 'wb'):
+            pass
+        st = os.stat(path)
+        books.append({'path': path, 'title': os.path.basename(path), 'category': "연결",
+                      'file_size': st.st_size, 'file_mtime': st.st_mtime_ns, 'missing': False})
+    manager = LibraryManager(filename="bench_rescan.json")
+    manager.store.insert_books(books)
+    manager.add_library_folder(root, "연결")
+    manager.load_data()
+    summaries = []
+    samples = timed(lambda: summaries.append(manager.sync_folder(root, "연결")), repeat)
+    assert summaries[-1]['unchanged'] == files, summaries[-1]
+    results[f"folder.rescan_unchanged_{files}"] = stats(samples)
+    results[f"folder.rescan_unchanged_{files}.scan_only"] = stats([s['scan_ms'] for s in summaries])
+    manager.store.close()
+    manager.text_index.close()
+
+
+def bench_content_search(corpus, repeat, results):
+    from library_manager import LibraryManager
+    manager = LibraryManager(filename="bench_add.json")
+    manager.load_data()
+    for query in ("charlie", "delta echo", "없는단어"):
+        results[f"library.search_content.{query}"] = stats(timed(lambda: manager.search_content(query), repeat))
+
+
+# ---------------------------------------------------------
+def compare(results, old_path):
+    with open(old_path, 'r', encoding='utf-8') as f:
+        old = json.load(f)['results']
+    print(f"\n{'항목':<55} {'이전':>10} {'지금':>10} {'변화':>8}")
+    for name, r in results.items():
+        if name not in old:
+            continue
+        before, after = old[name]['median_ms'], r['median_ms']
+        change = (after - before) / before * 100 if before else 0.0
+        print(f"{name:<55} {before:>10.3f} {after:>10.3f} {change:>+7.1f}%")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="나만의 PDF 서재 성능 측정")
+    parser.add_argument("--books", type=int, default=20, help="가짜 PDF 권수")
+    parser.add_argument("--pages", type=int, default=30, help="PDF 한 권의 페이지 수")
+    parser.add_argument("--catalog-sizes", default="1000,10000,100000", help="도서 목록 크기 (쉼표로 구분)")
+    parser.add_argument("--rescan-files", type=int, default=50000, help="폴더 다시 검사 측정에 쓸 파일 수 (0이면 생략)")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--scanned", action="store_true", help="페이지마다 큰 이미지를 넣어 스캔본처럼 만듦")
+    parser.add_argument("--out", default="bench_results.json")
+    parser.add_argument("--compare", help="이전 결과 JSON (항목별 변화율 출력)")
+    args = parser.parse_args()
+
+    # 실제 서재 데이터와 섞이지 않도록 데이터 폴더를 임시 폴더로 돌림 (config 모듈이 이 값을 읽음)
+    work_dir = tempfile.mkdtemp(prefix="mypdf_bench_")
+    for var in ("HOME", "USERPROFILE", "LOCALAPPDATA"):
+        os.environ[var] = work_dir
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    sys.path.insert(0, SRC_DIR)
+
+    from PyQt6.QtWidgets import QApplication
+    import fitz
+    app = QApplication(sys.argv[:1])
+
+    results = {}
+    try:
+        start = time.perf_counter()
+        corpus = make_corpus(os.path.join(work_dir, "corpus"), args.books, args.pages, args.scanned)
+        print(f"가짜 PDF {args.books}권 x {args.pages}쪽 생성: {time.perf_counter() - start:.1f}s")
+
+        bench_engine(corpus, args.repeat, results)
+        bench_add_books(corpus, results)
+        bench_content_search(corpus, args.repeat, results)
+        if args.rescan_files:
+            start = time.perf_counter()
+            bench_rescan(work_dir, args.rescan_files, args.repeat, results)
+            print(f"폴더 다시 검사 ({args.rescan_files}개 파일) 측정: {time.perf_counter() - start:.1f}s")
+        for size in [int(s) for s in args.catalog_sizes.split(",") if s.strip()]:
+            start = time.perf_counter()
+            bench_catalog(size, args.repeat, results)
+            print(f"도서 목록 {size}권 측정: {time.perf_counter() - start:.1f}s")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    report = {
+        'meta': {
+            'time': time.strftime("%Y-%m-%d %H:%M:%S"),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'pymupdf': fitz.VersionBind,
+            'args': vars(args),
+        },
+        'results': results,
+    }
+    with open(args.out, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+    for name, r in results.items():
+        print(f"{name:<55} median {r['median_ms']:>10.3f} ms")
+    print(f"\n결과 저장: {args.out}")
+    if args.compare:
+        compare(results, args.compare)
+    app.quit()
+
+
+if __name__ == "__main__":
+    main()
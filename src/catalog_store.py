@@ -0,0 +1,234 @@
+import json
+import os
+import sqlite3
+
+# 책 한 권의 필드 (books.json의 책 항목과 같은 구조)
+# file_size/file_mtime: 등록(또는 마지막 검사) 때의 파일 크기와 수정 시각(ns) - 폴더를 다시 검사할 때 비교
+# missing: 연결한 폴더를 검사했을 때 파일이 없었던 책
+# fingerprint: 크기 + 앞/뒤 일부의 해시 (옮겨진 파일을 찾아 다시 연결할 때 사용, cover_store.quick_fingerprint)
+BOOK_FIELDS = ('path', 'title', 'cover', 'category', 'last_page', 'total_pages', 'last_read', 'favorite',
+               'content_hash', 'file_size', 'file_mtime', 'missing', 'fingerprint')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS books (
+    path TEXT PRIMARY KEY,
+    title TEXT,
+    cover TEXT,
+    category TEXT,
+    last_page INTEGER DEFAULT 0,
+    total_pages INTEGER DEFAULT 0,
+    last_read TEXT,
+    favorite INTEGER DEFAULT 0,
+    content_hash TEXT,
+    file_size INTEGER,
+    file_mtime INTEGER,
+    missing INTEGER DEFAULT 0,
+    fingerprint TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_books_category ON books(category);
+CREATE INDEX IF NOT EXISTS idx_books_favorite ON books(favorite);
+CREATE INDEX IF NOT EXISTS idx_books_last_read ON books(last_read);
+CREATE INDEX IF NOT EXISTS idx_books_content_hash ON books(content_hash);
+CREATE INDEX IF NOT EXISTS idx_books_fingerprint ON books(fingerprint);
+CREATE TABLE IF NOT EXISTS categories (
+    name TEXT PRIMARY KEY,
+    position INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS library_folders (
+    path TEXT PRIMARY KEY,
+    category TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+def _row_to_book(row):
+    book = dict(zip(BOOK_FIELDS, row))
+    book['favorite'] = bool(book['favorite'])
+    book['missing'] = bool(book['missing'])
+    book['last_page'] = book['last_page'] or 0
+    return book
+
+
+class CatalogStore:
+    """SQLite 기반 도서 목록 저장소
+
+    책 한 권을 고칠 때 전체 파일을 다시 쓰지 않고 해당 행만 트랜잭션으로 갱신합니다.
+    """
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self._upgrade_schema()
+        self.conn.executescript(SCHEMA)
+        self.conn.commit()
+
+    def _upgrade_schema(self):
+        """이전 버전 DB에 없는 열 추가"""
+        columns = {r[1] for r in self.conn.execute("PRAGMA table_info(books)")}
+        if not columns:
+            return  # 새 DB (SCHEMA가 만듦)
+        for field in BOOK_FIELDS:
+            if field not in columns:
+                self.conn.execute(f"ALTER TABLE books ADD COLUMN {field}")
+
+    # ---------- 읽기 ----------
+    def load(self):
+        """전체 목록을 books.json과 같은 모양의 dict로 반환"""
+        cols = ", ".join(BOOK_FIELDS)
+        books = [_row_to_book(r) for r in self.conn.execute(f"SELECT {cols} FROM books ORDER BY rowid")]
+        categories = [r[0] for r in self.conn.execute("SELECT name FROM categories ORDER BY position")]
+        return {"categories": categories, "books": books}
+
+    def cover_paths(self):
+        return [r[0] for r in self.conn.execute("SELECT cover FROM books WHERE cover IS NOT NULL")]
+
+    def get_meta(self, key, default=None):
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else default
+
+    def set_meta(self, key, value):
+        with self.conn:
+            self.conn.execute("INSERT OR REPLACE INTO meta(key, value) VALUES (?, ?)", (key, value))
+
+    # ---------- 책 ----------
+    def insert_books(self, books):
+        cols = ", ".join(BOOK_FIELDS)
+        marks = ", ".join("?" for _ in BOOK_FIELDS)
+        with self.conn:
+            self.conn.executemany(
+                f"INSERT OR IGNORE INTO books({cols}) VALUES ({marks})",
+                [tuple(b.get(f) for f in BOOK_FIELDS) for b in books])
+
+    def update_book(self, book_path, **fields):
+        """한 권의 일부 필드만 갱신 (path 변경 포함). 해당 책이 없으면 False"""
+        unknown = set(fields) - set(BOOK_FIELDS)
+        if unknown:
+            raise ValueError(f"알 수 없는 필드: {', '.join(sorted(unknown))}")
+        if not fields:
+            return False
+        assignments = ", ".join(f"{k} = ?" for k in fields)
+        try:
+            with self.conn:
+                cur = self.conn.execute(f"UPDATE books SET {assignments} WHERE path = ?",
+                                        (*fields.values(), book_path))
+        except sqlite3.IntegrityError:
+            return False  # 바꾸려는 경로가 이미 다른 책으로 등록됨
+        return cur.rowcount > 0
+
+    def update_books(self, changes):
+        """{경로: {필드: 값}} 여러 권의 변경을 한 트랜잭션으로 기록"""
+        if not changes:
+            return
+        with self.conn:
+            for book_path, fields in changes.items():
+                assignments = ", ".join(f"{k} = ?" for k in fields)
+                self.conn.execute(f"UPDATE books SET {assignments} WHERE path = ?",
+                                  (*fields.values(), book_path))
+
+    def delete_book(self, path):
+        with self.conn:
+            cur = self.conn.execute("DELETE FROM books WHERE path = ?", (path,))
+        return cur.rowcount > 0
+
+    def delete_books(self, paths):
+        """여러 권을 한 트랜잭션으로 삭제"""
+        with self.conn:
+            cur = self.conn.executemany("DELETE FROM books WHERE path = ?", [(p,) for p in paths])
+        return cur.rowcount
+
+    # ---------- 카테고리 ----------
+    def add_category(self, name, position=None):
+        """카테고리 추가 (position이 없으면 맨 뒤)"""
+        with self.conn:
+            if position is None:
+                self.conn.execute(
+                    "INSERT OR IGNORE INTO categories(name, position) "
+                    "VALUES (?, (SELECT COALESCE(MAX(position), -1) + 1 FROM categories))", (name,))
+            else:
+                self.conn.execute("INSERT OR IGNORE INTO categories(name, position) VALUES (?, ?)",
+                                  (name, position))
+
+    def delete_category(self, name):
+        """카테고리와 그 안의 책 목록을 한 트랜잭션으로 삭제"""
+        with self.conn:
+            self.conn.execute("DELETE FROM categories WHERE name = ?", (name,))
+            self.conn.execute("DELETE FROM books WHERE category = ?", (name,))
+            self.conn.execute("DELETE FROM library_folders WHERE category = ?", (name,))
+
+    # ---------- 연결한 서재 폴더 ----------
+    def library_folders(self):
+        """[(폴더 경로, 카테고리), ...]"""
+        return self.conn.execute("SELECT path, category FROM library_folders ORDER BY path").fetchall()
+
+    def add_library_folder(self, path, category):
+        with self.conn:
+            self.conn.execute("INSERT OR REPLACE INTO library_folders(path, category) VALUES (?, ?)",
+                              (path, category))
+
+    def remove_library_folder(self, path):
+        with self.conn:
+            self.conn.execute("DELETE FROM library_folders WHERE path = ?", (path,))
+
+    # ---------- 전체 저장 ----------
+    def replace_all(self, data):
+        """메모리의 전체 목록으로 저장소를 통째로 교체 (마이그레이션용)"""
+        cols = ", ".join(BOOK_FIELDS)
+        marks = ", ".join("?" for _ in BOOK_FIELDS)
+        with self.conn:
+            self.conn.execute("DELETE FROM books")
+            self.conn.execute("DELETE FROM categories")
+            self.conn.executemany(
+                f"INSERT OR REPLACE INTO books({cols}) VALUES ({marks})",
+                [tuple(b.get(f) for f in BOOK_FIELDS) for b in data.get("books", [])])
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO categories(name, position) VALUES (?, ?)",
+                [(name, i) for i, name in enumerate(data.get("categories", []))])
+
+    def close(self):
+        self.conn.close()
+
+
+def write_json_atomic(path, data):
+    """JSON 파일을 임시 파일에 쓰고 fsync 후 rename (쓰는 도중 종료돼도 기존 파일이 깨지지 않음)"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=4)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def migrate_json_catalog(json_path, store):
+    """기존 books.json 내용을 SQLite 저장소로 한 번만 옮김
+
+    원본 books.json은 백업용으로 그대로 남겨둡니다.
+
+    Returns:
+        tuple: (성공 여부, 옮긴 책 수)
+    """
+    if store.get_meta('json_migrated') or not os.path.exists(json_path):
+        return True, 0
+    try:
+        with open(json_path, 'r', encoding='utf-8') as f:
+            loaded_data = json.load(f)
+        if isinstance(loaded_data, list):
+            loaded_data = {"categories": ["전체 보기"], "books": loaded_data}
+
+        # 이미 저장소에 있는 카테고리/책은 유지하고 JSON 쪽 항목을 더함
+        current = store.load()
+        categories = current["categories"] + [c for c in loaded_data.get("categories", [])
+                                              if c not in current["categories"]]
+        known = {b['path'] for b in current["books"]}
+        books = current["books"] + [b for b in loaded_data.get("books", []) if b.get('path') not in known]
+        store.replace_all({"categories": categories, "books": books})
+        store.set_meta('json_migrated', '1')
+        return True, len(books) - len(current["books"])
+    except Exception as e:
+        print(f"도서 목록 마이그레이션 오류: {e}")
+        return False, 0
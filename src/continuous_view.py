@@ -0,0 +1,191 @@
+from bisect import bisect_right
+from PyQt6.QtCore import Qt, QObject, QRect, pyqtSignal
+from PyQt6.QtGui import QPainter, QColor, QImage
+from PyQt6.QtWidgets import QAbstractScrollArea
+from night_mode import cached_night_image
+
+PAGE_GAP = 10  # 페이지 사이 간격 (px)
+PRELOAD_PAGES = 1  # 화면 위아래로 미리 그려둘 페이지 수
+BACKGROUND = QColor("#505050")
+PLACEHOLDER = QColor("#3d3d3d")
+
+
+class _RenderSignals(QObject):
+    # 작업 스레드에서 GUI 스레드로 렌더링 결과 전달 (cache_key, QImage 또는 None)
+    rendered = pyqtSignal(object, object)
+
+
+class ContinuousPageView(QAbstractScrollArea):
+    """연속 스크롤 뷰 - 모든 페이지를 세로로 이어 붙인 가상 캔버스
+
+    캔버스 크기는 페이지 크기 목록으로만 계산하고, 실제로는 화면에 보이는 페이지(와 앞뒤 조금)만 렌더링합니다.
+    화면 밖으로 나간 페이지의 이미지는 바로 놓아주므로 3,000쪽짜리 문서도 메모리 사용량이 일정합니다.
+    """
+
+    current_page_changed = pyqtSignal(int)
+
+    def __init__(self, engine, prefetcher, parent=None):
+        super().__init__(parent)
+        self.engine = engine
+        self.prefetcher = prefetcher
+        self.zoom_level = 1.0
+        self.available_width = 0
+        self.night_mode = "off"
+        self.current_page = 0
+        self._tops = []  # 페이지별 캔버스 y 좌표
+        self._heights = []
+        self._target_width = 0
+        self._canvas_height = 0
+        # 화면 근처 페이지만 보관 {page: (cache_key, QImage)}
+        # 캐시의 QImage를 그대로 그리므로(drawImage) QPixmap으로 한 번 더 복사하지 않음
+        self._images = {}
+        self._requested = set()
+        self._signals = _RenderSignals()
+        self._signals.rendered.connect(self._on_rendered)
+        self.verticalScrollBar().setSingleStep(40)
+        self.horizontalScrollBar().setSingleStep(40)
+        self.verticalScrollBar().valueChanged.connect(self._update_current_page)
+
+    def reset(self):
+        """새 문서를 열었을 때 레이아웃을 다시 계산"""
+        self.current_page = 0
+        self._clear()
+        self._relayout()
+        self.verticalScrollBar().setValue(0)
+
+    def set_options(self, zoom_level, available_width, night_mode):
+        """확대 비율/야간 모드가 바뀌면 보고 있던 위치를 유지한 채로 다시 배치"""
+        if (zoom_level, available_width, night_mode) == (self.zoom_level, self.available_width, self.night_mode):
+            return
+        page, offset = self._anchor()
+        if night_mode != self.night_mode:
+            self._clear()  # 원본 렌더링은 캐시에 남아 있으므로 야간 모드만 다시 입힘
+        else:
+            # 크기만 바뀐 경우: 새 이미지가 올 때까지 이전 이미지를 늘리거나 줄여서 보여줌
+            self._requested.clear()
+            self.prefetcher.retain(())
+        self.zoom_level = zoom_level
+        self.available_width = available_width
+        self.night_mode = night_mode
+        self._relayout()
+        if page < len(self._tops):
+            self.verticalScrollBar().setValue(self._tops[page] + round(offset * self._heights[page]))
+
+    def scroll_to_page(self, page):
+        if page == self.current_page or not (0 <= page < len(self._tops)):
+            return
+        self.verticalScrollBar().setValue(self._tops[page])
+
+    def _clear(self):
+        self._images.clear()
+        self._requested.clear()
+        self.prefetcher.retain(())
+
+    def _anchor(self):
+        # 현재 페이지와 그 페이지 안에서의 상대 위치 (다시 배치한 뒤 같은 곳을 보여주기 위해)
+        page = self.current_page
+        if not (0 <= page < len(self._tops)) or not self._heights[page]:
+            return page, 0.0
+        return page, (self.verticalScrollBar().value() - self._tops[page]) / self._heights[page]
+
+    def _relayout(self):
+        self._target_width = int(self.available_width * self.zoom_level)
+        self._tops = []
+        self._heights = []
+        y = 0
+        for w, h in self.engine.get_page_sizes():
+            height = round(h * self._target_width / w) if w else 0
+            self._tops.append(y)
+            self._heights.append(height)
+            y += height + PAGE_GAP
+        self._canvas_height = max(0, y - PAGE_GAP)
+        self._update_scrollbars()
+        self.viewport().update()
+
+    def _update_scrollbars(self):
+        viewport = self.viewport()
+        vbar = self.verticalScrollBar()
+        vbar.setPageStep(viewport.height())
+        vbar.setRange(0, max(0, self._canvas_height - viewport.height()))
+        hbar = self.horizontalScrollBar()
+        hbar.setPageStep(viewport.width())
+        hbar.setRange(0, max(0, self._target_width - viewport.width()))
+
+    def _page_at(self, y):
+        return max(0, bisect_right(self._tops, y) - 1)
+
+    def _update_current_page(self, value):
+        if not self._tops:
+            return
+        page = self._page_at(value + self.viewport().height() // 3)
+        if page != self.current_page:
+            self.current_page = page
+            self.current_page_changed.emit(page)
+
+    def _visible_range(self):
+        top = self.verticalScrollBar().value()
+        first = self._page_at(top)
+        last = self._page_at(top + self.viewport().height())
+        return max(0, first - PRELOAD_PAGES), min(len(self._tops) - 1, last + PRELOAD_PAGES)
+
+    def _image_for(self, page):
+        """화면에 그릴 이미지 - 현재 크기의 것이 아직 없으면 렌더링을 요청하고 이전 크기의 이미지(없으면 None)를 돌려줌"""
+        key = self.engine.cache_key(page, self._target_width)
+        old_key, image = self._images.get(page, (None, None))
+        if old_key == key:
+            return image
+        cached = self.engine.cache.get(key)
+        if cached is not None:
+            cached = cached_night_image(self.engine.cache, key, cached, self.night_mode)
+            self._images[page] = (key, cached)
+            return cached
+        if key not in self._requested:
+            self._requested.add(key)
+            self.prefetcher.request(page, self._target_width, self._signals.rendered.emit)
+        return image
+
+    def _on_rendered(self, key, image):
+        self._requested.discard(key)
+        if key != self.engine.cache_key(key[1], self._target_width):
+            return  # 확대 비율이 바뀌기 전의 결과
+        if not isinstance(image, QImage) or image.isNull():
+            return
+        first, last = self._visible_range()
+        if first <= key[1] <= last:
+            self._images[key[1]] = (key, cached_night_image(self.engine.cache, key, image, self.night_mode))
+            self.viewport().update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self.viewport())
+        painter.fillRect(event.rect(), BACKGROUND)
+        if not self._tops or self._target_width <= 0:
+            return
+        first, last = self._visible_range()
+
+        # 화면 밖으로 나간 페이지는 놓아주고, 대기 중인 렌더링도 취소
+        for page in [p for p in self._images if not first <= p <= last]:
+            del self._images[page]
+        wanted = {self.engine.cache_key(p, self._target_width) for p in range(first, last + 1)}
+        self._requested &= wanted
+        self.prefetcher.retain(wanted)
+
+        top = self.verticalScrollBar().value()
+        x = max(0, (self.viewport().width() - self._target_width) // 2) - self.horizontalScrollBar().value()
+        for page in range(first, last + 1):
+            image = self._image_for(page)  # 앞뒤 여유 페이지도 미리 렌더링 요청
+            rect = QRect(x, self._tops[page] - top, self._target_width, self._heights[page])
+            if not rect.intersects(event.rect()):
+                continue
+            if image is not None:
+                painter.drawImage(rect, image)  # 크기가 다르면 (확대/축소 직후) 늘려서 임시로 표시
+            else:
+                painter.fillRect(rect, PLACEHOLDER)
+                painter.setPen(QColor("#aaaaaa"))
+                painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, str(page + 1))
+
+    def scrollContentsBy(self, dx, dy):
+        self.viewport().update()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._update_scrollbars()
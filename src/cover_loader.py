@@ -0,0 +1,96 @@
+import os
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+from PyQt6.QtGui import QIcon, QImage, QPixmap, QColor, QGuiApplication
+from render_cache import RenderCache
+
+
+class _CoverSignals(QObject):
+    # 작업 스레드에서 GUI 스레드로 결과 전달 (cover 경로, 이미지 / 실패 시 null 이미지)
+    loaded = pyqtSignal(str, QImage)
+
+
+class _CoverJob(QRunnable):
+    def __init__(self, cover_path, signals, scale=1):
+        super().__init__()
+        self.cover_path = cover_path
+        self.signals = signals
+        self.scale = scale
+
+    def run(self):
+        # QImage 디코딩은 GUI 스레드 밖에서도 안전함 (QPixmap/QIcon은 GUI 스레드에서 만듦)
+        image = QImage()
+        if self.scale > 1:
+            # 고해상도 화면이면 2배 표지(cover@2x.jpg)가 있을 때 그것을 사용
+            base, ext = os.path.splitext(self.cover_path)
+            image = QImage(f"{base}@{self.scale}x{ext}")
+            if not image.isNull():
+                image.setDevicePixelRatio(self.scale)
+        if image.isNull():
+            image = QImage(self.cover_path)
+        self.signals.loaded.emit(self.cover_path, image)
+
+
+class CoverLoader(QObject):
+    """표지 이미지를 백그라운드에서 읽고, 디코딩된 아이콘을 메모리 LRU 캐시에 보관
+
+    icon()은 캐시에 없으면 자리표시 아이콘을 돌려주고 읽기를 예약합니다.
+    다 읽히면 cover_ready 시그널로 알려주므로 화면에 보이는 항목만 다시 그리면 됩니다.
+    """
+
+    cover_ready = pyqtSignal(str)
+
+    def __init__(self, parent=None, max_bytes=64 * 1024 * 1024, max_items=4000, icon_size=(120, 160)):
+        super().__init__(parent)
+        self.cache = RenderCache(max_bytes=max_bytes, max_items=max_items, name="cover_cache")
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(2)
+        self.icon_size = icon_size
+        self._signals = _CoverSignals()
+        self._signals.loaded.connect(self._on_loaded)
+        self._pending = set()
+        self._failed = set()
+        self._placeholder = None
+
+    def placeholder(self):
+        if self._placeholder is None:
+            pixmap = QPixmap(*self.icon_size)
+            pixmap.fill(QColor("#555555"))
+            self._placeholder = QIcon(pixmap)
+        return self._placeholder
+
+    def icon(self, cover_path):
+        """캐시된 표지 아이콘 (없으면 자리표시 아이콘을 주고 백그라운드 읽기 예약)"""
+        if not cover_path or cover_path in self._failed:
+            return self.placeholder()
+        icon = self.cache.get((cover_path,))
+        if icon is not None:
+            return icon
+        if cover_path not in self._pending:
+            self._pending.add(cover_path)
+            self.pool.start(_CoverJob(cover_path, self._signals, self._screen_scale()))
+        return self.placeholder()
+
+    def _screen_scale(self):
+        screen = QGuiApplication.primaryScreen()
+        return 2 if screen and screen.devicePixelRatio() > 1 else 1
+
+    def invalidate(self, cover_path=None):
+        """표지 파일이 바뀌었을 때 캐시 비우기 (None이면 전부)"""
+        self.cache.invalidate(cover_path)
+        if cover_path:
+            self._failed.discard(cover_path)
+        else:
+            self._failed.clear()
+
+    def _on_loaded(self, cover_path, image):
+        self._pending.discard(cover_path)
+        if image.isNull():
+            self._failed.add(cover_path)  # 없는 파일은 다시 읽지 않음
+        else:
+            pixmap = QPixmap.fromImage(image)
+            self.cache.put((cover_path,), QIcon(pixmap), image.sizeInBytes())
+        self.cover_ready.emit(cover_path)
+
+    def shutdown(self):
+        self.pool.clear()
+        self.pool.waitForDone(1000)
@@ -0,0 +1,109 @@
+import hashlib
+import os
+
+# 이 모듈은 등록 작업 프로세스에서도 쓰이므로 Qt를 import 하지 않습니다.
+# PyMuPDF는 표지를 만들 때만 필요하므로 write_covers 안에서 불러옵니다 (서재 화면 시작을 빠르게).
+
+# 표지 너비 (1배: 목록 아이콘, 2배: 고해상도 화면)
+COVER_WIDTH = 120
+COVER_SCALES = (1, 2)
+JPEG_QUALITY = 80
+HASH_CHUNK = 1024 * 1024
+FINGERPRINT_BLOCK = 64 * 1024
+
+
+def content_hash(path):
+    """PDF 파일 내용의 해시 (같은 내용이면 파일명/위치가 달라도 같은 값)"""
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def quick_fingerprint(path):
+    """파일 크기 + 앞/뒤 64KB만 읽은 해시 ('크기:해시') - 옮겨진 파일을 찾을 때 파일 전체를 읽지 않기 위한 가벼운 지문"""
+    size = os.path.getsize(path)
+    h = hashlib.blake2b(digest_size=12)
+    with open(path, 'rb') as f:
+        h.update(f.read(FINGERPRINT_BLOCK))
+        if size > FINGERPRINT_BLOCK:
+            f.seek(max(FINGERPRINT_BLOCK, size - FINGERPRINT_BLOCK))
+            h.update(f.read(FINGERPRINT_BLOCK))
+    return f"{size}:{h.hexdigest()}"
+
+
+def fingerprint_size(fingerprint):
+    return int(fingerprint.split(":", 1)[0])
+
+
+def cover_path(cover_dir, digest, scale=1):
+    suffix = "" if scale == 1 else f"@{scale}x"
+    return os.path.join(cover_dir, f"{digest}{suffix}.jpg")
+
+
+def has_covers(cover_dir, digest):
+    return all(os.path.exists(cover_path(cover_dir, digest, s)) for s in COVER_SCALES)
+
+
+def write_covers(doc, cover_dir, digest):
+    """첫 페이지를 한 번만 렌더링해서 배율별 JPEG 표지를 저장 (이미 있으면 건너뜀)
+
+    Returns:
+        str: 1배 표지 경로 (페이지가 없으면 None)
+    """
+    if has_covers(cover_dir, digest):
+        return cover_path(cover_dir, digest)
+    if len(doc) == 0:
+        return None
+    import fitz  # PyMuPDF
+    page = doc.load_page(0)
+    max_width = COVER_WIDTH * max(COVER_SCALES)
+    zoom = max_width / page.rect.width
+    pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False, colorspace=fitz.csRGB)
+    for scale in sorted(COVER_SCALES, reverse=True):
+        width = COVER_WIDTH * scale
+        scaled = pix if pix.width == width else fitz.Pixmap(pix, width, round(pix.height * width / pix.width), None)
+        target = cover_path(cover_dir, digest, scale)
+        tmp = target + ".tmp.jpg"
+        scaled.save(tmp, jpg_quality=JPEG_QUALITY)
+        os.replace(tmp, target)  # 병렬 등록 중 같은 파일이 겹쳐도 반쯤 쓴 파일이 보이지 않게
+    return cover_path(cover_dir, digest)
+
+
+def remove_covers(cover_dir, digest):
+    for scale in COVER_SCALES:
+        try:
+            os.remove(cover_path(cover_dir, digest, scale))
+        except OSError:
+            pass
+
+
+def collect_orphan_covers(cover_dir, referenced_files):
+    """어떤 책도 쓰지 않는 표지 파일 삭제 (이전 방식의 *_thumb.png 포함)
+
+    Args:
+        referenced_files: 아직 쓰이는 1배 표지 경로 모음
+
+    Returns:
+        int: 지운 파일 수
+    """
+    keep = set()
+    for path in referenced_files:
+        if not path:
+            continue
+        keep.add(os.path.basename(path))
+        base, ext = os.path.splitext(os.path.basename(path))
+        for scale in COVER_SCALES:
+            if scale != 1:
+                keep.add(f"{base}@{scale}x{ext}")
+    removed = 0
+    for name in os.listdir(cover_dir):
+        if name in keep or name.endswith(".tmp.jpg"):
+            continue
+        try:
+            os.remove(os.path.join(cover_dir, name))
+            removed += 1
+        except OSError:
+            pass
+    return removed
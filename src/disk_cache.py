@@ -0,0 +1,134 @@
+import os
+import threading
+from collections import OrderedDict
+from config import get_data_directory
+from perf import perf
+
+# 이 모듈은 Qt를 import 하지 않습니다 (이미지 파일은 호출한 쪽이 write 함수로 씀).
+
+
+class DiskPageCache:
+    """렌더링된 페이지를 데이터 폴더에 이미지 파일로 보관하는 LRU 캐시 (프로그램을 다시 켜도 남음)
+
+    키는 (파일 지문, 페이지 번호, 목표 너비)이고, 야간 모드를 입히지 않은 원본을 저장합니다.
+    파일 지문(cover_store.quick_fingerprint)을 쓰므로 책을 옮기거나 이름을 바꿔도 그대로 쓰이고, 내용이 바뀐 파일의 예전 페이지는 다시 쓰이지 않고 밀려납니다.
+    사용 순서는 파일 수정 시각으로 기록하므로 (꺼낼 때 시각을 갱신) 용량을 넘으면 가장 오래 안 쓴 파일부터 지웁니다.
+    작업 스레드에서도 호출할 수 있습니다.
+    """
+
+    EXTENSION = ".png"
+
+    def __init__(self, folder=None, max_bytes=512 * 1024 * 1024):
+        self.folder = folder or os.path.join(get_data_directory(), "page_cache")
+        self.max_bytes = max_bytes
+        self._items = None  # 파일 이름 -> 크기 (오래 안 쓴 것부터), 처음 쓸 때 폴더를 읽음
+        self._lock = threading.Lock()
+        self.current_bytes = 0
+
+    @classmethod
+    def file_name(cls, key):
+        fingerprint, page_num, target_width = key
+        # 지문은 '크기:해시' 형식 - Windows 파일 이름에 쓸 수 없는 ':'는 '_'로
+        return f"{fingerprint.replace(':', '_')}_{page_num}_{target_width}{cls.EXTENSION}"
+
+    def _load(self):
+        # 잠금 안에서 호출
+        if self._items is not None:
+            return
+        entries = []
+        os.makedirs(self.folder, exist_ok=True)
+        with os.scandir(self.folder) as it:
+            for entry in it:
+                if not entry.name.endswith(self.EXTENSION):
+                    continue
+                if ".tmp" in entry.name:
+                    try: os.remove(entry.path)  # 쓰다가 끝나지 못한 파일
+                    except OSError: pass
+                    continue
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                entries.append((st.st_mtime_ns, entry.name, st.st_size))
+        entries.sort()
+        self._items = OrderedDict((name, size) for _, name, size in entries)
+        self.current_bytes = sum(self._items.values())
+        self._evict()
+
+    def get(self, key):
+        """캐시된 이미지 파일 경로 (없으면 None) - 꺼낼 때 최근 사용으로 표시"""
+        name = self.file_name(key)
+        with self._lock:
+            self._load()
+            if name not in self._items:
+                perf.count("disk_cache.miss")
+                return None
+            self._items.move_to_end(name)
+        path = os.path.join(self.folder, name)
+        try:
+            os.utime(path)
+        except OSError:
+            # 그 사이 지워진 파일
+            with self._lock:
+                self.current_bytes -= self._items.pop(name, 0)
+            perf.count("disk_cache.miss")
+            return None
+        perf.count("disk_cache.hit")
+        return path
+
+    def __contains__(self, key):
+        with self._lock:
+            self._load()
+            return self.file_name(key) in self._items
+
+    def put(self, key, write):
+        """write(임시 파일 경로)로 이미지를 쓰게 한 뒤 캐시에 넣음 (쓰다가 실패하면 False)"""
+        name = self.file_name(key)
+        target = os.path.join(self.folder, name)
+        tmp = target[:-len(self.EXTENSION)] + ".tmp" + self.EXTENSION
+        with self._lock:
+            self._load()
+        try:
+            if write(tmp) is False or not os.path.exists(tmp):
+                return False
+            size = os.path.getsize(tmp)
+            if size > self.max_bytes:
+                os.remove(tmp)
+                return False
+            os.replace(tmp, target)  # 반쯤 쓴 파일이 보이지 않게
+        except OSError as e:
+            print(f"페이지 캐시 저장 오류: {e}")
+            try: os.remove(tmp)
+            except OSError: pass
+            return False
+        with self._lock:
+            self.current_bytes += size - self._items.pop(name, 0)
+            self._items[name] = size
+            self._evict()
+        perf.count("disk_cache.write")
+        return True
+
+    def _evict(self):
+        # 잠금 안에서 호출
+        while self._items and self.current_bytes > self.max_bytes:
+            name, size = self._items.popitem(last=False)
+            self.current_bytes -= size
+            try:
+                os.remove(os.path.join(self.folder, name))
+            except OSError:
+                pass
+            perf.count("disk_cache.eviction")
+
+    def clear(self):
+        with self._lock:
+            self._load()
+            for name in self._items:
+                try: os.remove(os.path.join(self.folder, name))
+                except OSError: pass
+            self._items.clear()
+            self.current_bytes = 0
+
+    def stats(self):
+        with self._lock:
+            self._load()
+            return {'items': len(self._items), 'bytes': self.current_bytes, 'max_bytes': self.max_bytes}
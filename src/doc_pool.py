@@ -0,0 +1,58 @@
+import os
+from collections import OrderedDict
+
+import fitz  # PyMuPDF
+from perf import perf
+
+# 이 모듈은 Qt를 import 하지 않습니다.
+
+
+class DocumentPool:
+    """최근에 연 PDF 문서 핸들을 몇 개까지 열어둔 채로 재사용하는 LRU 풀
+
+    키는 (경로, 수정 시각)이라서 파일이 바뀌면 예전 핸들은 닫고 새로 엽니다.
+    서재에 갔다가 최근 책을 다시 열 때 xref를 처음부터 다시 읽지 않아도 됩니다.
+    풀에서 밀려난 문서는 바로 close() 합니다.
+    """
+
+    def __init__(self, max_docs=4):
+        self.max_docs = max_docs
+        self._docs = OrderedDict()  # (path, mtime_ns) -> fitz.Document
+        self.hits = 0
+        self.misses = 0
+
+    def acquire(self, path):
+        """문서 핸들 반환
+
+        Returns:
+            tuple: (doc, fresh) - fresh는 디스크에서 새로 열었으면 True
+        """
+        key = (path, os.stat(path).st_mtime_ns)
+        doc = self._docs.get(key)
+        if doc is not None and not doc.is_closed:
+            self._docs.move_to_end(key)
+            self.hits += 1
+            perf.count("doc_pool.hit")
+            return doc, False
+
+        self.misses += 1
+        perf.count("doc_pool.miss")
+        self._discard_path(path)  # 같은 파일의 예전 버전 (수정됨)
+        doc = fitz.open(path)
+        self._docs[key] = doc
+        while len(self._docs) > self.max_docs:
+            _, old = self._docs.popitem(last=False)
+            old.close()
+        return doc, True
+
+    def _discard_path(self, path):
+        for key in [k for k in self._docs if k[0] == path]:
+            self._docs.pop(key).close()
+
+    def close_all(self):
+        for doc in self._docs.values():
+            doc.close()
+        self._docs.clear()
+
+    def __len__(self):
+        return len(self._docs)
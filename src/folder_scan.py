@@ -0,0 +1,77 @@
+import os
+
+# 이 모듈은 작업 스레드에서도 쓰이므로 Qt를 import 하지 않습니다.
+# PDF를 열지 않고 디렉터리 항목의 크기/수정 시각만 비교하므로 변경이 없는 큰 폴더도 몇 초면 검사가 끝납니다.
+
+
+def path_key(path):
+    """경로 비교용 키 (Windows에서 / 와 \\, 대소문자 차이를 무시)"""
+    return os.path.normcase(os.path.normpath(path))
+
+
+def is_under(path, root):
+    root_key = path_key(root)
+    key = path_key(path)
+    return key == root_key or key.startswith(root_key.rstrip(os.sep) + os.sep)
+
+
+def scan_pdfs(root, recursive=True):
+    """root 아래(recursive면 하위 폴더 포함)의 PDF 목록
+
+    Returns:
+        tuple: ({경로: (크기, 수정 시각 ns)}, [하위 폴더 경로, ...]) - 폴더 목록에는 root도 포함
+    """
+    files = {}
+    dirs = [root]
+    stack = [root]
+    while stack:
+        folder = stack.pop()
+        try:
+            entries = os.scandir(folder)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not recursive:
+                            continue
+                        stack.append(entry.path)
+                        dirs.append(entry.path)
+                    elif entry.name.lower().endswith(".pdf") and entry.is_file():
+                        st = entry.stat()
+                        files[os.path.normpath(entry.path)] = (st.st_size, st.st_mtime_ns)
+                except OSError:
+                    continue  # 검사 도중 지워진 파일 등
+    return files, dirs
+
+
+def diff_folder(files, books):
+    """검사 결과(files)와 그 폴더 아래에 등록된 책(books)을 비교
+
+    Returns:
+        dict: {
+            'new': [새 PDF 경로],
+            'changed': [크기나 수정 시각이 바뀐 책 경로],
+            'missing': [파일이 없어진 책 경로],
+            'restored': [없어졌다가 그대로 다시 나타난 책 경로],
+            'backfill': [(책 경로, 크기, 수정 시각)] - 이전 버전에서 등록해 비교 값이 없는 책,
+            'unchanged': 바뀌지 않은 책 수,
+        }
+    """
+    result = {'new': [], 'changed': [], 'missing': [], 'restored': [], 'backfill': [], 'unchanged': 0}
+    by_key = {path_key(b['path']): b for b in books}
+    for path, (size, mtime) in files.items():
+        book = by_key.pop(path_key(path), None)
+        if book is None:
+            result['new'].append(path)
+        elif book.get('file_size') is None or book.get('file_mtime') is None:
+            result['backfill'].append((book['path'], size, mtime))
+        elif (book['file_size'], book['file_mtime']) != (size, mtime):
+            result['changed'].append(book['path'])
+        elif book.get('missing'):
+            result['restored'].append(book['path'])
+        else:
+            result['unchanged'] += 1
+    result['missing'] = [b['path'] for b in by_key.values() if not b.get('missing')]
+    return result
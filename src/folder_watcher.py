@@ -0,0 +1,102 @@
+from concurrent.futures import ThreadPoolExecutor
+from PyQt6.QtCore import QObject, QTimer, QFileSystemWatcher, pyqtSignal
+from folder_scan import scan_pdfs, is_under
+from relink import plan_integrity
+
+
+class LibraryFolderWatcher(QObject):
+    """연결한 서재 폴더를 지켜보다가 바뀌면 작업 스레드에서 다시 검사
+
+    검사(디렉터리 목록 읽기)만 작업 스레드에서 하고, 결과는 folder_scanned 시그널로 GUI 스레드에 넘깁니다.
+    도서 목록(SQLite)은 GUI 스레드에서만 고치므로 받는 쪽에서 LibraryManager.sync_folder()를 호출하면 됩니다.
+    파일을 복사하는 동안 알림이 연달아 오므로 잠깐 모았다가 폴더마다 한 번만 검사합니다.
+    """
+
+    folder_scanned = pyqtSignal(str, object)  # (폴더 경로, scan_pdfs 결과)
+    integrity_checked = pyqtSignal(object)  # relink.plan_integrity 결과
+    _scan_done = pyqtSignal(str, object)  # 작업 스레드 -> GUI 스레드 (결과 또는 예외)
+    DEBOUNCE_MS = 1500
+    MAX_WATCHED_DIRS = 4000  # 운영체제의 감시 개수 제한을 넘지 않도록 (넘으면 위쪽 폴더만 감시)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.roots = []
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.directoryChanged.connect(self._on_directory_changed)
+        self._changed_roots = set()
+        self._scanning = set()
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(self.DEBOUNCE_MS)
+        self._timer.timeout.connect(self._rescan_changed)
+        self._scan_done.connect(self._on_scan_done)
+
+    def set_roots(self, roots):
+        self.roots = list(roots)
+        if self._watcher.directories():
+            self._watcher.removePaths(self._watcher.directories())
+        if self.roots:
+            self._watcher.addPaths(self.roots)
+
+    def rescan(self, root=None):
+        """root(없으면 연결한 폴더 전체)를 백그라운드에서 검사"""
+        for r in ([root] if root else self.roots):
+            if r in self._scanning:
+                self._changed_roots.add(r)  # 검사 중에 또 바뀌면 끝난 뒤 한 번 더
+                continue
+            self._scanning.add(r)
+            future = self._executor.submit(scan_pdfs, r)
+            future.add_done_callback(lambda f, r=r: self._emit_scan(r, f))
+
+    def check_integrity(self, books, roots):
+        """파일이 없어진 책을 찾아 옮겨간 곳을 백그라운드에서 찾음 (books: LibraryManager.integrity_snapshot())"""
+        future = self._executor.submit(plan_integrity, books, list(roots))
+        future.add_done_callback(self._emit_integrity)
+
+    def _emit_integrity(self, future):
+        # 작업 스레드에서 호출됨
+        if future.cancelled():
+            return
+        if future.exception() is not None:
+            print(f"책 파일 점검 오류: {future.exception()}")
+            return
+        self.integrity_checked.emit(future.result())
+
+    def _emit_scan(self, root, future):
+        # 작업 스레드에서 호출됨 - 시그널은 GUI 스레드로 전달됨
+        if not future.cancelled():
+            self._scan_done.emit(root, future.exception() or future.result())
+
+    def _on_directory_changed(self, path):
+        for root in self.roots:
+            if is_under(path, root):
+                self._changed_roots.add(root)
+        self._timer.start()
+
+    def _rescan_changed(self):
+        roots, self._changed_roots = self._changed_roots, set()
+        for root in roots:
+            self.rescan(root)
+
+    def _on_scan_done(self, root, scan):
+        self._scanning.discard(root)
+        if isinstance(scan, Exception):
+            print(f"폴더 검사 오류 ({root}): {scan}")
+            return
+        if root not in self.roots:
+            return  # 그 사이 연결을 끊음
+        # 새로 생긴 하위 폴더도 감시 (이미 감시 중인 폴더는 Qt가 무시)
+        _, dirs = scan
+        watched = set(self._watcher.directories())
+        room = self.MAX_WATCHED_DIRS - len(watched)
+        new_dirs = [d for d in dirs if d not in watched][:max(0, room)]
+        if new_dirs:
+            self._watcher.addPaths(new_dirs)
+        self.folder_scanned.emit(root, scan)
+        if root in self._changed_roots:
+            self._timer.start()
+
+    def shutdown(self):
+        self._timer.stop()
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,109 @@
+import os
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+import fitz  # PyMuPDF
+from cover_store import content_hash, quick_fingerprint, write_covers, remove_covers
+
+# 이 모듈은 작업 프로세스에서도 import 되므로 Qt를 import 하지 않습니다.
+
+PARALLEL_MIN_FILES = 4  # 이보다 적으면 프로세스를 띄우는 비용이 더 큼
+
+
+def probe_pdf(path, cover_dir, extract_text=False):
+    """PDF를 한 번만 열어서 페이지 수와 표지(필요하면 본문 텍스트까지)를 함께 처리
+
+    표지는 파일 내용 해시로 저장하므로 같은 내용의 PDF는 표지를 한 벌만 만듭니다.
+
+    Returns:
+        dict: {'path', 'total_pages', 'content_hash', 'cover', 'pages_text', 'file_size', 'file_mtime',
+               'fingerprint', 'error'}
+    """
+    result = {'path': path, 'total_pages': 0, 'content_hash': None, 'cover': None,
+              'pages_text': None, 'file_size': None, 'file_mtime': None, 'fingerprint': None, 'error': None}
+    try:
+        st = os.stat(path)  # 폴더를 다시 검사할 때 바뀐 파일인지 비교하는 값
+        result['file_size'], result['file_mtime'] = st.st_size, st.st_mtime_ns
+        doc = fitz.open(path)
+        try:
+            result['total_pages'] = len(doc)
+            result['content_hash'] = content_hash(path)
+            result['fingerprint'] = quick_fingerprint(path)
+            result['cover'] = write_covers(doc, cover_dir, result['content_hash'])
+            if extract_text:
+                # 본문 검색 색인용 (공백은 한 칸으로 정리)
+                result['pages_text'] = [" ".join(page.get_text("text").split()) for page in doc]
+        finally:
+            doc.close()
+    except Exception as e:
+        result['error'] = str(e)
+    return result
+
+
+def regenerate_cover(job, cover_dir, force=False):
+    """(작업 프로세스) 표지만 다시 만듦
+
+    job은 (PDF 경로, 내용 해시 또는 None) - 해시를 알면 파일 전체를 다시 읽지 않습니다.
+    force면 이미 있는 표지도 지우고 새로 렌더링합니다 (표지 크기/화질 설정을 바꾼 뒤 등).
+
+    Returns:
+        dict: {'path', 'content_hash', 'cover', 'error'}
+    """
+    path, digest = job
+    result = {'path': path, 'content_hash': digest, 'cover': None, 'error': None}
+    try:
+        if not result['content_hash']:
+            result['content_hash'] = content_hash(path)
+        if force:
+            remove_covers(cover_dir, result['content_hash'])
+        doc = fitz.open(path)
+        try:
+            result['cover'] = write_covers(doc, cover_dir, result['content_hash'])
+        finally:
+            doc.close()
+    except Exception as e:
+        result['error'] = str(e)
+    return result
+
+
+def process_pool(max_workers=None):
+    """작업 프로세스 풀 - 운영체제와 상관없이 spawn 방식으로 띄움
+
+    리눅스 기본값인 fork는 부모 프로세스의 다른 스레드(미리 읽기 등 MuPDF를 쓰는 중인 스레드)가 잡고 있던 락까지
+    그대로 복사하므로, 작업 프로세스에서 fitz를 부르다 멈출 수 있습니다.
+    """
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn"))
+
+
+def iter_probe_results(paths, cover_dir, extract_text=False, max_workers=None, poll_interval=0.1):
+    """PDF 경로 목록을 여러 프로세스로 나눠 probe_pdf로 처리하고, 끝나는 대로 결과를 내보냄"""
+    return iter_parallel(probe_pdf, paths, (cover_dir, extract_text), max_workers, poll_interval)
+
+
+def iter_parallel(func, items, args=(), max_workers=None, poll_interval=0.1):
+    """func(item, *args)를 여러 프로세스로 나눠 실행하고, 끝나는 대로 결과를 내보냄
+
+    결과가 없어도 poll_interval마다 None을 내보내서 호출한 쪽이 UI 이벤트와 취소 여부를 처리할 수 있게 합니다.
+    제너레이터를 중간에 닫으면(close) 아직 시작하지 않은 작업은 취소됩니다.
+    func는 작업 프로세스에서 불러올 수 있도록 모듈 최상위 함수여야 합니다.
+    """
+    if len(items) < PARALLEL_MIN_FILES or max_workers == 1:
+        for item in items:
+            yield func(item, *args)
+        return
+
+    if max_workers is None:
+        max_workers = min(len(items), os.cpu_count() or 1)
+    executor = process_pool(max_workers)
+    pending = ()
+    try:
+        pending = {executor.submit(func, item, *args) for item in items}
+        while pending:
+            done, pending = wait(pending, timeout=poll_interval, return_when=FIRST_COMPLETED)
+            if not done:
+                yield None
+            for future in done:
+                yield future.result()
+    finally:
+        # 다 끝났으면 작업 프로세스가 내려갈 때까지 기다림 (바로 종료하는 명령줄 도구에서 종료 오류 방지)
+        executor.shutdown(wait=not pending, cancel_futures=True)
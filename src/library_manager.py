@@ -1,74 +1,191 @@
-import json
 import os
-from pdf_engine import PDFEngine
+import datetime
+import heapq
+import time
 from config import get_data_directory
+from catalog_store import CatalogStore, migrate_json_catalog, write_json_atomic
+from text_index import TextIndex
+from cover_store import remove_covers, collect_orphan_covers, fingerprint_size
+from folder_scan import scan_pdfs, diff_folder, is_under
+from relink import match_moved_files, plan_integrity
+from perf import perf
+
+# [NEW] 도서 목록 변경 알림 종류 - subscribe()로 등록한 함수가 (종류, 내용 dict)로 호출됨
+CATALOG_RELOADED = "catalog_reloaded"      # {} - 목록 전체를 다시 읽음
+BOOKS_ADDED = "books_added"                # {'books': [책, ...]}
+BOOK_UPDATED = "book_updated"              # {'book': 책, 'fields': (바뀐 필드, ...), 'old_path': 이전 경로 또는 None}
+BOOKS_REMOVED = "books_removed"            # {'paths': [경로, ...]}
+CATEGORIES_CHANGED = "categories_changed"  # {'categories': [이름, ...]}
 
 class LibraryManager:
-    def __init__(self, filename="books.json"):
+    """도서 목록 서비스 - 프로그램 안에서 하나만 만들어 서재 화면과 독서 화면이 함께 사용
+
+    목록은 이 객체가 메모리에 들고 있고, 바뀔 때마다 구독자에게 바뀐 책/분류만 알려줍니다.
+    화면은 알림을 받아 해당 행만 고치면 되므로 목록 전체를 다시 읽거나 다시 만들 필요가 없습니다.
+    Qt를 쓰지 않으므로 알림은 변경을 부른 스레드에서 바로 호출됩니다.
+    """
+    def __init__(self, filename="books.json", load=True):
         # 데이터 디렉토리 경로 가져오기
         self.data_dir = get_data_directory()
         self.filename = os.path.join(self.data_dir, filename)
+        # [NEW] 도서 목록은 SQLite에 저장 (books.json은 최초 1회 자동 이전 후 백업으로 남김)
+        self.db_path = os.path.splitext(self.filename)[0] + ".db"
+        self.store = CatalogStore(self.db_path)
+        # [NEW] 본문 전체 검색 색인
+        self.text_index = TextIndex(os.path.join(self.data_dir, "search_index.db"))
         
         self.data = {
             "categories": ["전체 보기"],
             "books": []
         }
+        # [NEW] 메모리 색인: 경로 -> 책, 카테고리 -> {경로: 책}, 즐겨찾기 {경로: 책}
+        self._by_path = {}
+        self._by_category = {}
+        self._favorites = {}
+        self._cover_refs = {}  # 표지 경로 -> 그 표지를 쓰는 책 수 (같은 내용의 PDF는 표지 공유)
+        # [NEW] 아직 저장소에 기록하지 않은 변경 {경로: {필드: 값}} (flush() 때 한 번에 기록)
+        self._dirty = {}
+        self.max_pending_writes = 500
+        self._listeners = []
         
         # covers 폴더도 데이터 디렉토리 안에 생성
         self.cover_dir = os.path.join(self.data_dir, "covers")
         if not os.path.exists(self.cover_dir):
             os.makedirs(self.cover_dir)
             
-        self.load_data()
+        # load=False면 목록은 나중에 load_data()로 읽음 (프로그램은 빈 화면을 먼저 그린 뒤 읽음)
+        if load:
+            self.load_data()
 
     def load_data(self):
+        self.flush() # 다시 읽기 전에 밀린 변경부터 기록
+        # 기존 books.json이 있으면 (데이터 위치 이전 직후 포함) 저장소로 옮김
         if os.path.exists(self.filename):
-            try:
-                with open(self.filename, 'r', encoding='utf-8') as f:
-                    loaded_data = json.load(f)
-                    if isinstance(loaded_data, list):
-                        self.data["books"] = loaded_data
-                    else:
-                        self.data = loaded_data
-            except:
-                pass
+            migrate_json_catalog(self.filename, self.store)
+        try:
+            with perf.stage("catalog.load"):
+                self.data = self.store.load()
+        except Exception as e:
+            print(f"도서 목록 로드 오류: {e}")
         
         if "전체 보기" not in self.data["categories"]:
             self.data["categories"].insert(0, "전체 보기")
+            self.store.add_category("전체 보기", position=-1)
+        self._rebuild_index()
+        self._notify(CATALOG_RELOADED)
 
-    def save_data(self):
-        with open(self.filename, 'w', encoding='utf-8') as f:
-            json.dump(self.data, f, ensure_ascii=False, indent=4)
+    def subscribe(self, listener):
+        """변경 알림 받기 - listener(종류, 내용 dict)"""
+        if listener not in self._listeners:
+            self._listeners.append(listener)
 
-    def update_last_page(self, path, page_num):
-        self.load_data() # [FIX] 항상 최신 데이터를 불러와서 업데이트 (새로 추가된 책 인식 문제 해결)
-        import datetime
+    def _notify(self, event, **info):
+        for listener in list(self._listeners):
+            try:
+                listener(event, info)
+            except Exception as e:
+                print(f"도서 목록 알림 처리 오류 ({event}): {e}")
+
+    def _rebuild_index(self):
+        self._by_path = {}
+        self._by_category = {}
+        self._favorites = {}
+        self._cover_refs = {}
         for book in self.data["books"]:
-            if book['path'] == path:
-                book['last_page'] = page_num
-                book['last_read'] = datetime.datetime.now().isoformat()
-                self.save_data()
-                return True
-        return False
+            self._index_add(book)
+
+    def _index_add(self, book):
+        path = book['path']
+        self._by_path[path] = book
+        self._by_category.setdefault(book.get('category'), {})[path] = book
+        if book.get('favorite'):
+            self._favorites[path] = book
+        cover = book.get('cover')
+        if cover:
+            self._cover_refs[cover] = self._cover_refs.get(cover, 0) + 1
+
+    def _index_remove(self, book):
+        path = book['path']
+        self._by_path.pop(path, None)
+        category_books = self._by_category.get(book.get('category'))
+        if category_books is not None:
+            category_books.pop(path, None)
+        self._favorites.pop(path, None)
+        cover = book.get('cover')
+        if cover and cover in self._cover_refs:
+            self._cover_refs[cover] -= 1
+            if self._cover_refs[cover] <= 0:
+                del self._cover_refs[cover]
+
+    def _mark_dirty(self, path, **fields):
+        self._dirty.setdefault(path, {}).update(fields)
+        if len(self._dirty) >= self.max_pending_writes:
+            self.flush()
+
+    def flush(self):
+        """밀린 변경(페이지 저장, 폴더 이동, 즐겨찾기)을 한 트랜잭션으로 기록
+
+        UI 타이머와 프로그램 종료 시 호출됩니다.
+        """
+        if not self._dirty:
+            return
+        changes, self._dirty = self._dirty, {}
+        perf.count("catalog.writes")
+        perf.count("catalog.rows_flushed", len(changes))
+        try:
+            with perf.stage("catalog.flush"):
+                self.store.update_books(changes)
+        except Exception as e:
+            # 기록하지 못한 변경은 다음 flush 때 다시 시도
+            for path, fields in changes.items():
+                self._dirty.setdefault(path, {}).update(fields)
+            print(f"도서 목록 저장 오류: {e}")
+
+    def export_json(self, path):
+        """현재 도서 목록을 books.json 형식으로 내보내기"""
+        self.flush()
+        write_json_atomic(path, self.store.load())
+
+    def get_book(self, path):
+        return self._by_path.get(path)
+
+    def update_last_page(self, path, page_num):
+        last_read = datetime.datetime.now().isoformat()
+        book = self.get_book(path)
+        if book is None:
+            # 다른 인스턴스가 추가한 책이면 저장소에서 바로 한 행만 갱신
+            perf.count("catalog.writes")
+            return self.store.update_book(path, last_page=page_num, last_read=last_read)
+        book['last_page'] = page_num
+        book['last_read'] = last_read
+        self._mark_dirty(path, last_page=page_num, last_read=last_read)
+        self._notify(BOOK_UPDATED, book=book, fields=('last_page', 'last_read'), old_path=None)
+        return True
 
     # [NEW] 파일 경로(주소) 업데이트 기능
     def update_book_path(self, old_path, new_path):
-        self.load_data()
-        for book in self.data["books"]:
-            if book['path'] == old_path:
-                book['path'] = new_path # 경로 갱신
-                
-                # 만약 파일명이 바뀌었을 수도 있으니 제목도 갱신할까요? (선택사항)
-                # book['title'] = os.path.basename(new_path)
-                
-                self.save_data()
-                return True
-        return False
+        self.flush() # 밀린 변경은 이전 경로 기준이므로 먼저 기록
+        perf.count("catalog.writes")
+        if not self.store.update_book(old_path, path=new_path):
+            return False
+        self.text_index.rename_document(old_path, new_path)
+        book = self.get_book(old_path)
+        if book:
+            self._index_remove(book)
+            book['path'] = new_path # 경로 갱신
+            self._index_add(book)
+            
+            # 만약 파일명이 바뀌었을 수도 있으니 제목도 갱신할까요? (선택사항)
+            # book['title'] = os.path.basename(new_path)
+            self._notify(BOOK_UPDATED, book=book, fields=('path',), old_path=old_path)
+        return True
 
     def add_category(self, name):
         if name not in self.data["categories"]:
             self.data["categories"].append(name)
-            self.save_data()
+            perf.count("catalog.writes")
+            self.store.add_category(name)
+            self._notify(CATEGORIES_CHANGED, categories=self.data["categories"])
             return True
         return False
 
@@ -76,102 +193,438 @@ class LibraryManager:
         if name == "전체 보기": return False
         
         if name in self.data["categories"]:
+            # [FIX] 저장소는 DB에 기록된 분류로 책을 지우므로, 밀린 분류 이동부터 기록해야 메모리와 어긋나지 않음
+            self.flush()
             self.data["categories"].remove(name)
-            for i in range(len(self.data["books"]) - 1, -1, -1):
-                if self.data["books"][i].get('category') == name:
-                    self.delete_book(i)
-            self.save_data()
+            removed = self._by_category.pop(name, {})
+            for book in removed.values():
+                self._index_remove(book)
+                self._remove_cover(book)
+                self._dirty.pop(book['path'], None)
+                self.text_index.remove_document(book['path'])
+            if removed:
+                self.data["books"] = [b for b in self.data["books"] if b['path'] not in removed]
+            perf.count("catalog.writes")
+            self.store.delete_category(name)
+            self.collect_orphan_covers()
+            if removed:
+                self._notify(BOOKS_REMOVED, paths=list(removed))
+            self._notify(CATEGORIES_CHANGED, categories=self.data["categories"])
             return True
         return False
 
     def get_categories(self):
         return self.data["categories"]
 
-    def add_books(self, paths, category="전체 보기", progress_callback=None):
+    def add_books(self, paths, category="전체 보기", progress_callback=None, max_workers=None):
         count = 0
-        temp_engine = PDFEngine()
         total_files = len(paths)
         
-        for i, path in enumerate(paths):
-            if progress_callback:
-                if not progress_callback(i + 1, total_files, path):
-                    break
-
-            if any(b['path'] == path for b in self.data["books"]):
+        # 이미 등록된 책(및 중복 선택)은 작업 목록에서 제외
+        seen = set()
+        jobs = []
+        for path in paths:
+            if path in self._by_path or path in seen:
                 continue
+            seen.add(path)
+            jobs.append(path)
+        skipped = total_files - len(jobs)
 
-            title = os.path.basename(path)
-            thumb_name = f"{title}_thumb.png"
-            thumb_path = os.path.join(self.cover_dir, thumb_name)
-            
-            # [최적화] 썸네일이 이미 존재하면 재생성하지 않음
-            if not os.path.exists(thumb_path):
-                temp_engine.create_thumbnail(path, thumb_path)
-            
-            temp_engine.open(path)
-            total_pages = temp_engine.get_total_pages()
-            temp_engine.close()
-            
-            book_info = {
-                'path': path,
-                'title': title,
-                'cover': thumb_path,
-                'category': category,
-                'last_page': 0,
-                'total_pages': total_pages,
-                'last_read': None,
-                'favorite': False
-            }
-            self.data["books"].append(book_info)
-            count += 1
+        # [최적화] 파일마다 한 번만 열어서(페이지 수 + 표지) 여러 프로세스에서 병렬 처리
+        # 표지는 파일 내용 해시로 저장 (같은 이름의 다른 파일과 섞이지 않고, 같은 내용이면 공유)
+        from ingest import iter_probe_results # PyMuPDF는 책을 등록할 때 처음 불러옴 (프로그램 시작을 빠르게)
+        results = iter_probe_results(jobs, self.cover_dir, extract_text=True, max_workers=max_workers)
+        texts = []
+        try:
+            done = skipped
+            last_path = None
+            for result in results:
+                if result is not None:
+                    done += 1
+                    last_path = result['path']
+                if progress_callback:
+                    if not progress_callback(done, total_files, last_path):
+                        break
+                if result is None:
+                    continue
+                if result['error']:
+                    print(f"책 등록 오류 ({result['path']}): {result['error']}")
+                    continue
+
+                path = result['path']
+                book_info = {
+                    'path': path,
+                    'title': os.path.basename(path),
+                    'cover': result['cover'],
+                    'category': category,
+                    'last_page': 0,
+                    'total_pages': result['total_pages'],
+                    'last_read': None,
+                    'favorite': False,
+                    'content_hash': result['content_hash'],
+                    'file_size': result['file_size'],
+                    'file_mtime': result['file_mtime'],
+                    'missing': False,
+                    'fingerprint': result['fingerprint']
+                }
+                self.data["books"].append(book_info)
+                self._index_add(book_info)
+                if result['pages_text']:
+                    texts.append((path, result['pages_text']))
+                count += 1
+        finally:
+            results.close() # 취소 시 남은 작업 정리
             
-        self.save_data()
+        if count:
+            perf.count("catalog.writes")
+            self.store.insert_books(self.data["books"][-count:])
+        if texts:
+            self.text_index.add_documents(texts)
+        if count:
+            self._notify(BOOKS_ADDED, books=self.data["books"][-count:])
         return count
 
     def move_book(self, path, new_category):
-        self.load_data() 
+        book = self.get_book(path)
+        if book is None:
+            perf.count("catalog.writes")
+            return self.store.update_book(path, category=new_category)
+        self._index_remove(book)
+        book['category'] = new_category
+        self._index_add(book)
+        self._mark_dirty(path, category=new_category)
+        self._notify(BOOK_UPDATED, book=book, fields=('category',), old_path=None)
+        return True
+
+    # ---------- [NEW] 연결한 서재 폴더 (폴더마다 카테고리 하나, 자동 동기화) ----------
+    def get_library_folders(self):
+        """[(폴더 경로, 카테고리), ...]"""
+        return self.store.library_folders()
+
+    def add_library_folder(self, root, category):
+        self.add_category(category)
+        perf.count("catalog.writes")
+        self.store.add_library_folder(os.path.normpath(root), category)
+
+    def remove_library_folder(self, root):
+        """폴더 연결만 끊음 (이미 등록된 책은 그대로 둠)"""
+        perf.count("catalog.writes")
+        self.store.remove_library_folder(os.path.normpath(root))
+
+    def sync_folder(self, root, category, scan=None, progress_callback=None):
+        """연결한 폴더를 도서 목록과 맞춤 - 새 PDF는 등록, 바뀐 PDF는 다시 읽고, 없어진 책은 표시만 함
+
+        크기와 수정 시각으로만 비교하므로 바뀌지 않은 파일은 열지 않습니다.
+        다른 곳에서 옮겨 온 책은 지문으로 알아보고 새로 등록하지 않고 다시 연결합니다.
+        scan에 scan_pdfs(root)의 결과를 넘기면 (작업 스레드에서 미리 검사한 경우) 다시 검사하지 않습니다.
+
+        Returns:
+            dict: {'added', 'updated', 'relinked', 'missing', 'restored', 'unchanged', 'scan_ms', 'total_ms'}
+        """
+        started = time.perf_counter()
+        with perf.stage("folder.scan"):
+            files, _ = scan if scan is not None else scan_pdfs(root)
+        scan_ms = (time.perf_counter() - started) * 1000
+        with perf.stage("folder.diff"):
+            plan = diff_folder(files, [b for b in self.data["books"] if is_under(b['path'], root)])
+
+        moved = {}
+        if plan['new']:
+            # 옮겨진 책: 없어진 책과 새 파일의 지문이 같으면 새로 등록하지 않고 경로만 바꿈 (읽던 페이지 등 유지)
+            gone = self._moved_candidates(plan['new'], files)
+            if gone:
+                moved = match_moved_files(gone, {p: files[p] for p in plan['new']})
+            for old_path, new_path in moved.items():
+                self.relink_book(old_path, new_path)
+            new_paths = set(moved.values())
+            plan['new'] = [p for p in plan['new'] if p not in new_paths]
+            plan['missing'] = [p for p in plan['missing'] if p not in moved]
+
+        for path, size, mtime in plan['backfill']:
+            # 이전 버전에서 등록한 책: 비교 값만 채움 (다시 읽지 않음)
+            book = self.get_book(path)
+            book['file_size'], book['file_mtime'] = size, mtime
+            self._mark_dirty(path, file_size=size, file_mtime=mtime)
+        for path in plan['missing']:
+            self._set_missing(path, True)
+        for path in plan['restored']:
+            self._set_missing(path, False)
+        updated = self.refresh_books(plan['changed'], progress_callback) if plan['changed'] else 0
+        added = self.add_books(plan['new'], category, progress_callback) if plan['new'] else 0
+        self.flush()
+        summary = {
+            'added': added,
+            'updated': updated,
+            'relinked': len(moved),
+            'missing': len(plan['missing']),
+            'restored': len(plan['restored']),
+            'unchanged': plan['unchanged'] + len(plan['backfill']),
+            'scan_ms': scan_ms,
+            'total_ms': (time.perf_counter() - started) * 1000,
+        }
+        return summary
+
+    def _moved_candidates(self, new_paths, files):
+        """새 파일과 크기가 같고(지문이 없는 책은 파일 이름이 같고) 파일이 없어진 책 - 옮겨졌을 수 있는 책"""
+        sizes = {files[p][0] for p in new_paths}
+        names = {os.path.basename(p).lower() for p in new_paths}
+        candidates = []
         for book in self.data["books"]:
-            if book['path'] == path:
-                book['category'] = new_category
-                self.save_data()
-                return True
-        return False
+            fingerprint = book.get('fingerprint')
+            if fingerprint:
+                possible = fingerprint_size(fingerprint) in sizes
+            else:
+                possible = os.path.basename(book['path']).lower() in names
+            if possible and (book.get('missing') or not os.path.exists(book['path'])):
+                candidates.append(book)
+        return candidates
+
+    # ---------- [NEW] 옮겨진 책 자동 재연결 ----------
+    def relink_book(self, old_path, new_path):
+        """옮겨진 파일로 책을 다시 연결 (경로, 파일 정보 갱신 후 '없어짐' 표시 해제)"""
+        if new_path in self._by_path or not self.update_book_path(old_path, new_path):
+            return False
+        book = self.get_book(new_path)
+        try:
+            st = os.stat(new_path)
+            book['file_size'], book['file_mtime'] = st.st_size, st.st_mtime_ns
+            self._mark_dirty(new_path, file_size=st.st_size, file_mtime=st.st_mtime_ns)
+        except OSError:
+            pass
+        self._set_missing(new_path, False)
+        return True
+
+    def integrity_snapshot(self):
+        """무결성 검사용 책 정보 복사본 (작업 스레드에 넘겨도 안전)"""
+        return [{k: b.get(k) for k in ('path', 'fingerprint', 'content_hash', 'missing')} for b in self.data["books"]]
+
+    def apply_integrity(self, plan):
+        """relink.plan_integrity() 결과를 도서 목록에 반영 (GUI 스레드에서 호출)"""
+        for path, fingerprint in plan['fingerprints'].items():
+            book = self.get_book(path)
+            if book is not None and not book.get('fingerprint'):
+                book['fingerprint'] = fingerprint
+                self._mark_dirty(path, fingerprint=fingerprint)
+        relinked = sum(1 for old_path, new_path in plan['relink'].items() if self.relink_book(old_path, new_path))
+        for path in plan['missing']:
+            if not os.path.exists(path): # 검사하는 동안 돌아왔을 수도 있음
+                self._set_missing(path, True)
+        for path in plan['found']:
+            self._set_missing(path, False)
+        self.flush()
+        return relinked
+
+    def check_integrity(self):
+        """없어진 책을 찾아 알려진 폴더에서 자동으로 다시 연결 (화면 없이 쓸 때, UI는 작업 스레드에서 plan_integrity 사용)"""
+        roots = [root for root, _ in self.get_library_folders()]
+        return self.apply_integrity(plan_integrity(self.integrity_snapshot(), roots))
+
+    def locate_moved_book(self, path):
+        """파일이 없는 책 한 권을 지문으로 찾아 다시 연결 - 새 경로(못 찾으면 None)"""
+        book = self.get_book(path)
+        if book is None:
+            return None
+        snapshot = [{k: book.get(k) for k in ('path', 'fingerprint', 'content_hash', 'missing')}]
+        roots = [root for root, _ in self.get_library_folders()]
+        plan = plan_integrity(snapshot, roots, known_paths=self._by_path.keys())
+        new_path = plan['relink'].get(path)
+        if new_path and self.relink_book(path, new_path):
+            self.flush()
+            return new_path
+        return None
+
+    def _set_missing(self, path, missing):
+        book = self.get_book(path)
+        if book is None or book.get('missing', False) == missing:
+            return
+        book['missing'] = missing
+        self._mark_dirty(path, missing=missing)
+        self._notify(BOOK_UPDATED, book=book, fields=('missing',), old_path=None)
+
+    def refresh_books(self, paths, progress_callback=None):
+        """내용이 바뀐 책을 다시 읽어 페이지 수/표지/본문 색인을 갱신 (읽던 페이지, 분류 등은 유지)
+
+        progress_callback은 add_books와 같음 (False를 돌려주면 남은 책은 그대로 두고 멈춤 - 다음 검사 때 다시 갱신)
+        """
+        from ingest import iter_probe_results
+        count = 0
+        done = 0
+        results = iter_probe_results(paths, self.cover_dir, extract_text=True)
+        try:
+            for result in results:
+                if result is not None:
+                    done += 1
+                if progress_callback and not progress_callback(done, len(paths), result and result['path']):
+                    break
+                if result is None:
+                    continue
+                book = self.get_book(result['path'])
+                if book is None:
+                    continue
+                if result['error']:
+                    print(f"책 갱신 오류 ({result['path']}): {result['error']}")
+                    continue
+                self._index_remove(book)
+                before = dict(book)
+                fields = {k: result[k] for k in ('cover', 'total_pages', 'content_hash', 'file_size', 'file_mtime',
+                                                 'fingerprint')}
+                fields['missing'] = False
+                if book.get('last_page', 0) >= fields['total_pages']:
+                    fields['last_page'] = 0
+                book.update(fields)
+                self._index_add(book)
+                if before.get('cover') != book.get('cover'):
+                    self._remove_cover(before) # 다른 책이 같은 표지를 쓰지 않을 때만 지워짐
+                self._mark_dirty(book['path'], **fields)
+                self.text_index.remove_document(book['path'])
+                if result['pages_text']:
+                    self.text_index.add_documents([(book['path'], result['pages_text'])])
+                self._notify(BOOK_UPDATED, book=book, fields=tuple(fields), old_path=None)
+                count += 1
+        finally:
+            results.close()
+        return count
+
+    def _remove_cover(self, book):
+        """다른 책이 같은 표지를 쓰지 않을 때만 표지 파일 삭제 (색인에서 뺀 뒤 호출)"""
+        cover = book.get('cover')
+        if not cover or cover in self._cover_refs:
+            return
+        if book.get('content_hash'):
+            remove_covers(self.cover_dir, book['content_hash'])
+        elif os.path.exists(cover):
+            try: os.remove(cover)
+            except: pass
+
+    def regenerate_covers(self, paths=None, force=False, progress_callback=None, max_workers=None):
+        """표지를 여러 프로세스에서 다시 만듦 (paths가 없으면 전체, force가 아니면 없는 표지만)
+
+        Returns:
+            int: 표지가 바뀐 책 수
+        """
+        from ingest import iter_parallel, regenerate_cover
+        books = [self._by_path[p] for p in paths if p in self._by_path] if paths is not None else list(self.data["books"])
+        jobs = [b['path'] for b in books if os.path.exists(b['path'])]
+        digests = {b['path']: b.get('content_hash') for b in books}
+        count = 0
+        done = len(books) - len(jobs)
+        results = iter_parallel(regenerate_cover, [(p, digests.get(p)) for p in jobs], (self.cover_dir, force),
+                                max_workers)
+        try:
+            for result in results:
+                if result is not None:
+                    done += 1
+                if progress_callback and not progress_callback(done, len(books), result and result['path']):
+                    break
+                if result is None:
+                    continue
+                if result['error']:
+                    print(f"표지 생성 오류 ({result['path']}): {result['error']}")
+                    continue
+                book = self.get_book(result['path'])
+                if book is None:
+                    continue
+                fields = {k: result[k] for k in ('cover', 'content_hash') if book.get(k) != result[k]}
+                if not fields and not force:
+                    continue
+                self._index_remove(book)
+                before = dict(book)
+                book.update(fields)
+                self._index_add(book)
+                if fields:
+                    if 'cover' in fields:
+                        self._remove_cover(before) # 다른 책이 같은 표지를 쓰지 않을 때만 지워짐
+                    self._mark_dirty(book['path'], **fields)
+                self._notify(BOOK_UPDATED, book=book, fields=tuple(fields) or ('cover',), old_path=None)
+                count += 1
+        finally:
+            results.close()
+        self.flush()
+        return count
+
+    def collect_orphan_covers(self):
+        """어느 책에도 연결되지 않은 표지 파일 정리 (이전 버전에서 남은 파일 포함)"""
+        self.flush()
+        return collect_orphan_covers(self.cover_dir, self.store.cover_paths())
 
     def delete_book(self, index):
         if 0 <= index < len(self.data["books"]):
             book = self.data["books"][index]
-            if 'cover' in book and os.path.exists(book['cover']):
-                try: os.remove(book['cover'])
-                except: pass
+            self._index_remove(book)
+            self._remove_cover(book)
             del self.data["books"][index]
-            self.save_data()
+            self._dirty.pop(book['path'], None)
+            perf.count("catalog.writes")
+            self.store.delete_book(book['path'])
+            self.text_index.remove_document(book['path'])
+            self._notify(BOOKS_REMOVED, paths=[book['path']])
             return True
         return False
     
     def delete_book_by_path(self, path):
-        self.load_data()
-        for i, book in enumerate(self.data["books"]):
-            if book['path'] == path:
-                return self.delete_book(i)
-        return False
+        book = self.get_book(path)
+        if book:
+            for i, b in enumerate(self.data["books"]):
+                if b is book:
+                    return self.delete_book(i)
+        # 메모리에 아직 없는 책(다른 인스턴스에서 추가)이라도 저장소에서 삭제
+        self.text_index.remove_document(path)
+        perf.count("catalog.writes")
+        return self.store.delete_book(path)
+
+    def delete_books_by_path(self, paths):
+        """여러 권을 한 번에 삭제 (저장소는 한 트랜잭션, 변경 알림도 한 번)"""
+        paths = set(paths)
+        removed = []
+        for path in paths:
+            book = self.get_book(path)
+            if book:
+                self._index_remove(book)
+                self._remove_cover(book)
+                self._dirty.pop(path, None)
+                removed.append(path)
+        if removed:
+            removed_set = set(removed)
+            self.data["books"] = [b for b in self.data["books"] if b['path'] not in removed_set]
+        perf.count("catalog.writes")
+        self.store.delete_books(paths)
+        self.text_index.remove_documents(paths)
+        if removed:
+            self._notify(BOOKS_REMOVED, paths=removed)
+        return len(removed)
 
     def get_books(self, category="전체 보기"):
         if category == "전체 보기":
             return self.data["books"]
         elif category == "최근 읽은 책":
             # 최근 읽은 순서대로 정렬하여 상위 10권 반환
-            read_books = [b for b in self.data["books"] if b.get('last_read')]
-            read_books.sort(key=lambda x: x['last_read'], reverse=True)
-            return read_books[:10]
+            read_books = (b for b in self.data["books"] if b.get('last_read'))
+            return heapq.nlargest(10, read_books, key=lambda x: x['last_read'])
         elif category == "즐겨찾기":
-            return [b for b in self.data["books"] if b.get('favorite')]
+            return list(self._favorites.values())
         else:
-            return [b for b in self.data["books"] if b.get('category') == category]
+            return list(self._by_category.get(category, {}).values())
+
+    def search_content(self, query, limit=200):
+        """책 본문 검색 결과를 [(책, 페이지 번호, 미리보기), ...]로 반환 (관련도 순)"""
+        results = []
+        with perf.stage("catalog.search_content"):
+            hits = self.text_index.search_books(query, limit)
+        for hit in hits:
+            book = self.get_book(hit['path'])
+            if book:
+                results.append((book, hit['page'], hit['snippet']))
+        return results
 
     def toggle_favorite(self, path):
-        for book in self.data["books"]:
-            if book['path'] == path:
-                book['favorite'] = not book.get('favorite', False)
-                self.save_data()
-                return book['favorite']
+        book = self.get_book(path)
+        if book:
+            book['favorite'] = not book.get('favorite', False)
+            if book['favorite']:
+                self._favorites[path] = book
+            else:
+                self._favorites.pop(path, None)
+            self._mark_dirty(path, favorite=book['favorite'])
+            self._notify(BOOK_UPDATED, book=book, fields=('favorite',), old_path=None)
+            return book['favorite']
         return False
\ No newline at end of file
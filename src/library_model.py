@@ -0,0 +1,212 @@
+import os
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex, QSortFilterProxyModel
+from PyQt6.QtGui import QIcon
+
+# 기존 QListWidgetItem과 같은 역할 번호 유지 (UserRole: 경로, UserRole + 1: 열 페이지)
+PathRole = Qt.ItemDataRole.UserRole
+PageRole = Qt.ItemDataRole.UserRole + 1
+TitleRole = Qt.ItemDataRole.UserRole + 2
+CategoryRole = Qt.ItemDataRole.UserRole + 3
+LastReadRole = Qt.ItemDataRole.UserRole + 4
+
+ALL_BOOKS = "전체 보기"
+RECENT_BOOKS = "최근 읽은 책"
+FAVORITE_BOOKS = "즐겨찾기"
+
+
+class BookListModel(QAbstractListModel):
+    """도서 목록 모델 - 책마다 위젯을 만들지 않고, 뷰가 화면에 보이는 행만 data()로 요청함"""
+
+    def __init__(self, parent=None, cover_loader=None):
+        super().__init__(parent)
+        self.books = []
+        self._row_of = {}  # 경로 -> 행 번호
+        self._rows_by_cover = {}  # 표지 경로 -> [행 번호]
+        # [NEW] 표지는 화면에 보이는 항목만 백그라운드에서 읽음
+        self.cover_loader = cover_loader
+        if cover_loader is not None:
+            cover_loader.cover_ready.connect(self._on_cover_ready)
+
+    def set_books(self, books):
+        self.beginResetModel()
+        self.books = list(books)
+        self._reindex()
+        self.endResetModel()
+
+    def _reindex(self):
+        self._row_of = {b['path']: i for i, b in enumerate(self.books)}
+        self._rows_by_cover = {}
+        for i, b in enumerate(self.books):
+            if b.get('cover'):
+                self._rows_by_cover.setdefault(b['cover'], []).append(i)
+
+    # [NEW] 도서 목록 변경 알림에 맞춰 해당 행만 고침 (목록 전체를 다시 만들지 않음)
+    def add_books(self, books):
+        books = [b for b in books if b['path'] not in self._row_of]
+        if not books:
+            return
+        first = len(self.books)
+        self.beginInsertRows(QModelIndex(), first, first + len(books) - 1)
+        for i, b in enumerate(books, first):
+            self.books.append(b)
+            self._row_of[b['path']] = i
+            if b.get('cover'):
+                self._rows_by_cover.setdefault(b['cover'], []).append(i)
+        self.endInsertRows()
+
+    def remove_paths(self, paths):
+        rows = sorted((self._row_of[p] for p in paths if p in self._row_of), reverse=True)
+        if not rows:
+            return
+        # 붙어 있는 행은 한 번에 지움 (뒤에서부터 지워야 앞쪽 행 번호가 그대로 유지됨)
+        start = end = rows[0]
+        for row in rows[1:] + [None]:
+            if row is not None and row == start - 1:
+                start = row
+                continue
+            self.beginRemoveRows(QModelIndex(), start, end)
+            del self.books[start:end + 1]
+            self.endRemoveRows()
+            if row is not None:
+                start = end = row
+        self._reindex()
+
+    def update_book(self, book, old_path=None):
+        row = self._row_of.pop(old_path, None) if old_path else self._row_of.get(book['path'])
+        if row is None:
+            return
+        self._row_of[book['path']] = row
+        self.books[row] = book
+        cover = book.get('cover')
+        if not cover or row not in self._rows_by_cover.get(cover, ()):
+            # [FIX] 표지가 바뀜 (바뀐 파일을 다시 읽거나 표지를 다시 만든 경우) - 새 표지가 준비되면 이 행을 다시 그리도록
+            # 책 dict는 이미 고쳐진 상태라 예전 표지 경로를 알 수 없으므로 이 행이 들어 있는 목록을 찾아 뺌
+            for old_cover, rows in list(self._rows_by_cover.items()):
+                if row in rows:
+                    rows.remove(row)
+                    if not rows:
+                        del self._rows_by_cover[old_cover]
+            if cover:
+                self._rows_by_cover.setdefault(cover, []).append(row)
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
+
+    def _on_cover_ready(self, cover_path):
+        for row in self._rows_by_cover.get(cover_path, []):
+            index = self.index(row)
+            self.dataChanged.emit(index, index, [Qt.ItemDataRole.DecorationRole])
+
+    def book_at(self, row):
+        if 0 <= row < len(self.books):
+            return self.books[row]
+        return None
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.books)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        book = self.books[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            last_page = book.get('last_page', 0)
+            total_pages = book.get('total_pages', '?')
+            mark = "⚠️ " if book.get('missing') else "" # 연결한 폴더에서 파일이 없어진 책
+            return f"{mark}{book['title']}\n({last_page + 1} / {total_pages} P)"
+        if role == Qt.ItemDataRole.DecorationRole:
+            cover = book.get('cover')
+            if self.cover_loader is not None:
+                return self.cover_loader.icon(cover)
+            if cover and os.path.exists(cover):
+                return QIcon(cover)
+            return None
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return Qt.AlignmentFlag.AlignCenter
+        if role == PathRole:
+            return book['path']
+        if role == PageRole:
+            return book.get('last_page', 0)
+        if role == TitleRole:
+            return book['title']
+        if role == CategoryRole:
+            return book.get('category')
+        if role == LastReadRole:
+            return book.get('last_read') or ""
+        return None
+
+
+class BookFilterProxyModel(QSortFilterProxyModel):
+    """카테고리/검색어로 도서 목록을 거르는 프록시 (원본 모델은 그대로 두고 보이는 행만 바꿈)"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.category = ALL_BOOKS
+        self.allowed_paths = None  # 최근 읽은 책/즐겨찾기처럼 경로 집합으로 거를 때
+        self.search_text = ""
+        self.content_hits = {}  # 본문 검색 결과 {경로: (페이지, 미리보기)}
+        self._hit_rank = {}
+
+    def set_category(self, category, allowed_paths=None):
+        self.category = category
+        self.allowed_paths = set(allowed_paths) if allowed_paths is not None else None
+        self.search_text = ""
+        self.content_hits = {}
+        self._hit_rank = {}
+        self._apply_sort()
+        self.invalidateFilter()
+
+    def set_search(self, text, content_hits=None):
+        """검색 모드: 카테고리와 상관없이 제목 또는 본문이 일치하는 책을 보여줌"""
+        self.search_text = text.lower()
+        self.content_hits = content_hits or {}
+        self._hit_rank = {path: i for i, path in enumerate(self.content_hits)}
+        self._apply_sort()
+        self.invalidateFilter()
+
+    def _apply_sort(self):
+        if self.search_text:
+            self.sort(0, Qt.SortOrder.AscendingOrder)  # 제목 일치 먼저, 그 다음 본문 관련도 순
+        elif self.category == RECENT_BOOKS:
+            self.setSortRole(LastReadRole)
+            self.sort(0, Qt.SortOrder.DescendingOrder)
+        else:
+            self.sort(-1)  # 원본 순서 유지
+
+    def _search_key(self, index):
+        book = self.sourceModel().book_at(index.row())
+        if self.search_text in book['title'].lower():
+            return (0, index.row())
+        return (1, self._hit_rank.get(book['path'], 0))
+
+    def lessThan(self, left, right):
+        if self.search_text:
+            return self._search_key(left) < self._search_key(right)
+        return super().lessThan(left, right)
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        book = self.sourceModel().book_at(source_row)
+        if book is None:
+            return False
+        if self.search_text:
+            return self.search_text in book['title'].lower() or book['path'] in self.content_hits
+        if self.allowed_paths is not None:
+            return book['path'] in self.allowed_paths
+        if self.category == ALL_BOOKS:
+            return True
+        return book.get('category') == self.category
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        # 본문 검색으로만 찾은 책은 찾은 페이지를 표시하고 그 페이지로 열리게 함
+        if self.search_text and role in (Qt.ItemDataRole.DisplayRole, PageRole, Qt.ItemDataRole.ToolTipRole):
+            path = super().data(index, PathRole)
+            hit = self.content_hits.get(path)
+            if hit and self.search_text not in super().data(index, TitleRole).lower():
+                page, snippet = hit
+                if role == Qt.ItemDataRole.DisplayRole:
+                    return f"{super().data(index, TitleRole)}\n(본문 {page + 1} P)"
+                if role == PageRole:
+                    return page
+                return snippet
+        return super().data(index, role)
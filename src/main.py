@@ -1,25 +1,30 @@
 import sys
 import os
+import multiprocessing
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QLabel, QPushButton, 
                              QFileDialog, QVBoxLayout, QHBoxLayout, QWidget,
-                             QLineEdit, QScrollArea, QMessageBox, QStackedWidget, 
-                             QListWidget, QListWidgetItem, QInputDialog, QAbstractItemView,
+                             QLineEdit, QMessageBox, QStackedWidget, 
+                             QListWidget, QListWidgetItem, QListView, QInputDialog, QAbstractItemView,
                              QMenu, QStyle, QProgressDialog)
-from PyQt6.QtGui import QIcon, QAction
-from PyQt6.QtCore import Qt, QSize, QEvent, QTimer
-from pdf_engine import PDFEngine 
-from library_manager import LibraryManager
+from PyQt6.QtGui import QAction
+from PyQt6.QtCore import Qt, QSize, QTimer
+from library_manager import (LibraryManager, CATALOG_RELOADED, BOOKS_ADDED, BOOK_UPDATED, BOOKS_REMOVED,
+                             CATEGORIES_CHANGED)
+from library_model import BookListModel, BookFilterProxyModel, PathRole, PageRole
+from cover_loader import CoverLoader
+from folder_watcher import LibraryFolderWatcher
 from config import check_old_data_exists, migrate_old_data, cleanup_old_data
+from perf import perf, default_dump_path, ENABLED_FROM_ENV
 
 # =========================================================
 # 0. UI 스타일시트 정의 (현대적이고 깔끔한 디자인)
 # =========================================================
 DARK_THEME = """
     QMainWindow, QWidget { background-color: #2b2b2b; color: #ffffff; }
-    QListWidget { background-color: #333333; border: 1px solid #444444; border-radius: 10px; padding: 5px; }
-    QListWidget::item { border-radius: 8px; margin: 5px; }
-    QListWidget::item:hover { background-color: #3d3d3d; }
-    QListWidget::item:selected { background-color: #4a9eff; color: white; }
+    QListView { background-color: #333333; border: 1px solid #444444; border-radius: 10px; padding: 5px; }
+    QListView::item { border-radius: 8px; margin: 5px; }
+    QListView::item:hover { background-color: #3d3d3d; }
+    QListView::item:selected { background-color: #4a9eff; color: white; }
     QPushButton { background-color: #444444; border: none; border-radius: 8px; padding: 8px 15px; font-weight: bold; }
     QPushButton:hover { background-color: #555555; }
     QPushButton#action_btn { background-color: #4a9eff; color: white; }
@@ -32,8 +37,9 @@ class LibraryWidget(QWidget):
     def __init__(self, parent_app):
         super().__init__()
         self.parent_app = parent_app 
-        self.manager = LibraryManager()
+        self.manager = parent_app.manager
         self.current_category = "전체 보기" 
+        self.catalog_loaded = False
         
         self.search_timer = QTimer()
         self.search_timer.setSingleShot(True) 
@@ -41,6 +47,14 @@ class LibraryWidget(QWidget):
         self.search_timer.timeout.connect(self.execute_search)
 
         self.init_ui()
+        # [NEW] 도서 목록이 바뀌면 알림을 받아 바뀐 행/폴더만 고침 (독서 화면에서 바꾼 것 포함)
+        self.manager.subscribe(self.on_catalog_changed)
+        # [NEW] 연결한 서재 폴더 감시 (바뀐 폴더만 백그라운드에서 다시 검사)
+        self.folder_watcher = LibraryFolderWatcher(self)
+        self.folder_watcher.folder_scanned.connect(self.on_folder_scanned)
+        self.folder_watcher.integrity_checked.connect(self.manager.apply_integrity)
+        self._syncing_folder = False
+        self._pending_rescans = set() # 등록 진행 창이 떠 있는 동안 끝난 검사 (끝나고 다시 검사)
 
     def init_ui(self):
         main_layout = QHBoxLayout(self)
@@ -65,12 +79,17 @@ class LibraryWidget(QWidget):
         self.btn_del_folder.clicked.connect(self.delete_folder)
         folder_btn_layout.addWidget(self.btn_del_folder)
         left_layout.addLayout(folder_btn_layout)
+
+        self.btn_link_folder = QPushButton("🔗 PC 폴더 연결")
+        self.btn_link_folder.setToolTip("PC의 폴더를 서재 폴더로 연결하면 그 안의 PDF가 자동으로 등록·갱신됩니다")
+        self.btn_link_folder.clicked.connect(self.link_library_folder)
+        left_layout.addWidget(self.btn_link_folder)
         
         # --- [오른쪽] ---
         right_layout = QVBoxLayout()
         
         self.search_bar = QLineEdit()
-        self.search_bar.setPlaceholderText("🔍 책 제목 검색... (0.3초 뒤 검색됩니다)")
+        self.search_bar.setPlaceholderText("🔍 책 제목·본문 검색... (0.3초 뒤 검색됩니다)")
         self.search_bar.setMinimumHeight(40)
         self.search_bar.textChanged.connect(self.on_search_text_changed) 
         self.search_bar.setStyleSheet("""
@@ -83,21 +102,32 @@ class LibraryWidget(QWidget):
         self.lbl_title.setStyleSheet("font-size: 24px; font-weight: bold; margin: 10px;")
         right_layout.addWidget(self.lbl_title)
 
-        self.book_list = QListWidget()
-        self.book_list.setViewMode(QListWidget.ViewMode.IconMode) 
+        # [NEW] 모델/뷰 방식: 책마다 위젯을 만들지 않고 보이는 칸만 그림
+        self.cover_loader = CoverLoader(self)
+        self.book_model = BookListModel(self, cover_loader=self.cover_loader)
+        self.book_proxy = BookFilterProxyModel(self)
+        self.book_proxy.setSourceModel(self.book_model)
+
+        self.book_list = QListView()
+        self.book_list.setModel(self.book_proxy)
+        self.book_list.setViewMode(QListView.ViewMode.IconMode) 
         self.book_list.setIconSize(QSize(120, 160)) 
-        self.book_list.setSpacing(20) 
-        self.book_list.setResizeMode(QListWidget.ResizeMode.Adjust) 
-        self.book_list.setMovement(QListWidget.Movement.Static)
+        self.book_list.setGridSize(QSize(170, 240))
+        self.book_list.setUniformItemSizes(True)
+        self.book_list.setLayoutMode(QListView.LayoutMode.Batched)
+        self.book_list.setBatchSize(200)
+        self.book_list.setWordWrap(True)
+        self.book_list.setResizeMode(QListView.ResizeMode.Adjust) 
+        self.book_list.setMovement(QListView.Movement.Static)
         self.book_list.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
         self.book_list.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.book_list.customContextMenuRequested.connect(self.show_context_menu)
 
         self.book_list.setStyleSheet("""
-            QListWidget::item { width: 150px; height: 220px; margin: 10px; }
-            QListWidget::item:selected { background-color: #e0e0e0; border-radius: 10px; color: black; }
+            QListView::item { width: 150px; height: 220px; margin: 10px; }
+            QListView::item:selected { background-color: #e0e0e0; border-radius: 10px; color: black; }
         """)
-        self.book_list.itemDoubleClicked.connect(self.open_selected_book) 
+        self.book_list.doubleClicked.connect(self.open_selected_book) 
         right_layout.addWidget(self.book_list)
 
         book_btn_layout = QHBoxLayout()
@@ -128,8 +158,99 @@ class LibraryWidget(QWidget):
 
         main_layout.addWidget(left_widget, 2)
         main_layout.addWidget(right_widget, 8)
-        
-        self.refresh_all()
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        # [최적화] 빈 서재 화면을 먼저 그린 뒤 도서 목록을 불러옴 (표지는 보이는 것만 백그라운드에서 읽음)
+        if not self.catalog_loaded:
+            self.catalog_loaded = True
+            QTimer.singleShot(0, self.load_catalog)
+
+    def load_catalog(self):
+        self.manager.load_data() # 다 읽으면 CATALOG_RELOADED 알림으로 refresh_all()
+        # 연결한 폴더는 목록을 보여준 뒤 백그라운드에서 검사 (바뀐 파일만 등록/갱신)
+        self.update_watched_folders()
+        self.folder_watcher.rescan()
+        # [NEW] 옮겨졌거나 이름이 바뀐 책 파일을 지문으로 찾아 자동으로 다시 연결
+        self.folder_watcher.check_integrity(self.manager.integrity_snapshot(), self.folder_watcher.roots)
+
+    def update_watched_folders(self):
+        roots = [root for root, _ in self.manager.get_library_folders()]
+        if roots != self.folder_watcher.roots:
+            self.folder_watcher.set_roots(roots)
+
+    def on_folder_scanned(self, root, scan):
+        category = dict(self.manager.get_library_folders()).get(root)
+        if category is None:
+            return
+        if self._syncing_folder:
+            # 진행 창이 이벤트를 처리하는 동안 들어온 검사 결과 - 지금 동기화가 끝난 뒤 다시 검사
+            self._pending_rescans.add(root)
+            return
+        # [FIX] 새로 들어오거나 바뀐 PDF를 읽는 동안(본문 추출 포함) 창이 멈추지 않도록
+        # 폴더 연결과 같은 진행/취소 창을 띄움 - 파일을 열어야 할 때만 뜨고, 바뀐 것이 없으면 조용히 끝남
+        progress = None
+        update = None
+
+        def update_progress(current, total, path=None):
+            nonlocal progress, update
+            if progress is None:
+                progress, update = self._ingest_progress("연결한 폴더에 들어온 책을 등록하는 중입니다...")
+            return update(current, total, path)
+
+        self._syncing_folder = True
+        try:
+            self.manager.sync_folder(root, category, scan, progress_callback=update_progress)
+        finally:
+            self._syncing_folder = False
+            if progress is not None:
+                progress.close()
+        self.rescan_pending_folders()
+
+    def rescan_pending_folders(self):
+        pending, self._pending_rescans = self._pending_rescans, set()
+        for root in pending:
+            self.folder_watcher.rescan(root)
+
+    def link_library_folder(self):
+        root = QFileDialog.getExistingDirectory(self, "서재로 연결할 폴더 선택")
+        if not root: return
+        root = os.path.normpath(root)
+        name, ok = QInputDialog.getText(self, "폴더 연결", "이 폴더의 책을 넣을 서재 폴더 이름:",
+                                        text=os.path.basename(root) or root)
+        if not ok or not name: return
+
+        self.manager.add_library_folder(root, name)
+        progress, update_progress = self._ingest_progress("연결한 폴더를 검사하는 중입니다...")
+        self._syncing_folder = True
+        try:
+            summary = self.manager.sync_folder(root, name, progress_callback=update_progress)
+        finally:
+            self._syncing_folder = False
+            progress.close()
+        self.update_watched_folders()
+        self._pending_rescans.add(root) # 하위 폴더까지 감시 등록 (바뀐 것이 없으면 금방 끝남)
+        self.rescan_pending_folders()
+        QMessageBox.information(self, "폴더 연결", f"'{name}' 폴더에 연결했습니다.\n"
+                                f"새로 등록 {summary['added']}권, 갱신 {summary['updated']}권")
+
+    def _ingest_progress(self, label):
+        progress = QProgressDialog(label, "취소", 0, 0, self)
+        progress.setWindowTitle("잠시만 기다려주세요")
+        progress.setWindowModality(Qt.WindowModality.WindowModal)
+        progress.setMinimumDuration(0)
+        progress.show()
+        QApplication.processEvents()
+
+        def update_progress(current, total, path=None):
+            progress.setMaximum(total)
+            progress.setValue(current)
+            filename = os.path.basename(path) if path else ""
+            progress.setLabelText(f"책 등록 중... ({current} / {total})\n처리 중: {filename}")
+            QApplication.processEvents()
+            if progress.wasCanceled(): return False
+            return True
+        return progress, update_progress
 
     def on_search_text_changed(self, text):
         self.search_timer.stop()
@@ -137,41 +258,54 @@ class LibraryWidget(QWidget):
 
     def execute_search(self):
         text = self.search_bar.text()
-        self.book_list.setUpdatesEnabled(False)
-        self.book_list.clear()
 
         if not text.strip():
-            self.refresh_all(skip_clear=True) 
+            self.change_category(None)
         else:
             self.lbl_title.setText(f"🔍 검색 결과: '{text}'")
-            all_books = self.manager.get_books("전체 보기")
-            for book in all_books:
-                if text.lower() in book['title'].lower():
-                    self.add_book_to_list_widget(book)
-        
-        self.book_list.setUpdatesEnabled(True)
-
-    def add_book_to_list_widget(self, book):
-        last_page = book.get('last_page', 0)
-        total_pages = book.get('total_pages', '?')
-        
-        display_text = f"{book['title']}\n({last_page + 1} / {total_pages} P)"
-        
-        item = QListWidgetItem(display_text)
-        item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-
-        if 'cover' in book and os.path.exists(book['cover']):
-            item.setIcon(QIcon(book['cover']))
-        
-        item.setData(Qt.ItemDataRole.UserRole, book['path'])
-        item.setData(Qt.ItemDataRole.UserRole + 1, last_page)
-        
-        self.book_list.addItem(item)
+            # [NEW] 목록을 다시 만들지 않고 모델만 거름 (본문 검색 결과는 찾은 페이지로 바로 열림)
+            content_hits = {book['path']: (page, snippet)
+                            for book, page, snippet in self.manager.search_content(text)}
+            self.book_proxy.set_search(text, content_hits)
+
+    def on_catalog_changed(self, event, info):
+        if not self.catalog_loaded:
+            return # 첫 화면을 그린 뒤 refresh_all()에서 한 번에 불러옴
+        if event == CATALOG_RELOADED:
+            self.refresh_all()
+        elif event == CATEGORIES_CHANGED:
+            removed = self.current_category not in self.manager.get_categories() + ["최근 읽은 책", "즐겨찾기"]
+            if removed:
+                self.current_category = "전체 보기"
+            self.refresh_folders()
+            self.update_watched_folders() # 폴더를 지우면 연결도 끊김
+            if removed:
+                self.change_category(None)
+        elif event == BOOKS_ADDED:
+            self.book_model.add_books(info['books'])
+        elif event == BOOKS_REMOVED:
+            self.book_model.remove_paths(info['paths'])
+            self.refresh_special_category()
+        elif event == BOOK_UPDATED:
+            self.book_model.update_book(info['book'], info['old_path'])
+            self.refresh_special_category()
+
+    def refresh_special_category(self):
+        # 최근 읽은 책/즐겨찾기는 경로 목록으로 거르므로 목록만 다시 받음 (검색 중이면 검색 결과 유지)
+        if self.current_category in ("최근 읽은 책", "즐겨찾기") and not self.search_bar.text():
+            self.change_category(None)
+
+    def refresh_all(self):
+        """폴더 목록과 도서 목록 전체를 다시 채움 (처음 불러올 때와 목록을 통째로 다시 읽었을 때만)"""
+        self.refresh_folders()
+        self.book_model.set_books(self.manager.get_books("전체 보기"))
+        if self.search_bar.text():
+            self.execute_search()
+        else:
+            self.change_category(None)
 
-    def refresh_all(self, skip_clear=False):
-        self.manager.load_data()
+    def refresh_folders(self):
         self.folder_list.setUpdatesEnabled(False)
-        self.book_list.setUpdatesEnabled(False)
 
         self.folder_list.clear()
         
@@ -194,53 +328,43 @@ class LibraryWidget(QWidget):
         items = self.folder_list.findItems(self.current_category, Qt.MatchFlag.MatchExactly)
         if items:
             self.folder_list.setCurrentItem(items[0])
-
-        self.search_bar.blockSignals(True)
-        if not self.search_bar.text():
-            self.search_bar.clear()
-        self.search_bar.blockSignals(False)
-
-        if not skip_clear:
-            self.book_list.clear()
-            
-        if not self.search_bar.text():
-            self.change_category(None, skip_refresh=True)
-            
         self.folder_list.setUpdatesEnabled(True)
-        self.book_list.setUpdatesEnabled(True)
 
-    def change_category(self, item, skip_refresh=False):
+    def change_category(self, item):
         if item:
             self.current_category = item.text()
+            # 폴더를 누르면 검색은 해제
+            self.search_bar.blockSignals(True)
+            self.search_bar.clear()
+            self.search_bar.blockSignals(False)
         else:
             items = self.folder_list.findItems(self.current_category, Qt.MatchFlag.MatchExactly)
             if items:
                 self.folder_list.setCurrentItem(items[0])
         
         self.lbl_title.setText(f"📚 {self.current_category}")
-        
-        if not skip_refresh:
-            self.book_list.setUpdatesEnabled(False)
-            self.book_list.clear()
-            
-        books = self.manager.get_books(self.current_category)
-        for book in books:
-            self.add_book_to_list_widget(book)
-            
-        if not skip_refresh:
-            self.book_list.setUpdatesEnabled(True)
+
+        # 최근 읽은 책/즐겨찾기는 매니저 색인에서 경로 목록만 받아 거름
+        allowed_paths = None
+        if self.current_category in ("최근 읽은 책", "즐겨찾기"):
+            allowed_paths = [b['path'] for b in self.manager.get_books(self.current_category)]
+        self.book_proxy.set_category(self.current_category, allowed_paths)
+
+    def selected_paths(self):
+        return [index.data(PathRole) for index in self.book_list.selectionModel().selectedIndexes()]
 
     def show_context_menu(self, pos):
-        item = self.book_list.itemAt(pos)
-        if not item: return
+        index = self.book_list.indexAt(pos)
+        if not index.isValid(): return
 
         menu = QMenu(self)
         action_read = QAction("📖 읽기", self)
         action_read.triggered.connect(self.open_selected_book)
         menu.addAction(action_read)
 
-        path = item.data(Qt.ItemDataRole.UserRole)
-        is_fav = any(b['path'] == path and b.get('favorite') for b in self.manager.data['books'])
+        path = index.data(PathRole)
+        book = self.manager.get_book(path)
+        is_fav = bool(book and book.get('favorite'))
         action_fav = QAction("⭐ 즐겨찾기 해제" if is_fav else "⭐ 즐겨찾기 추가", self)
         action_fav.triggered.connect(lambda: self.toggle_fav(path))
         menu.addAction(action_fav)
@@ -263,28 +387,23 @@ class LibraryWidget(QWidget):
 
     def toggle_fav(self, path):
         self.manager.toggle_favorite(path)
-        self.refresh_all()
 
     def move_selected_books(self, target_category):
-        selected_items = self.book_list.selectedItems()
-        if not selected_items: return
+        selected_paths = self.selected_paths()
+        if not selected_paths: return
 
         count = 0
-        for item in selected_items:
-            path = item.data(Qt.ItemDataRole.UserRole)
+        for path in selected_paths:
             if self.manager.move_book(path, target_category):
                 count += 1
         
         self.search_bar.clear() 
-        self.refresh_all()
         QMessageBox.information(self, "이동 완료", f"{count}권 이동됨")
 
     def add_folder(self):
         text, ok = QInputDialog.getText(self, '폴더 추가', '새 폴더 이름:')
         if ok and text:
-            if self.manager.add_category(text):
-                self.refresh_all()
-            else:
+            if not self.manager.add_category(text):
                 QMessageBox.warning(self, "오류", "이미 존재하는 폴더 이름입니다.")
 
     def delete_folder(self):
@@ -299,34 +418,16 @@ class LibraryWidget(QWidget):
                                      QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No, 
                                      QMessageBox.StandardButton.No)
         if reply == QMessageBox.StandardButton.Yes:
-            self.manager.delete_category(name)
-            self.current_category = "전체 보기" 
-            self.refresh_all()
+            self.manager.delete_category(name) # 보고 있던 폴더가 지워지면 알림을 받아 '전체 보기'로 돌아감
 
     def add_books(self):
         file_names, _ = QFileDialog.getOpenFileNames(self, "PDF 파일 선택", "", "PDF Files (*.pdf)")
         if file_names:
             target_cat = self.current_category
             total_files = len(file_names)
-            
-            progress = QProgressDialog("책을 서재에 등록하는 중입니다...", "취소", 0, total_files, self)
-            progress.setWindowTitle("잠시만 기다려주세요")
-            progress.setWindowModality(Qt.WindowModality.WindowModal)
-            progress.setMinimumDuration(0)
-            
-            progress.show()
-
-            def update_progress(current, total, path=None):
-                progress.setValue(current)
-                filename = os.path.basename(path) if path else ""
-                progress.setLabelText(f"책 등록 중... ({current} / {total})\n처리 중: {filename}")
-                QApplication.processEvents()
-                if progress.wasCanceled(): return False
-                return True
-
+            progress, update_progress = self._ingest_progress("책을 서재에 등록하는 중입니다...")
             count = self.manager.add_books(file_names, target_cat, update_progress)
             progress.setValue(total_files)
-            self.refresh_all()
             
             if progress.wasCanceled():
                 QMessageBox.information(self, "중단됨", f"{count}권까지만 추가하고 중단했습니다.")
@@ -334,33 +435,32 @@ class LibraryWidget(QWidget):
                 QMessageBox.information(self, "성공", f"{count}권의 책이 추가되었습니다!")
 
     def delete_selected_books(self):
-        selected_items = self.book_list.selectedItems()
-        if not selected_items: return
+        selected_paths = self.selected_paths()
+        if not selected_paths: return
             
-        count = len(selected_items)
+        count = len(selected_paths)
         reply = QMessageBox.question(self, '삭제 확인', f"선택한 {count}권을 삭제하시겠습니까?",
                                      QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No, 
                                      QMessageBox.StandardButton.No)
         if reply == QMessageBox.StandardButton.Yes:
-            for item in selected_items:
-                path = item.data(Qt.ItemDataRole.UserRole)
-                self.manager.delete_book_by_path(path)
-            
-            if self.search_bar.text():
-                self.execute_search()
-            else:
-                self.refresh_all()
+            self.manager.delete_books_by_path(selected_paths)
+            self.manager.collect_orphan_covers()
 
     # [수정됨] 책 열 때 파일 존재 여부 체크 및 재연결 로직
     def open_selected_book(self):
         try:
-            current_item = self.book_list.currentItem()
-            if current_item:
-                path = current_item.data(Qt.ItemDataRole.UserRole)
-                last_page = current_item.data(Qt.ItemDataRole.UserRole + 1)
+            current_index = self.book_list.currentIndex()
+            if current_index.isValid():
+                path = current_index.data(PathRole)
+                last_page = current_index.data(PageRole)
                 
                 # [CHECK] 파일이 진짜 있는지 확인
                 if not os.path.exists(path):
+                    # [NEW] 먼저 알려진 폴더에서 같은 내용(지문)의 파일을 찾아 자동으로 다시 연결
+                    new_path = self.manager.locate_moved_book(path)
+                    if new_path:
+                        self.parent_app.show_reader(new_path, last_page)
+                        return
                     # 파일이 없음! 물어보기
                     box = QMessageBox()
                     box.setIcon(QMessageBox.Icon.Warning)
@@ -380,7 +480,6 @@ class LibraryWidget(QWidget):
                             # 매니저에게 주소 갱신 요청
                             if self.manager.update_book_path(path, new_path):
                                 QMessageBox.information(self, "완료", "책이 성공적으로 다시 연결되었습니다!")
-                                self.refresh_all() # 화면 갱신
                                 # 연결됐으니 바로 열어주기 (선택사항)
                                 self.parent_app.show_reader(new_path, last_page)
                             else:
@@ -395,233 +494,6 @@ class LibraryWidget(QWidget):
             QMessageBox.critical(self, "오류", f"책을 여는 도중 오류가 발생했습니다:\n{str(e)}")
             print(f"Error opening book: {e}")
 
-# =========================================================
-# 2. 독서 화면 (Ver 5.0 유지)
-# =========================================================
-class ReaderWidget(QWidget):
-    def __init__(self, parent_app):
-        super().__init__()
-        self.parent_app = parent_app
-        self.manager = LibraryManager() 
-        self.engine = PDFEngine()
-        
-        self.current_book_path = None 
-        self.current_page = 0
-        self.total_pages = 0
-        self.zoom_level = 1.0
-        self.dark_mode = True # 기본 야간 모드 ON
-        self.init_ui()
-
-    def init_ui(self):
-        self.main_layout = QVBoxLayout(self)
-        self.main_layout.setContentsMargins(5, 5, 5, 5)
-
-        control_layout = QHBoxLayout()
-        self.btn_back = QPushButton("📚 서재로")
-        self.btn_back.clicked.connect(self.go_back)
-        self.btn_back.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-        control_layout.addWidget(self.btn_back)
-
-        self.btn_dark_mode = QPushButton("🌙 야간 모드 ON")
-        self.btn_dark_mode.clicked.connect(self.toggle_dark_mode)
-        self.btn_dark_mode.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-        control_layout.addWidget(self.btn_dark_mode)
-
-        self.btn_first = QPushButton("⏮ 처음")
-        self.btn_first.clicked.connect(self.go_first_page)
-        self.btn_first.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-        control_layout.addWidget(self.btn_first)
-
-        self.btn_prev = QPushButton("◀")
-        self.btn_prev.clicked.connect(self.prev_page)
-        self.btn_prev.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-        control_layout.addWidget(self.btn_prev)
-
-        self.btn_next = QPushButton("▶")
-        self.btn_next.clicked.connect(self.next_page)
-        self.btn_next.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-        control_layout.addWidget(self.btn_next)
-
-        self.input_page = QLineEdit()
-        self.input_page.setPlaceholderText("Page")
-        self.input_page.setFixedWidth(60)
-        self.input_page.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.input_page.returnPressed.connect(self.jump_to_page)
-        self.input_page.setFocusPolicy(Qt.FocusPolicy.ClickFocus)
-        control_layout.addWidget(self.input_page)
-
-        self.lbl_total_page = QLabel("/ 0")
-        control_layout.addWidget(self.lbl_total_page)
-
-        control_layout.addStretch()
-
-        self.btn_fit = QPushButton("⟲ 한눈에 보기")
-        self.btn_fit.clicked.connect(self.fit_to_window)
-        self.btn_fit.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-        control_layout.addWidget(self.btn_fit)
-
-        self.btn_zoom_out = QPushButton("축소 (-)")
-        self.btn_zoom_out.clicked.connect(self.zoom_out)
-        self.btn_zoom_out.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-        control_layout.addWidget(self.btn_zoom_out)
-
-        self.lbl_zoom = QLabel("100%")
-        self.lbl_zoom.setFixedWidth(50)
-        self.lbl_zoom.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        control_layout.addWidget(self.lbl_zoom)
-
-        self.btn_zoom_in = QPushButton("확대 (+)")
-        self.btn_zoom_in.clicked.connect(self.zoom_in)
-        self.btn_zoom_in.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-        control_layout.addWidget(self.btn_zoom_in)
-
-        self.main_layout.addLayout(control_layout)
-
-        self.scroll_area = QScrollArea()
-        self.scroll_area.setWidgetResizable(True)
-        self.scroll_area.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.scroll_area.installEventFilter(self)
-        self.main_layout.addWidget(self.scroll_area)
-
-        self.lbl_viewer = QLabel("파일을 열어주세요")
-        self.lbl_viewer.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.lbl_viewer.setStyleSheet("background-color: #505050; color: #aaaaaa; font-size: 30px; font-weight: bold;")
-        self.scroll_area.setWidget(self.lbl_viewer)
-
-    def go_back(self):
-        if self.current_book_path:
-            self.manager.update_last_page(self.current_book_path, self.current_page)
-            if self.parent_app.library_widget.search_bar.text():
-                self.parent_app.library_widget.search_books(self.parent_app.library_widget.search_bar.text())
-            else:
-                self.parent_app.library_widget.refresh_all()
-            
-        self.parent_app.show_library()
-
-    def load_file(self, file_path, initial_page=0): 
-        try:
-            if os.path.exists(file_path):
-                self.engine.open(file_path)
-                self.current_book_path = file_path 
-                
-                self.total_pages = self.engine.get_total_pages()
-                
-                if initial_page >= self.total_pages:
-                    initial_page = 0
-                
-                self.current_page = initial_page
-                
-                self.fit_to_window()
-                self.lbl_total_page.setText(f"/ {self.total_pages}")
-                self.scroll_area.verticalScrollBar().setValue(0)
-                self.scroll_area.setFocus()
-            else:
-                QMessageBox.critical(self, "오류", "파일을 찾을 수 없습니다.")
-        except Exception as e:
-            QMessageBox.critical(self, "오류", f"PDF 파일을 로드하는 중 오류가 발생했습니다:\n{str(e)}")
-            print(f"Error loading PDF: {e}")
-
-    def go_first_page(self):
-        if self.engine.doc:
-            self.current_page = 0
-            self.show_page()
-            self.scroll_area.verticalScrollBar().setValue(0)
-            self.scroll_area.setFocus()
-
-    def fit_to_window(self):
-        if not self.engine.doc: return
-        page_w, page_h = self.engine.get_page_size(self.current_page)
-        if page_w == 0 or page_h == 0: return
-        view_w = self.scroll_area.width() - 25
-        view_h = self.scroll_area.height() - 25
-        if view_w <= 0 or view_h <= 0: return
-        ratio_w = view_w / page_w
-        ratio_h = view_h / page_h
-        best_ratio = min(ratio_w, ratio_h)
-        target_width = page_w * best_ratio
-        self.zoom_level = target_width / view_w
-        self.show_page()
-
-    def zoom_in(self):
-        if self.engine.doc:
-            if self.zoom_level < 4.0:
-                self.zoom_level += 0.1
-                self.show_page()
-
-    def zoom_out(self):
-        if self.engine.doc:
-            if self.zoom_level > 0.15:
-                self.zoom_level -= 0.1
-                self.show_page()
-
-    def show_page(self):
-        if self.engine.doc:
-            self.input_page.setText(str(self.current_page + 1))
-            self.lbl_zoom.setText(f"{int(self.zoom_level * 100)}%")
-            available_width = self.scroll_area.width() - 25 
-            pixmap = self.engine.get_page_image(self.current_page, self.zoom_level, available_width, invert=self.dark_mode)
-            if pixmap:
-                self.lbl_viewer.setPixmap(pixmap)
-                self.lbl_viewer.adjustSize()
-
-    def toggle_dark_mode(self):
-        self.dark_mode = not self.dark_mode
-        self.btn_dark_mode.setText("🌙 야간 모드 ON" if self.dark_mode else "☀️ 야간 모드 OFF")
-        self.show_page()
-
-    def resizeEvent(self, event):
-        if self.engine.doc: self.show_page()
-        super().resizeEvent(event)
-
-    def prev_page(self):
-        if self.engine.doc and self.current_page > 0:
-            self.current_page -= 1
-            self.show_page()
-            self.scroll_area.verticalScrollBar().setValue(0)
-
-    def next_page(self):
-        if self.engine.doc and self.current_page < self.total_pages - 1:
-            self.current_page += 1
-            self.show_page()
-            self.scroll_area.verticalScrollBar().setValue(0)
-            
-    def jump_to_page(self):
-        if not self.engine.doc: return
-        text = self.input_page.text()
-        if text.isdigit():
-            page_num = int(text)
-            if 1 <= page_num <= self.total_pages:
-                self.current_page = page_num - 1
-                self.show_page()
-                self.scroll_area.verticalScrollBar().setValue(0)
-                self.scroll_area.setFocus()
-
-    def eventFilter(self, source, event):
-        if source == self.scroll_area:
-            if event.type() == QEvent.Type.Wheel:
-                modifiers = QApplication.keyboardModifiers()
-                if modifiers == Qt.KeyboardModifier.ControlModifier:
-                    if event.angleDelta().y() > 0: self.zoom_in()
-                    else: self.zoom_out()
-                else:
-                    if event.angleDelta().y() > 0: self.prev_page()
-                    else: self.next_page()
-                return True
-            elif event.type() == QEvent.Type.KeyPress:
-                if event.key() == Qt.Key.Key_Left:
-                    self.prev_page()
-                    return True
-                elif event.key() == Qt.Key.Key_Right:
-                    self.next_page()
-                    return True
-        return super().eventFilter(source, event)
-
-    def keyPressEvent(self, event):
-        if event.key() == Qt.Key.Key_Plus or event.key() == Qt.Key.Key_Equal:
-            self.zoom_in()
-        elif event.key() == Qt.Key.Key_Minus:
-            self.zoom_out()
-
 # =========================================================
 # 3. 메인 윈도우
 # =========================================================
@@ -637,12 +509,20 @@ class MainApp(QMainWindow):
         self.stack = QStackedWidget()
         self.setCentralWidget(self.stack)
 
+        # [최적화] 도서 목록은 한 인스턴스를 서재/독서 화면이 함께 사용
+        # [FIX] 목록(SQLite 읽기, 색인 만들기)은 창을 처음 그린 뒤 LibraryWidget.load_catalog()에서 읽음
+        self.manager = LibraryManager(load=False)
         self.library_widget = LibraryWidget(self) 
-        self.reader_widget = ReaderWidget(self)   
+        self._reader_widget = None # 독서 화면은 처음 책을 열 때 만듦 (reader_widget 참고)
 
         self.stack.addWidget(self.library_widget)
-        self.stack.addWidget(self.reader_widget)
         self.stack.setCurrentIndex(0)
+
+        # [NEW] 밀린 도서 목록 변경을 주기적으로 한 번에 저장 (write-behind)
+        self.flush_timer = QTimer(self)
+        self.flush_timer.setInterval(3000)
+        self.flush_timer.timeout.connect(self.flush_catalog)
+        self.flush_timer.start()
         
         # [새로운 기능] 프로그램 시작 시 데이터 마이그레이션 확인
         self.check_and_migrate_data()
@@ -698,8 +578,8 @@ class MainApp(QMainWindow):
                         if cleanup_old_data():
                             QMessageBox.information(self, "완료", "기존 파일이 삭제되었습니다.")
                     
-                    # 서재 화면 새로고침
-                    self.library_widget.refresh_all()
+                    # 새 위치의 도서 목록을 다시 읽음 (서재 화면은 알림을 받아 새로고침)
+                    self.manager.load_data()
                 elif success:
                     QMessageBox.information(self, "알림", "데이터가 이미 새 위치에 있습니다.")
                 else:
@@ -714,17 +594,20 @@ class MainApp(QMainWindow):
         <ul>
             <li><b>폴더 추가:</b> 왼쪽 '폴더 목록' 하단의 <b>[+ 추가]</b> 버튼을 눌러 카테고리(예: 신학, 소설, 업무 등)를 만듭니다.</li>
             <li><b>책 대량 추가:</b> 메인 화면 하단의 <b>[+ 책 대량 추가]</b> 버튼을 눌러 여러 PDF 파일을 한꺼번에 서재에 등록할 수 있습니다.</li>
+            <li><b>PC 폴더 연결:</b> <b>[🔗 PC 폴더 연결]</b>로 PC의 폴더를 연결하면 그 안의 PDF가 자동으로 등록되고, 파일을 넣거나 바꾸면 알아서 반영됩니다. (없어진 파일은 ⚠️로 표시)</li>
             <li><b>즐겨찾기:</b> 책 표지를 <b>마우스 우클릭</b>하여 '즐겨찾기 추가'를 선택하면 상단 별표(⭐) 폴더에서 따로 모아볼 수 있습니다.</li>
-            <li><b>도서 검색:</b> 상단 검색창에 제목을 입력하면 실시간으로 도서를 찾아줍니다.</li>
+            <li><b>도서 검색:</b> 상단 검색창에 제목이나 본문 내용(3글자 이상)을 입력하면 실시간으로 도서를 찾아줍니다. 본문에서 찾은 책은 해당 페이지로 바로 열립니다.</li>
             <li><b>도서 이동/삭제:</b> 책을 우클릭하여 다른 폴더로 이동하거나, 서재에서 삭제할 수 있습니다.</li>
         </ul>
 
         <h3 style='color: #64b5f6;'>2. 독서 기능 (뷰어 조작)</h3>
         <ul>
             <li><b>책 열기:</b> 책을 <b>더블 클릭</b>하거나 <b>[📖 읽기]</b> 버튼을 누르면 독서 화면으로 전환됩니다.</li>
-            <li><b>야간 모드:</b> <b>[🌙 야간 모드 ON]</b> 버튼을 누르면 눈이 편안한 어두운 배경과 반전된 텍스트로 보실 수 있습니다.</li>
+            <li><b>야간 모드:</b> <b>[🌙 야간 모드]</b> 버튼을 누를 때마다 반전 → 사진 유지 반전(사진 색은 자연스럽게) → 세피아 → 끄기 순서로 바뀝니다.</li>
             <li><b>확대/축소:</b> 상단 <b>[확대/축소]</b> 버튼 또는 <b>Ctrl + 마우스 휠</b>을 사용하여 글자 크기를 조절하세요.</li>
             <li><b>페이지 이동:</b> 마우스 휠, 키보드 방향키(←, →), 또는 상단 이동 버튼을 사용합니다.</li>
+            <li><b>연속 스크롤:</b> <b>[📜 연속 스크롤]</b> 버튼을 누르면 페이지를 세로로 이어서 마우스 휠로 부드럽게 넘겨 볼 수 있습니다.</li>
+            <li><b>성능 측정:</b> 독서 화면에서 <b>F12</b>를 누르면 단계별 렌더링 시간이 화면에 표시되고, <b>Shift + F12</b>로 측정값을 파일로 저장합니다.</li>
             <li><b>서재로 복귀:</b> <b>[📚 서재로]</b> 버튼을 누르면 현재 읽던 페이지가 자동으로 저장되며 다시 서재 화면으로 돌아갑니다.</li>
         </ul>
 
@@ -745,14 +628,38 @@ class MainApp(QMainWindow):
         msg.setStandardButtons(QMessageBox.StandardButton.Ok)
         msg.exec()
 
+    @property
+    def reader_widget(self):
+        if self._reader_widget is None:
+            # PyMuPDF와 렌더링 모듈은 여기서 처음 불러옴
+            from reader_widget import ReaderWidget
+            self._reader_widget = ReaderWidget(self)
+            self.stack.addWidget(self._reader_widget)
+        return self._reader_widget
+
     def show_reader(self, file_path, page=0):
         self.reader_widget.load_file(file_path, page) 
-        self.stack.setCurrentIndex(1) 
+        self.stack.setCurrentWidget(self.reader_widget) 
 
     def show_library(self):
         self.stack.setCurrentIndex(0) 
 
+    def flush_catalog(self):
+        self.manager.flush()
+
+    def closeEvent(self, event):
+        self.flush_catalog()
+        if ENABLED_FROM_ENV:
+            print(f"성능 측정값 저장: {perf.dump(default_dump_path())}")
+        if self._reader_widget is not None:
+            self._reader_widget.prefetcher.shutdown()
+            self._reader_widget.engine.close_all()
+        self.library_widget.cover_loader.shutdown()
+        self.library_widget.folder_watcher.shutdown()
+        super().closeEvent(event)
+
 if __name__ == "__main__":
+    multiprocessing.freeze_support() # 빌드된 실행 파일에서 병렬 등록(작업 프로세스) 지원
     app = QApplication(sys.argv)
     window = MainApp()
     window.show()
@@ -0,0 +1,91 @@
+from PyQt6.QtGui import QImage, QPainter, QColor
+
+# 야간 모드 종류 (이름, 버튼에 표시할 글자) - 버튼을 누를 때마다 이 순서로 바뀜
+NIGHT_MODES = [
+    ("invert", "🌙 야간 모드: 반전"),
+    ("smart", "🌗 야간 모드: 사진 유지"),
+    ("sepia", "📜 야간 모드: 세피아"),
+    ("off", "☀️ 야간 모드 OFF"),
+]
+SEPIA = QColor("#f4e4c1")
+
+# 밝기 L에 대해 255 - 2L 의 양수 부분 / 음수 부분 (bytes.translate용 변환표)
+_LIFT = bytes(max(0, 255 - 2 * v) for v in range(256))
+_DROP = bytes(max(0, 2 * v - 255) for v in range(256))
+
+
+def night_mode_label(mode):
+    return dict(NIGHT_MODES).get(mode, mode)
+
+
+def next_night_mode(mode):
+    names = [name for name, _ in NIGHT_MODES]
+    return names[(names.index(mode) + 1) % len(names)] if mode in names else names[0]
+
+
+def apply_night_mode(image, mode):
+    """이미 렌더링된 페이지 이미지에 야간 모드를 입힌 새 QImage 반환 (PDF를 다시 렌더링하지 않음)
+
+    모든 단계가 Qt(C++)의 이미지 연산이나 bytes.translate라서 한 페이지에 몇 ms면 끝납니다.
+    작업 스레드에서 호출해도 안전합니다. "off"면 원본을 그대로 돌려줍니다.
+    """
+    if mode == "invert":
+        result = image.copy()
+        result.invertPixels()
+        return result
+    if mode == "sepia":
+        # 흑백으로 바꾼 뒤 종이색을 곱함 (흰 바탕 -> 세피아, 검은 글자 -> 검정)
+        result = _grayscale(image)
+        _composite(result, SEPIA, QPainter.CompositionMode.CompositionMode_Multiply)
+        return result
+    if mode == "smart":
+        return _invert_lightness(image)
+    return image
+
+
+def _grayscale(image):
+    return image.convertToFormat(QImage.Format.Format_Grayscale8).convertToFormat(QImage.Format.Format_RGB32)
+
+
+def _composite(target, source, mode):
+    painter = QPainter(target)
+    painter.setCompositionMode(mode)
+    if isinstance(source, QColor):
+        painter.fillRect(target.rect(), source)
+    else:
+        painter.drawImage(0, 0, source)
+    painter.end()
+
+
+def _map_gray(gray, table):
+    # 밝기 채널(Grayscale8)의 각 바이트를 변환표로 바꾼 뒤 RGB32로 (세 채널에 같은 값)
+    data = gray.constBits().asstring(gray.sizeInBytes()).translate(table)
+    mapped = QImage(data, gray.width(), gray.height(), gray.bytesPerLine(), QImage.Format.Format_Grayscale8)
+    return mapped.convertToFormat(QImage.Format.Format_RGB32)
+
+
+def _invert_lightness(image):
+    """밝기만 뒤집고 색상(채도/색조)은 유지 - 흰 바탕과 검은 글자는 반전되지만 사진은 색이 자연스럽게 남음
+
+    각 채널 c에 대해 c + (255 - 2L) 를 계산합니다 (L: 밝기). 회색(c == L)이면 정확히 255 - L이 됩니다.
+    Qt에는 빼기 합성이 없으므로 255 - 2L의 양수 부분은 더하고(Plus), 음수 부분은 반전-더하기-반전으로 뺍니다.
+    """
+    gray = image.convertToFormat(QImage.Format.Format_Grayscale8)
+    result = image.convertToFormat(QImage.Format.Format_RGB32)  # 같은 포맷이면 얕은 복사, 그리면서 분리됨
+    _composite(result, _map_gray(gray, _LIFT), QPainter.CompositionMode.CompositionMode_Plus)
+    result.invertPixels()
+    _composite(result, _map_gray(gray, _DROP), QPainter.CompositionMode.CompositionMode_Plus)
+    result.invertPixels()
+    return result
+
+
+def cached_night_image(cache, key, image, mode):
+    """캐시에 있는 원본 렌더링(key)에 야간 모드를 입힌 이미지 - 결과도 캐시해서 페이지를 다시 볼 때나 모드를 오갈 때 재사용"""
+    if mode == "off":
+        return image
+    night_key = key + (mode,)
+    result = cache.get(night_key)
+    if result is None:
+        result = apply_night_mode(image, mode)
+        cache.put(night_key, result, result.sizeInBytes())
+    return result
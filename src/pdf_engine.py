@@ -1,12 +1,65 @@
-import fitz  # PyMuPDF
 from PyQt6.QtGui import QImage, QPixmap
+from render_core import render_page_pixmap, render_tile_pixmap, write_thumbnail
+from render_cache import RenderCache
+from doc_pool import DocumentPool
+from disk_cache import DiskPageCache
+from cover_store import quick_fingerprint
+from perf import perf
+
+# [NEW] 렌더링 자체(fitz)는 Qt 없이 쓰는 render_core에 있고, 이 모듈은 결과를 Qt 이미지로 바꾸는 층입니다.
+
+
+def render_page_image(doc, page_num, target_width):
+    """페이지 하나를 목표 너비로 렌더링해 QImage로 반환 (스레드에서도 사용 가능)
+
+    QPixmap은 GUI 스레드에서만 만들 수 있으므로, 백그라운드 렌더링과 캐시는 QImage를 사용합니다.
+    야간 모드는 렌더링 결과에 입히는 후처리입니다 (night_mode.cached_night_image).
+    """
+    return _to_qimage(render_page_pixmap(doc, page_num, target_width))
+
+
+def render_tile_image(doc, page_num, target_width, tile):
+    """크게 확대했을 때 페이지의 한 타일만 clip 영역으로 렌더링 (스레드에서도 사용 가능)"""
+    return _to_qimage(render_tile_pixmap(doc, page_num, target_width, tile))
+
+
+def _to_qimage(pix):
+    # [최적화] pix.samples는 버퍼 전체를 bytes로 한 번 더 복사하므로, 복사 없이 가리키는 samples_mv 사용
+    # 이 QImage는 pix의 버퍼를 빌려 쓰므로 pix가 살아 있는 동안(아래 변환까지)만 사용해야 함
+    img_format = QImage.Format.Format_RGB888
+    with perf.stage("render.to_qimage"):
+        q_img = QImage(pix.samples_mv, pix.width, pix.height, pix.stride, img_format)
+        # 화면 표시용 포맷으로 변환 - 여기서 만든 Qt 소유 이미지가 유일한 복사본 (이후 pix는 버려도 됨)
+        return q_img.convertToFormat(QImage.Format.Format_RGB32)
+
 
 class PDFEngine:
-    def __init__(self):
+    def __init__(self, cache=None, pool=None, disk_cache=None):
         self.doc = None
+        self.doc_path = None
+        self.fingerprint = None
+        self._page_sizes = None
+        # [NEW] 렌더링 결과 캐시 (페이지 왕복/야간 모드 전환 시 재렌더링 방지)
+        self.cache = cache if cache is not None else RenderCache()
+        # [NEW] 최근 연 문서 핸들 재사용 (책을 다시 열 때 xref를 다시 읽지 않음)
+        self.pool = pool if pool is not None else DocumentPool()
+        # [NEW] 마지막으로 읽던 페이지 등을 파일로 보관 (프로그램을 다시 켜도 책을 열자마자 표시)
+        self.disk_cache = disk_cache if disk_cache is not None else DiskPageCache()
     
     def open(self, file_path):
-        self.doc = fitz.open(file_path)
+        with perf.stage("engine.open"):
+            doc, fresh = self.pool.acquire(file_path)
+        if fresh:
+            self.cache.invalidate(file_path) # 파일이 바뀌었을 수 있으므로 예전 렌더링은 버림
+        if doc is not self.doc:
+            self._page_sizes = None
+        self.doc = doc
+        self.doc_path = file_path
+        # 디스크 캐시 키 - 열 때마다 새로 계산하므로 그 사이 내용이 바뀐 파일의 예전 페이지는 쓰이지 않음
+        try:
+            self.fingerprint = quick_fingerprint(file_path)
+        except OSError:
+            self.fingerprint = None
 
     def get_total_pages(self):
         if self.doc:
@@ -19,42 +72,61 @@ class PDFEngine:
             return page.rect.width, page.rect.height
         return 0, 0
 
-    def get_page_image(self, page_num, zoom_level, available_width, invert=False):
+    def get_page_sizes(self):
+        """모든 페이지의 (너비, 높이) 목록 - 연속 스크롤 레이아웃용 (문서마다 한 번만 계산)"""
+        if not self.doc:
+            return []
+        if self._page_sizes is None:
+            self._page_sizes = [self.get_page_size(i) for i in range(len(self.doc))]
+        return self._page_sizes
+
+    def get_page_image(self, page_num, zoom_level, available_width):
         if not self.doc:
             return None
-        page = self.doc.load_page(page_num)
         target_width = int(available_width * zoom_level)
-        zoom_factor = target_width / page.rect.width
-        mat = fitz.Matrix(zoom_factor, zoom_factor)
-        
-        # 야간 모드(색상 반전) 처리
-        pix = page.get_pixmap(matrix=mat, alpha=False, colorspace=fitz.csRGB)
-        if invert:
-            pix.invert_irect()
-            
-        img_format = QImage.Format.Format_RGB888
-        q_img = QImage(pix.samples, pix.width, pix.height, pix.stride, img_format)
-        return QPixmap.fromImage(q_img)
+        cache_key = self.cache_key(page_num, target_width)
+        image = self.cache.get(cache_key)
+        if image is None:
+            with perf.stage("render.page"):
+                image = render_page_image(self.doc, page_num, target_width)
+            self.cache.put(cache_key, image, image.sizeInBytes())
+        with perf.stage("render.to_pixmap"):
+            return QPixmap.fromImage(image)  # RGB32 이미지는 래스터 백엔드에서 복사 없이 버퍼를 공유
+
+    def cache_key(self, page_num, target_width, tile=None):
+        if tile is not None:
+            return (self.doc_path, page_num, target_width, tile)
+        return (self.doc_path, page_num, target_width)
+
+    def disk_key(self, page_num, target_width):
+        """디스크 캐시 키 (지문을 구하지 못했으면 None)"""
+        if self.fingerprint is None:
+            return None
+        return (self.fingerprint, page_num, target_width)
+
+    def load_disk_image(self, disk_key):
+        """디스크 캐시에 있는 페이지를 QImage로 읽음 (없으면 None, 작업 스레드에서도 사용 가능)"""
+        path = self.disk_cache.get(disk_key) if disk_key is not None else None
+        if path is None:
+            return None
+        with perf.stage("disk_cache.load"):
+            image = QImage(path)
+        return None if image.isNull() else image
     
     # [NEW] 썸네일(표지) 이미지를 파일로 저장하는 기능
     def create_thumbnail(self, pdf_path, save_path):
-        try:
-            # 잠깐 문서를 열어서
-            doc = fitz.open(pdf_path)
-            page = doc.load_page(0) # 첫 페이지만
-            
-            # 썸네일용 작은 크기로 변환 (너비 200px 정도)
-            zoom = 200 / page.rect.width
-            mat = fitz.Matrix(zoom, zoom)
-            pix = page.get_pixmap(matrix=mat, alpha=False)
-            
-            # 파일로 저장
-            pix.save(save_path)
-            doc.close()
-            return True
-        except:
-            return False
+        # 썸네일용 작은 크기로 변환 (너비 200px 정도)
+        return write_thumbnail(pdf_path, save_path, width=200)
 
     def close(self):
-        if self.doc:
-            self.doc.close()
\ No newline at end of file
+        """현재 문서에서 손을 뗌 (핸들은 풀에 남겨 두었다가 다시 열 때 재사용, 렌더링 캐시도 유지)"""
+        self.doc = None
+        self.doc_path = None
+        self.fingerprint = None
+        self._page_sizes = None
+
+    def close_all(self):
+        """프로그램 종료 시 열어 둔 문서를 모두 닫음"""
+        self.close()
+        self.pool.close_all()
+        self.cache.invalidate()
@@ -0,0 +1,129 @@
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import nullcontext
+from config import get_data_directory
+
+# 이 모듈은 Qt를 import 하지 않습니다.
+
+_NULL_STAGE = nullcontext()  # 꺼져 있을 때 돌려주는 빈 타이머 (매번 새로 만들지 않음)
+
+
+class _Stage:
+    __slots__ = ("stats", "name", "start")
+
+    def __init__(self, stats, name):
+        self.stats = stats
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.stats.add_sample(self.name, (time.perf_counter() - self.start) * 1000)
+        return False
+
+
+class PerfStats:
+    """단계별 소요 시간과 카운터를 모으는 가벼운 계측기 (렌더링 스레드에서도 호출 가능)
+
+    사용법:
+        with perf.stage("render.get_pixmap"):
+            ...
+        perf.count("render_cache.hit")
+
+    꺼져 있으면(기본값) stage()는 미리 만들어 둔 빈 컨텍스트를, count()는 바로 반환하므로
+    평소 비용은 속성 하나 확인하는 정도입니다. 환경 변수 MYPDF_PERF=1로 시작하면 처음부터 켜집니다.
+    """
+
+    def __init__(self, capacity=512, per_stage=256):
+        self.enabled = False
+        self.capacity = capacity
+        self.per_stage = per_stage
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.started = time.time()
+            self.recent = deque(maxlen=self.capacity)  # 최근 측정값 (시각, 단계, ms) 링 버퍼
+            self.stages = {}  # 단계 -> {'count', 'total_ms', 'max_ms', 'recent': deque}
+            self.counters = {}
+
+    def stage(self, name):
+        if not self.enabled:
+            return _NULL_STAGE
+        return _Stage(self, name)
+
+    def add_sample(self, name, ms):
+        if not self.enabled:
+            return
+        with self._lock:
+            entry = self.stages.get(name)
+            if entry is None:
+                entry = self.stages[name] = {'count': 0, 'total_ms': 0.0, 'max_ms': 0.0,
+                                             'recent': deque(maxlen=self.per_stage)}
+            entry['count'] += 1
+            entry['total_ms'] += ms
+            entry['max_ms'] = max(entry['max_ms'], ms)
+            entry['recent'].append(ms)
+            self.recent.append((time.time(), name, ms))
+
+    def count(self, name, n=1):
+        if not self.enabled:
+            return
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def last(self, name):
+        """단계의 가장 최근 측정값 (ms, 없으면 None)"""
+        with self._lock:
+            entry = self.stages.get(name)
+            return entry['recent'][-1] if entry and entry['recent'] else None
+
+    def summary(self):
+        """단계별 횟수/평균/중앙값/p95/최대와 카운터를 dict로"""
+        with self._lock:
+            stages = {}
+            for name, entry in sorted(self.stages.items()):
+                recent = sorted(entry['recent'])
+                stages[name] = {
+                    'count': entry['count'],
+                    'mean_ms': entry['total_ms'] / entry['count'],
+                    'median_ms': recent[len(recent) // 2],
+                    'p95_ms': recent[min(len(recent) - 1, int(len(recent) * 0.95))],
+                    'max_ms': entry['max_ms'],
+                }
+            return {
+                'started': time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(self.started)),
+                'stages': stages,
+                'counters': dict(sorted(self.counters.items())),
+            }
+
+    def dump(self, path):
+        """요약과 최근 측정값 링 버퍼를 JSON 파일로 저장"""
+        report = self.summary()
+        with self._lock:
+            report['recent'] = [{'time': t, 'stage': name, 'ms': ms} for t, name, ms in self.recent]
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        return path
+
+
+def default_dump_path():
+    """데이터 폴더 아래 perf/perf_날짜_시각.json"""
+    return os.path.join(get_data_directory(), "perf", time.strftime("perf_%Y%m%d_%H%M%S.json"))
+
+
+# MYPDF_PERF=1로 실행하면 처음부터 측정하고, 종료할 때 측정값을 파일로 저장
+ENABLED_FROM_ENV = os.environ.get("MYPDF_PERF", "") not in ("", "0")
+
+# 프로그램 전체에서 하나만 사용
+perf = PerfStats()
+perf.enabled = ENABLED_FROM_ENV
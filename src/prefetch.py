@@ -0,0 +1,158 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from pdf_engine import render_page_image, render_tile_image
+from doc_pool import DocumentPool
+from perf import perf
+
+
+class PagePrefetcher:
+    """현재 페이지 앞뒤 페이지를 백그라운드 스레드에서 미리 렌더링해 엔진 캐시에 넣어둠
+
+    PyMuPDF 문서 객체는 스레드 간 공유가 안전하지 않으므로, 작업 스레드마다 자기 문서 핸들을 따로 엽니다.
+    """
+
+    def __init__(self, engine, ahead=2, behind=1, max_workers=2):
+        self.engine = engine
+        self.ahead = ahead
+        self.behind = behind
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="prefetch")
+        self._local = threading.local()
+        # 이미 끝난 작업에 add_done_callback을 걸면 콜백이 즉시(같은 스레드에서) 실행되므로 재진입 가능한 락 사용
+        self._lock = threading.RLock()
+        self._pending = {}  # cache_key -> Future
+        self._requests = {}  # 연속 스크롤 모드에서 화면에 필요한 페이지 (cache_key -> Future)
+        self.generation = 0
+
+    def schedule(self, page_num, zoom_level, available_width):
+        """page_num 주변 페이지 예약 (이전 예약 중 아직 시작 안 한 작업은 취소)"""
+        if not self.engine.doc:
+            return
+        self.cancel()
+        path = self.engine.doc_path
+        total = self.engine.get_total_pages()
+        target_width = int(available_width * zoom_level)
+        if target_width <= 0:
+            return
+
+        # 다음 페이지를 우선, 그 다음 이전 페이지
+        targets = [page_num + i for i in range(1, self.ahead + 1)]
+        targets += [page_num - i for i in range(1, self.behind + 1)]
+
+        with self._lock:
+            generation = self.generation
+            for p in targets:
+                if not (0 <= p < total):
+                    continue
+                key = self.engine.cache_key(p, target_width)
+                if key in self.engine.cache or key in self._pending or key in self._requests:
+                    continue
+                future = self.executor.submit(self._render, generation, path, p, target_width, key, None,
+                                              self.engine.disk_key(p, target_width))
+                self._pending[key] = future
+                future.add_done_callback(lambda f, k=key: self._discard(self._pending, k, f))
+
+    def request(self, page_num, target_width, callback=None, tile=None):
+        """화면에 보이는 페이지(tile을 주면 그 타일만) 하나를 백그라운드에서 렌더링 (연속 스크롤/타일 모드)
+
+        schedule()과 달리 cancel()로 취소되지 않고, retain()에 없는 페이지만 취소됩니다.
+        끝나면 callback(key, image)를 작업 스레드에서 호출합니다 (취소/실패 시 image는 None).
+        """
+        if not self.engine.doc or target_width <= 0:
+            return None
+        key = self.engine.cache_key(page_num, target_width, tile)
+        with self._lock:
+            future = self._requests.get(key)
+            if future is None and key in self._pending:
+                # 미리 읽기로 예약된 작업은 request 쪽으로 옮김 (다음 schedule()의 cancel()에 취소되지 않게)
+                future = self._pending.pop(key)
+                self._requests[key] = future
+                future.add_done_callback(lambda f, k=key: self._discard(self._requests, k, f))
+            if future is None:
+                disk_key = self.engine.disk_key(page_num, target_width) if tile is None else None
+                future = self.executor.submit(self._render, None, self.engine.doc_path, page_num, target_width, key, tile,
+                                              disk_key)
+                self._requests[key] = future
+                future.add_done_callback(lambda f, k=key: self._discard(self._requests, k, f))
+            if callback is not None:
+                future.add_done_callback(lambda f, k=key: callback(k, self._result(f)))
+        return key
+
+    def persist(self, pages, target_width):
+        """pages를 디스크 캐시에 저장해 둠 (다음에 책을 열 때 바로 표시하도록)
+
+        메모리 캐시에 있는 페이지는 다시 렌더링하지 않고 그대로 저장합니다. cancel()/retain()으로 취소되지 않습니다.
+        """
+        if not self.engine.doc or target_width <= 0 or self.engine.fingerprint is None:
+            return None
+        jobs = [(p, self.engine.cache_key(p, target_width), self.engine.disk_key(p, target_width))
+                for p in pages if 0 <= p < self.engine.get_total_pages()]
+        return self.executor.submit(self._persist, self.engine.doc_path, target_width, jobs)
+
+    def retain(self, keys):
+        """keys에 없는 request() 작업 중 아직 시작 안 한 것은 취소 (화면 밖으로 스크롤된 페이지)"""
+        keys = set(keys)
+        with self._lock:
+            for key, future in list(self._requests.items()):
+                if key not in keys:
+                    future.cancel()
+
+    def cancel(self):
+        """대기 중인 작업 취소 (페이지 점프나 확대/축소 시)"""
+        with self._lock:
+            self.generation += 1
+            for future in list(self._pending.values()):  # 취소 콜백(_discard)이 바로 실행되며 항목을 지움
+                future.cancel()
+
+    def shutdown(self):
+        self.cancel()
+        self.retain(())
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def _discard(self, table, key, future):
+        with self._lock:
+            if table.get(key) is future:
+                del table[key]
+
+    @staticmethod
+    def _result(future):
+        if future.cancelled() or future.exception() is not None:
+            return None
+        return future.result()
+
+    def _get_doc(self, path):
+        # 작업 스레드 전용 문서 풀 (최근 책 두 권까지 열어 두고, 파일이 바뀌면 새로 엶)
+        pool = getattr(self._local, 'pool', None)
+        if pool is None:
+            pool = self._local.pool = DocumentPool(max_docs=2)
+        return pool.acquire(path)[0]
+
+    def _render(self, generation, path, page_num, target_width, key, tile, disk_key=None):
+        if generation is not None and generation != self.generation and self._requests.get(key) is None:
+            return None  # 이미 지나간 요청 (그 사이 request()로 옮겨진 작업은 계속)
+        image = self.engine.load_disk_image(disk_key)
+        if image is None:
+            doc = self._get_doc(path)
+            with perf.stage("render.page" if tile is None else "render.tile"):
+                if tile is None:
+                    image = render_page_image(doc, page_num, target_width)
+                else:
+                    image = render_tile_image(doc, page_num, target_width, tile)
+        if path != self.engine.doc_path:
+            return None  # 그 사이 다른 책이 열림
+        self.engine.cache.put(key, image, image.sizeInBytes())
+        return image
+
+    def _persist(self, path, target_width, jobs):
+        saved = 0
+        for page_num, key, disk_key in jobs:
+            if self.engine.disk_cache.get(disk_key) is not None:
+                continue  # 이미 있음 (최근 사용으로만 표시)
+            image = self.engine.cache.get(key)
+            if image is None:
+                with perf.stage("render.page"):
+                    image = render_page_image(self._get_doc(path), page_num, target_width)
+            with perf.stage("disk_cache.save"):
+                if self.engine.disk_cache.put(disk_key, lambda tmp: image.save(tmp, "PNG")):
+                    saved += 1
+        return saved
@@ -0,0 +1,520 @@
+import os
+import time
+from PyQt6.QtWidgets import (QApplication, QLabel, QPushButton, QVBoxLayout, QHBoxLayout, QWidget,
+                             QLineEdit, QScrollArea, QMessageBox, QStackedWidget)
+from PyQt6.QtGui import QImage, QPixmap
+from PyQt6.QtCore import Qt, QEvent, QTimer, pyqtSignal
+from pdf_engine import PDFEngine
+from prefetch import PagePrefetcher
+from continuous_view import ContinuousPageView
+from tiled_view import TiledPageWidget, TILED_MIN_PIXELS
+from night_mode import apply_night_mode, cached_night_image, night_mode_label, next_night_mode
+from perf import perf, default_dump_path
+
+# 이 모듈은 PyMuPDF를 불러오므로 처음 책을 열 때 import 됩니다 (프로그램 시작을 빠르게 하기 위해)
+
+# =========================================================
+# 2. 독서 화면 (Ver 5.0 유지)
+# =========================================================
+class ReaderWidget(QWidget):
+    # 백그라운드 렌더링 결과 (cache_key, QImage 또는 None) - 작업 스레드에서 보내면 GUI 스레드에서 받음
+    page_rendered = pyqtSignal(object, object)
+
+    PREVIEW_SCALE = 4 # 미리보기는 목표 너비의 1/4로 렌더링
+    PREVIEW_MIN_WIDTH = 200
+    RENDER_DELAY_MS = 80 # 확대/축소·창 크기 변경이 멈추고 이만큼 지나면 렌더링
+    PERF_OVERLAY_STAGES = ["render.load_page", "render.get_pixmap", "render.to_qimage", "render.page",
+                           "disk_cache.load", "reader.night_filter", "reader.set_pixmap", "reader.first_paint", "reader.sharp"]
+
+    def __init__(self, parent_app):
+        super().__init__()
+        self.parent_app = parent_app
+        self.manager = parent_app.manager # 서재 화면과 같은 도서 목록 인스턴스 사용
+        self.engine = PDFEngine()
+        self.prefetcher = PagePrefetcher(self.engine, ahead=2, behind=1)
+        
+        self.current_book_path = None 
+        self.current_page = 0
+        self.total_pages = 0
+        self.zoom_level = 1.0
+        self.night_mode = "invert" # 기본 야간 모드 ON (반전)
+        self.continuous_mode = False # [NEW] 연속 스크롤 모드
+        # [NEW] 2단계 렌더링: 저해상도 미리보기를 먼저 보여주고 선명한 이미지는 백그라운드에서 그려서 교체
+        self._sharp_key = None
+        self._preview_key = None
+        self._sharp_shown = False
+        self._render_started = 0.0
+        self.render_timings = {'first_paint_ms': None, 'sharp_ms': None} # 마지막 페이지 표시까지 걸린 시간
+        self._shown_pixmap = None # 지금 보이는 페이지 (확대/축소 중 임시로 늘려 보여줄 원본)
+        self.page_rendered.connect(self.on_page_rendered)
+        # [NEW] 연달아 들어오는 확대/축소·창 크기 변경은 모아서 마지막 크기로 한 번만 렌더링
+        self.render_timer = QTimer(self)
+        self.render_timer.setSingleShot(True)
+        self.render_timer.setInterval(self.RENDER_DELAY_MS)
+        self.render_timer.timeout.connect(self.show_page)
+        self.init_ui()
+
+    def init_ui(self):
+        self.main_layout = QVBoxLayout(self)
+        self.main_layout.setContentsMargins(5, 5, 5, 5)
+
+        control_layout = QHBoxLayout()
+        self.btn_back = QPushButton("📚 서재로")
+        self.btn_back.clicked.connect(self.go_back)
+        self.btn_back.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        control_layout.addWidget(self.btn_back)
+
+        self.btn_dark_mode = QPushButton(night_mode_label(self.night_mode))
+        self.btn_dark_mode.clicked.connect(self.toggle_dark_mode)
+        self.btn_dark_mode.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        control_layout.addWidget(self.btn_dark_mode)
+
+        self.btn_scroll_mode = QPushButton("📜 연속 스크롤 OFF")
+        self.btn_scroll_mode.clicked.connect(self.toggle_scroll_mode)
+        self.btn_scroll_mode.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        control_layout.addWidget(self.btn_scroll_mode)
+
+        self.btn_first = QPushButton("⏮ 처음")
+        self.btn_first.clicked.connect(self.go_first_page)
+        self.btn_first.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        control_layout.addWidget(self.btn_first)
+
+        self.btn_prev = QPushButton("◀")
+        self.btn_prev.clicked.connect(self.prev_page)
+        self.btn_prev.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        control_layout.addWidget(self.btn_prev)
+
+        self.btn_next = QPushButton("▶")
+        self.btn_next.clicked.connect(self.next_page)
+        self.btn_next.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        control_layout.addWidget(self.btn_next)
+
+        self.input_page = QLineEdit()
+        self.input_page.setPlaceholderText("Page")
+        self.input_page.setFixedWidth(60)
+        self.input_page.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.input_page.returnPressed.connect(self.jump_to_page)
+        self.input_page.setFocusPolicy(Qt.FocusPolicy.ClickFocus)
+        control_layout.addWidget(self.input_page)
+
+        self.lbl_total_page = QLabel("/ 0")
+        control_layout.addWidget(self.lbl_total_page)
+
+        control_layout.addStretch()
+
+        self.btn_fit = QPushButton("⟲ 한눈에 보기")
+        self.btn_fit.clicked.connect(self.fit_to_window)
+        self.btn_fit.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        control_layout.addWidget(self.btn_fit)
+
+        self.btn_zoom_out = QPushButton("축소 (-)")
+        self.btn_zoom_out.clicked.connect(self.zoom_out)
+        self.btn_zoom_out.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        control_layout.addWidget(self.btn_zoom_out)
+
+        self.lbl_zoom = QLabel("100%")
+        self.lbl_zoom.setFixedWidth(50)
+        self.lbl_zoom.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        control_layout.addWidget(self.lbl_zoom)
+
+        self.btn_zoom_in = QPushButton("확대 (+)")
+        self.btn_zoom_in.clicked.connect(self.zoom_in)
+        self.btn_zoom_in.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        control_layout.addWidget(self.btn_zoom_in)
+
+        self.main_layout.addLayout(control_layout)
+
+        self.scroll_area = QScrollArea()
+        self.scroll_area.setWidgetResizable(True)
+        self.scroll_area.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.scroll_area.installEventFilter(self)
+
+        self.lbl_viewer = QLabel("파일을 열어주세요")
+        self.lbl_viewer.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.lbl_viewer.setStyleSheet("background-color: #505050; color: #aaaaaa; font-size: 30px; font-weight: bold;")
+        self.scroll_area.setWidget(self.lbl_viewer)
+
+        # [NEW] 크게 확대했을 때 보이는 부분만 타일로 렌더링하는 위젯 (필요할 때 lbl_viewer와 바꿔 끼움)
+        self.tiled_viewer = TiledPageWidget(self.engine, self.prefetcher)
+
+        # [NEW] 연속 스크롤 뷰 (화면에 보이는 페이지만 렌더링)
+        self.continuous_view = ContinuousPageView(self.engine, self.prefetcher)
+        self.continuous_view.current_page_changed.connect(self.on_scrolled_to_page)
+        self.continuous_view.installEventFilter(self)
+        self.continuous_view.viewport().installEventFilter(self)
+
+        self.view_stack = QStackedWidget()
+        self.view_stack.addWidget(self.scroll_area)
+        self.view_stack.addWidget(self.continuous_view)
+        self.main_layout.addWidget(self.view_stack)
+
+        # [NEW] 성능 측정 오버레이 (F12로 켜고 끔, Shift+F12로 측정값을 파일로 저장)
+        self.perf_overlay = QLabel(self.view_stack)
+        self.perf_overlay.setStyleSheet("background-color: rgba(0, 0, 0, 170); color: #9cff9c; "
+                                        "font-family: monospace; font-size: 12px; padding: 6px;")
+        self.perf_overlay.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self.perf_overlay.hide()
+        self.perf_timer = QTimer(self)
+        self.perf_timer.setInterval(500)
+        self.perf_timer.timeout.connect(self.update_perf_overlay)
+        self._perf_was_enabled = perf.enabled
+
+    def go_back(self):
+        if self.current_book_path:
+            self.manager.update_last_page(self.current_book_path, self.current_page)
+            self.manager.flush() # 서재 화면은 변경 알림으로 해당 책만 고침
+            self.persist_reading_position()
+            
+        self.parent_app.show_library()
+
+    def persist_reading_position(self):
+        """[NEW] 읽던 페이지와 그 앞뒤 페이지를 디스크 캐시에 저장 (다음에 열면 렌더링 없이 바로 표시)
+
+        다시 열 때는 화면 맞춤 배율로 열리므로 그 너비로 저장합니다. 타일로 그릴 만큼 큰 페이지는 저장하지 않습니다.
+        """
+        zoom = self.fit_zoom(self.current_page) if self.engine.doc else None
+        if zoom is None:
+            return
+        target_width = int((self.scroll_area.width() - 25) * zoom)
+        page_w, page_h = self.engine.get_page_size(self.current_page)
+        if target_width * round(page_h * target_width / page_w) > TILED_MIN_PIXELS:
+            return
+        # 읽던 페이지 먼저, 그 다음 미리 읽기와 같은 순서(다음 페이지 우선)로
+        pages = [self.current_page]
+        pages += [self.current_page + i for i in range(1, self.prefetcher.ahead + 1)]
+        pages += [self.current_page - i for i in range(1, self.prefetcher.behind + 1)]
+        self.prefetcher.persist(pages, target_width)
+
+    def load_file(self, file_path, initial_page=0): 
+        try:
+            if os.path.exists(file_path):
+                self.engine.open(file_path)
+                self.current_book_path = file_path 
+                
+                self.total_pages = self.engine.get_total_pages()
+                
+                if initial_page >= self.total_pages:
+                    initial_page = 0
+                
+                self.current_page = initial_page
+                self._shown_pixmap = None
+                if self.continuous_mode:
+                    self.continuous_view.reset()
+                
+                self.fit_to_window()
+                self.lbl_total_page.setText(f"/ {self.total_pages}")
+                self.scroll_area.verticalScrollBar().setValue(0)
+                self.current_view().setFocus()
+            else:
+                QMessageBox.critical(self, "오류", "파일을 찾을 수 없습니다.")
+        except Exception as e:
+            QMessageBox.critical(self, "오류", f"PDF 파일을 로드하는 중 오류가 발생했습니다:\n{str(e)}")
+            print(f"Error loading PDF: {e}")
+
+    def go_first_page(self):
+        if self.engine.doc:
+            self.current_page = 0
+            self.show_page()
+            self.scroll_area.verticalScrollBar().setValue(0)
+            self.current_view().setFocus()
+
+    def fit_to_window(self):
+        if not self.engine.doc: return
+        zoom = self.fit_zoom(self.current_page)
+        if zoom is None: return
+        self.zoom_level = zoom
+        self.show_page()
+
+    def fit_zoom(self, page_num):
+        """page_num 페이지가 화면에 꼭 맞는 배율 (화면 크기를 모르면 None)"""
+        page_w, page_h = self.engine.get_page_size(page_num)
+        if page_w == 0 or page_h == 0: return None
+        view_w = self.scroll_area.width() - 25
+        view_h = self.scroll_area.height() - 25
+        if view_w <= 0 or view_h <= 0: return None
+        ratio_w = view_w / page_w
+        ratio_h = view_h / page_h
+        best_ratio = min(ratio_w, ratio_h)
+        target_width = page_w * best_ratio
+        return target_width / view_w
+
+    def zoom_in(self):
+        if self.engine.doc:
+            if self.zoom_level < 4.0:
+                self.prefetcher.cancel()
+                self.zoom_level += 0.1
+                self.request_render()
+
+    def zoom_out(self):
+        if self.engine.doc:
+            if self.zoom_level > 0.15:
+                self.prefetcher.cancel()
+                self.zoom_level -= 0.1
+                self.request_render()
+
+    def current_view(self):
+        return self.continuous_view if self.continuous_mode else self.scroll_area
+
+    def request_render(self):
+        """확대/축소·창 크기 변경 시 호출 - 지금 보이는 이미지를 임시로 늘려 보여주고, 실제 렌더링은 잠시 뒤 한 번만"""
+        if not self.engine.doc:
+            return
+        self.lbl_zoom.setText(f"{int(self.zoom_level * 100)}%")
+        if not self.continuous_mode and self.scroll_area.widget() is self.lbl_viewer and self._shown_pixmap is not None:
+            target_width = int((self.scroll_area.width() - 25) * self.zoom_level)
+            target_height = round(self._shown_pixmap.height() * target_width / self._shown_pixmap.width())
+            # 타일로 그릴 만큼 커지면 임시 확대도 생략 (큰 이미지를 또 만들지 않도록)
+            if 0 < target_width and target_width * target_height <= TILED_MIN_PIXELS:
+                interim = self._shown_pixmap.scaledToWidth(target_width, Qt.TransformationMode.FastTransformation)
+                self.lbl_viewer.setPixmap(interim)
+                self.lbl_viewer.adjustSize()
+        self.render_timer.start() # 이미 대기 중이면 다시 처음부터 기다림
+
+    def show_page(self):
+        self.render_timer.stop()
+        if self.engine.doc:
+            self.input_page.setText(str(self.current_page + 1))
+            self.lbl_zoom.setText(f"{int(self.zoom_level * 100)}%")
+            available_width = self.scroll_area.width() - 25 
+            self._sharp_key = self._preview_key = None # 이전에 요청한 한 쪽 보기 렌더링 결과는 무시
+            if self.continuous_mode:
+                # 연속 스크롤: 현재 페이지로 스크롤만 하고, 렌더링은 뷰가 보이는 페이지만 요청
+                self.continuous_view.set_options(self.zoom_level, available_width, self.night_mode)
+                self.continuous_view.scroll_to_page(self.current_page)
+                return
+            target_width = int(available_width * self.zoom_level)
+            page_w, page_h = self.engine.get_page_size(self.current_page)
+            target_height = round(page_h * target_width / page_w) if page_w else 0
+            if target_width * target_height > TILED_MIN_PIXELS:
+                # 페이지 전체를 한 장으로 그리면 너무 크므로 보이는 타일만 렌더링 (이웃 페이지 미리 읽기도 생략)
+                self.prefetcher.cancel()
+                self.tiled_viewer.set_page(self.current_page, target_width, target_height, self.night_mode)
+                self.set_viewer_widget(self.tiled_viewer)
+                return
+            self.set_viewer_widget(self.lbl_viewer)
+            self.request_page(target_width)
+            # 다음/이전 페이지 미리 렌더링 (페이지 점프·확대 시 이전 예약은 자동 취소)
+            self.prefetcher.schedule(self.current_page, self.zoom_level, available_width)
+
+    def request_page(self, target_width):
+        """현재 페이지 표시 - 캐시에 있으면 바로, 없으면 미리보기 먼저 보여주고 선명한 이미지는 백그라운드에서
+
+        UI 스레드는 렌더링을 기다리지 않습니다. 걸린 시간은 render_timings에 기록됩니다.
+        """
+        self._render_started = time.perf_counter()
+        self.render_timings = {'first_paint_ms': None, 'sharp_ms': None}
+        self._sharp_shown = False
+        # 캐시에는 야간 모드를 입히지 않은 원본을 두고, 화면에 보여줄 때 입힘 (display_image)
+        self._sharp_key = self.engine.cache_key(self.current_page, target_width)
+        self._preview_key = None
+        image = self.engine.cache.get(self._sharp_key)
+        if image is None:
+            # [NEW] 지난번에 읽다 닫은 페이지는 디스크 캐시에서 바로 읽음 (PNG 읽기는 무거운 스캔 렌더링보다 훨씬 빠름)
+            image = self.engine.load_disk_image(self.engine.disk_key(self.current_page, target_width))
+            if image is not None:
+                self.engine.cache.put(self._sharp_key, image, image.sizeInBytes())
+        if image is not None:
+            self.display_image(image, target_width, sharp=True, key=self._sharp_key)
+            return
+
+        preview_width = max(self.PREVIEW_MIN_WIDTH, target_width // self.PREVIEW_SCALE)
+        if preview_width < target_width:
+            self._preview_key = self.engine.cache_key(self.current_page, preview_width)
+            preview = self.engine.cache.get(self._preview_key)
+            if preview is not None:
+                self.display_image(preview, target_width, sharp=False, key=self._preview_key)
+            elif self.current_page == 0 and (cover := self.cover_preview()) is not None:
+                self.display_image(cover, target_width, sharp=False)
+            else:
+                self.prefetcher.request(self.current_page, preview_width, self.page_rendered.emit)
+        self.prefetcher.request(self.current_page, target_width, self.page_rendered.emit)
+        # 넘겨 버린 페이지의 렌더링 중 아직 시작 안 한 것은 취소
+        self.prefetcher.retain({k for k in (self._sharp_key, self._preview_key) if k})
+
+    def cover_preview(self):
+        # 첫 페이지는 서재의 표지 이미지를 미리보기로 사용
+        book = self.manager.get_book(self.current_book_path)
+        if not book or not book.get('cover'):
+            return None
+        image = QImage(book['cover'])
+        if image.isNull():
+            return None
+        return image
+
+    def on_page_rendered(self, key, image):
+        if not isinstance(image, QImage) or image.isNull():
+            return
+        if key == self._sharp_key:
+            self.display_image(image, key[2], sharp=True, key=key)
+        elif key == self._preview_key and not self._sharp_shown:
+            self.display_image(image, self._sharp_key[2], sharp=False, key=key)
+
+    def display_image(self, image, target_width, sharp, key=None):
+        # 야간 모드는 렌더링된 이미지에 입히는 후처리 (캐시된 원본이면 결과도 캐시)
+        with perf.stage("reader.night_filter"):
+            if key is not None:
+                image = cached_night_image(self.engine.cache, key, image, self.night_mode)
+            else:
+                image = apply_night_mode(image, self.night_mode)
+        with perf.stage("reader.set_pixmap"):
+            pixmap = QPixmap.fromImage(image)
+            if pixmap.width() != target_width:
+                pixmap = pixmap.scaledToWidth(target_width, Qt.TransformationMode.SmoothTransformation)
+            self.lbl_viewer.setPixmap(pixmap)
+            self.lbl_viewer.adjustSize()
+        self._shown_pixmap = pixmap
+        elapsed_ms = (time.perf_counter() - self._render_started) * 1000
+        if self.render_timings['first_paint_ms'] is None:
+            self.render_timings['first_paint_ms'] = elapsed_ms
+            perf.add_sample("reader.first_paint", elapsed_ms)
+        if sharp:
+            self._sharp_shown = True
+            self.render_timings['sharp_ms'] = elapsed_ms
+            perf.add_sample("reader.sharp", elapsed_ms)
+
+    def toggle_perf_overlay(self):
+        """성능 측정 오버레이 켜기/끄기 - 켜져 있는 동안만 측정 (MYPDF_PERF=1로 시작했으면 계속 측정)"""
+        if self.perf_overlay.isVisible():
+            self.perf_timer.stop()
+            self.perf_overlay.hide()
+            perf.enabled = self._perf_was_enabled
+            return
+        self._perf_was_enabled = perf.enabled
+        perf.enabled = True
+        self.update_perf_overlay()
+        self.perf_overlay.show()
+        self.perf_overlay.raise_()
+        self.perf_timer.start()
+
+    def update_perf_overlay(self):
+        stats = perf.summary()
+        lines = ["단계                     최근    중앙값     p95 (ms)"]
+        for name in self.PERF_OVERLAY_STAGES:
+            entry = stats['stages'].get(name)
+            if entry:
+                lines.append(f"{name:<22} {perf.last(name):>7.1f} {entry['median_ms']:>8.1f} {entry['p95_ms']:>7.1f}")
+        counters = stats['counters']
+        hits, misses = counters.get("render_cache.hit", 0), counters.get("render_cache.miss", 0)
+        if hits + misses:
+            lines.append(f"렌더링 캐시 적중 {hits}/{hits + misses} ({hits / (hits + misses):.0%})")
+        cache = self.engine.cache.stats()
+        disk = self.engine.disk_cache.stats()
+        lines.append(f"캐시 {cache['items']}개 {cache['bytes'] / 1048576:.0f}MB, "
+                     f"디스크 캐시 {disk['items']}개 {disk['bytes'] / 1048576:.0f}MB, "
+                     f"문서 풀 {len(self.engine.pool)}개, 도서 목록 기록 {counters.get('catalog.writes', 0)}회")
+        lines.append("Shift+F12: 측정값 저장")
+        self.perf_overlay.setText("\n".join(lines))
+        self.perf_overlay.adjustSize()
+        self.perf_overlay.move(8, 8)
+
+    def dump_perf_stats(self):
+        try:
+            path = perf.dump(default_dump_path())
+            QMessageBox.information(self, "성능 측정", f"측정값을 저장했습니다:\n{path}")
+        except Exception as e:
+            QMessageBox.warning(self, "성능 측정", f"측정값을 저장하지 못했습니다:\n{str(e)}")
+
+    def set_viewer_widget(self, widget):
+        if self.scroll_area.widget() is widget:
+            return
+        self.scroll_area.takeWidget() # setWidget()은 이전 위젯을 삭제하므로 먼저 빼냄
+        if widget is self.tiled_viewer:
+            self.lbl_viewer.clear() # 이전 페이지 전체 이미지는 놓아줌
+            self._shown_pixmap = None
+        else:
+            self.tiled_viewer.set_page(0, 0, 0, False)
+        self.scroll_area.setWidget(widget)
+
+    def toggle_scroll_mode(self):
+        self.continuous_mode = not self.continuous_mode
+        self.btn_scroll_mode.setText("📜 연속 스크롤 ON" if self.continuous_mode else "📜 연속 스크롤 OFF")
+        self.prefetcher.cancel() # 한 쪽씩 보기용 미리 읽기는 연속 스크롤에서 필요 없음
+        if self.continuous_mode and self.engine.doc:
+            self.continuous_view.reset()
+        self.view_stack.setCurrentWidget(self.current_view())
+        self.show_page()
+        self.current_view().setFocus()
+
+    def on_scrolled_to_page(self, page):
+        # 연속 스크롤 중 화면 가운데 위쪽에 걸린 페이지를 현재 페이지로 기록
+        if self.continuous_mode:
+            self.current_page = page
+            self.input_page.setText(str(page + 1))
+
+    def toggle_dark_mode(self):
+        # 반전 -> 사진 유지 반전 -> 세피아 -> 끄기 순서로 바뀜 (PDF를 다시 렌더링하지 않고 캐시된 페이지에 입힘)
+        self.night_mode = next_night_mode(self.night_mode)
+        self.btn_dark_mode.setText(night_mode_label(self.night_mode))
+        self.show_page()
+
+    def resizeEvent(self, event):
+        if self.engine.doc: self.request_render()
+        super().resizeEvent(event)
+
+    def prev_page(self):
+        if self.engine.doc and self.current_page > 0:
+            self.current_page -= 1
+            self.show_page()
+            self.scroll_area.verticalScrollBar().setValue(0)
+
+    def next_page(self):
+        if self.engine.doc and self.current_page < self.total_pages - 1:
+            self.current_page += 1
+            self.show_page()
+            self.scroll_area.verticalScrollBar().setValue(0)
+            
+    def jump_to_page(self):
+        if not self.engine.doc: return
+        text = self.input_page.text()
+        if text.isdigit():
+            page_num = int(text)
+            if 1 <= page_num <= self.total_pages:
+                self.prefetcher.cancel() # 멀리 점프하면 기존 미리 읽기는 필요 없음
+                self.current_page = page_num - 1
+                self.show_page()
+                self.scroll_area.verticalScrollBar().setValue(0)
+                self.current_view().setFocus()
+
+    def eventFilter(self, source, event):
+        if source in (self.continuous_view, self.continuous_view.viewport()):
+            # 연속 스크롤: 휠은 그대로 스크롤, Ctrl + 휠만 확대/축소
+            if event.type() == QEvent.Type.Wheel and event.modifiers() == Qt.KeyboardModifier.ControlModifier:
+                if event.angleDelta().y() > 0: self.zoom_in()
+                else: self.zoom_out()
+                return True
+            elif event.type() == QEvent.Type.KeyPress and source == self.continuous_view:
+                if event.key() == Qt.Key.Key_Left:
+                    self.prev_page()
+                    return True
+                elif event.key() == Qt.Key.Key_Right:
+                    self.next_page()
+                    return True
+        elif source == self.scroll_area:
+            if event.type() == QEvent.Type.Wheel:
+                modifiers = QApplication.keyboardModifiers()
+                if modifiers == Qt.KeyboardModifier.ControlModifier:
+                    if event.angleDelta().y() > 0: self.zoom_in()
+                    else: self.zoom_out()
+                else:
+                    if event.angleDelta().y() > 0: self.prev_page()
+                    else: self.next_page()
+                return True
+            elif event.type() == QEvent.Type.KeyPress:
+                if event.key() == Qt.Key.Key_Left:
+                    self.prev_page()
+                    return True
+                elif event.key() == Qt.Key.Key_Right:
+                    self.next_page()
+                    return True
+        return super().eventFilter(source, event)
+
+    def keyPressEvent(self, event):
+        if event.key() == Qt.Key.Key_F12:
+            if event.modifiers() & Qt.KeyboardModifier.ShiftModifier:
+                self.dump_perf_stats()
+            else:
+                self.toggle_perf_overlay()
+        elif event.key() == Qt.Key.Key_Plus or event.key() == Qt.Key.Key_Equal:
+            self.zoom_in()
+        elif event.key() == Qt.Key.Key_Minus:
+            self.zoom_out()
@@ -0,0 +1,102 @@
+import os
+from cover_store import content_hash, quick_fingerprint, fingerprint_size
+from folder_scan import scan_pdfs, path_key, is_under
+
+# 이 모듈은 작업 스레드에서도 쓰이므로 Qt를 import 하지 않습니다.
+# 책 목록은 dict 복사본만 받아서 읽고, 도서 목록을 고치는 일은 LibraryManager.apply_integrity()가 합니다.
+
+
+def match_moved_files(books, files):
+    """파일이 없어진 책과 새로 보이는 PDF를 내용 지문으로 짝지음
+
+    크기가 같은 파일만 앞/뒤 64KB 지문을 계산하므로 PDF 전체를 읽지 않습니다.
+    지문이 없는 이전 버전의 책은 파일 이름이 같은 후보만 전체 내용 해시로 확인합니다.
+
+    Args:
+        books: 없어진 책 목록 (dict - 'path', 'fingerprint', 'content_hash')
+        files: {후보 경로: (크기, 수정 시각 ns)}
+
+    Returns:
+        dict: {책 경로: 새 경로}
+    """
+    by_size = {}
+    by_name = {}
+    for book in books:
+        if book.get('fingerprint'):
+            by_size.setdefault(fingerprint_size(book['fingerprint']), []).append(book)
+        elif book.get('content_hash'):
+            by_name.setdefault(os.path.basename(book['path']).lower(), []).append(book)
+
+    matches = {}
+    for path, (size, _) in files.items():
+        candidates = by_size.get(size)
+        legacy = by_name.get(os.path.basename(path).lower())
+        if not candidates and not legacy:
+            continue
+        try:
+            if candidates:
+                fingerprint = quick_fingerprint(path)
+                book = next((b for b in candidates if b['fingerprint'] == fingerprint), None)
+                if book is not None:
+                    candidates.remove(book)
+                    matches[book['path']] = path
+                    continue
+            if legacy:
+                digest = content_hash(path)
+                book = next((b for b in legacy if b['content_hash'] == digest), None)
+                if book is not None:
+                    legacy.remove(book)
+                    matches[book['path']] = path
+        except OSError:
+            continue  # 검사 도중 지워진 파일 등
+    return matches
+
+
+def plan_integrity(books, linked_roots, known_paths=None):
+    """(작업 스레드) 파일이 없어진 책을 찾고, 알려진 폴더에서 옮겨간 곳을 찾음
+
+    알려진 폴더: 연결한 서재 폴더(하위 폴더 포함)와 지금 책이 들어 있는 폴더, 없어진 책이 있던 폴더(그 폴더만).
+    지문이 없는 책(이전 버전에서 등록)은 파일이 있으면 지문을 채웁니다.
+    known_paths: 이미 등록된 경로 (후보에서 뺌, 없으면 books의 경로)
+
+    Returns:
+        dict: {'missing': [다시 찾지 못한 책 경로], 'relink': {옛 경로: 새 경로},
+               'fingerprints': {책 경로: 지문}, 'found': [다시 나타난 책 경로]}
+    """
+    missing = []
+    found = []
+    fingerprints = {}
+    shallow_dirs = set()
+    for book in books:
+        path = book['path']
+        if os.path.exists(path):
+            if book.get('missing'):
+                found.append(path)
+            if not book.get('fingerprint'):
+                try:
+                    fingerprints[path] = quick_fingerprint(path)
+                except OSError:
+                    pass
+            shallow_dirs.add(os.path.dirname(path))
+        else:
+            missing.append(book)
+            shallow_dirs.add(os.path.dirname(path))  # 같은 폴더 안에서 이름만 바뀐 경우
+
+    relink = {}
+    if missing:
+        known = {path_key(p) for p in (known_paths if known_paths is not None else (b['path'] for b in books))}
+        files = {}
+        for root in linked_roots:
+            files.update(scan_pdfs(root)[0])
+        for folder in shallow_dirs:
+            if os.path.isdir(folder) and not any(is_under(folder, root) for root in linked_roots):
+                files.update(scan_pdfs(folder, recursive=False)[0])
+        files = {p: v for p, v in files.items() if path_key(p) not in known}
+        relink = match_moved_files(missing, files)
+
+    return {
+        'missing': [b['path'] for b in missing if b['path'] not in relink],
+        'relink': relink,
+        'fingerprints': fingerprints,
+        'found': found,
+    }
@@ -0,0 +1,88 @@
+import threading
+from collections import OrderedDict
+from perf import perf
+
+
+class RenderCache:
+    """렌더링된 페이지 이미지를 메모리 예산 안에서 보관하는 LRU 캐시
+
+    페이지 캐시의 키는 PDFEngine.cache_key의 (문서 경로, 페이지 번호, 목표 너비[, 타일]) 형태이고,
+    야간 모드를 입힌 결과는 원본 키 뒤에 모드를 붙인 key + (모드,)로 따로 둡니다 (night_mode.cached_night_image).
+    표지 캐시(cover_loader)는 (표지 파일 경로,)를 키로 씁니다.
+    값마다 바이트 크기를 함께 기록하고, 예산을 넘으면 가장 오래 안 쓴 항목부터 버립니다.
+    name은 성능 측정 카운터 이름 앞부분입니다 (페이지 캐시와 표지 캐시를 따로 셈).
+    """
+
+    def __init__(self, max_bytes=256 * 1024 * 1024, max_items=64, name="render_cache"):
+        self.max_bytes = max_bytes
+        self.name = name
+        self.max_items = max_items
+        self._items = OrderedDict()  # key -> (value, nbytes)
+        self._lock = threading.Lock()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._items.get(key)
+            if entry is None:
+                self.misses += 1
+                perf.count(f"{self.name}.miss")
+                return None
+            self._items.move_to_end(key)
+            self.hits += 1
+            perf.count(f"{self.name}.hit")
+            return entry[0]
+
+    def put(self, key, value, nbytes):
+        with self._lock:
+            # 한 장이 예산 전체보다 크면 캐시하지 않음
+            if nbytes > self.max_bytes:
+                return False
+            old = self._items.pop(key, None)
+            if old is not None:
+                self.current_bytes -= old[1]
+            self._items[key] = (value, nbytes)
+            self.current_bytes += nbytes
+            self._evict()
+            return True
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._items
+
+    def __len__(self):
+        return len(self._items)
+
+    def _evict(self):
+        while self._items and (self.current_bytes > self.max_bytes or len(self._items) > self.max_items):
+            _, (_, nbytes) = self._items.popitem(last=False)
+            self.current_bytes -= nbytes
+            self.evictions += 1
+            perf.count(f"{self.name}.eviction")
+
+    def invalidate(self, doc_id=None):
+        """doc_id에 해당하는 항목만 (None이면 전부) 비움"""
+        with self._lock:
+            if doc_id is None:
+                self._items.clear()
+                self.current_bytes = 0
+                return
+            for key in [k for k in self._items if k[0] == doc_id]:
+                _, nbytes = self._items.pop(key)
+                self.current_bytes -= nbytes
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'items': len(self._items),
+                'bytes': self.current_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': (self.hits / total) if total else 0.0,
+            }
@@ -0,0 +1,115 @@
+import os
+
+import fitz  # PyMuPDF
+from perf import perf
+
+# 이 모듈은 Qt를 import 하지 않습니다 (명령줄 도구/작업 프로세스에서도 사용).
+# Qt 이미지로 바꾸는 부분은 pdf_engine.py에 있습니다.
+
+TILE_SIZE = 512  # 타일 한 변 (px)
+IMAGE_FORMATS = ("png", "jpg")
+
+
+def render_page_pixmap(doc, page_num, target_width):
+    """페이지 하나를 목표 너비로 렌더링한 fitz.Pixmap (RGB, 알파 없음)"""
+    with perf.stage("render.load_page"):
+        page = doc.load_page(page_num)
+    zoom_factor = target_width / page.rect.width
+    mat = fitz.Matrix(zoom_factor, zoom_factor)
+    with perf.stage("render.get_pixmap"):
+        pix = page.get_pixmap(matrix=mat, alpha=False, colorspace=fitz.csRGB)
+    return pix
+
+
+def tile_rect(target_width, target_height, tile):
+    """타일 (열, 행)의 픽셀 영역 (x, y, 너비, 높이) - 오른쪽/아래 끝 타일은 잘림"""
+    col, row = tile
+    x, y = col * TILE_SIZE, row * TILE_SIZE
+    return x, y, min(TILE_SIZE, target_width - x), min(TILE_SIZE, target_height - y)
+
+
+def render_tile_pixmap(doc, page_num, target_width, tile):
+    """크게 확대했을 때 페이지의 한 타일만 clip 영역으로 렌더링한 fitz.Pixmap"""
+    with perf.stage("render.load_page"):
+        page = doc.load_page(page_num)
+    zoom_factor = target_width / page.rect.width
+    target_height = round(page.rect.height * zoom_factor)
+    x, y, w, h = tile_rect(target_width, target_height, tile)
+    clip = fitz.Rect(x, y, x + w, y + h) / zoom_factor
+    with perf.stage("render.get_pixmap_tile"):
+        pix = page.get_pixmap(matrix=fitz.Matrix(zoom_factor, zoom_factor), clip=clip, alpha=False,
+                              colorspace=fitz.csRGB)
+    return pix
+
+
+def write_thumbnail(pdf_path, save_path, width=200):
+    """첫 페이지를 width 너비의 이미지 파일로 저장 (성공하면 True)"""
+    try:
+        # 잠깐 문서를 열어서
+        doc = fitz.open(pdf_path)
+        page = doc.load_page(0) # 첫 페이지만
+
+        # 썸네일용 작은 크기로 변환
+        zoom = width / page.rect.width
+        mat = fitz.Matrix(zoom, zoom)
+        with perf.stage("thumbnail.get_pixmap"):
+            pix = page.get_pixmap(matrix=mat, alpha=False)
+
+        # 파일로 저장
+        pix.save(save_path)
+        doc.close()
+        return True
+    except:
+        return False
+
+
+def parse_page_ranges(text, total_pages):
+    """'1-3,7,10-' 형식(1부터 시작)을 0부터 시작하는 페이지 번호 목록으로 (범위를 벗어난 번호는 버림)
+
+    형식이 틀리면 ValueError를 냅니다.
+    """
+    pages = []
+    for part in text.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        try:
+            if "-" in part:
+                start, end = part.split("-", 1)
+                first = int(start) if start.strip() else 1
+                last = int(end) if end.strip() else total_pages
+            else:
+                first = last = int(part)
+        except ValueError:
+            raise ValueError(f"잘못된 페이지 범위: '{part}' (예: 1-10,15,20-)") from None
+        pages.extend(p - 1 for p in range(max(1, first), min(total_pages, last) + 1))
+    return sorted(set(pages))
+
+
+def export_page_images(pdf_path, pages, target_width, out_dir, image_format="png", jpg_quality=85):
+    """(작업 프로세스에서도 사용) 지정한 페이지들을 이미지 파일로 저장
+
+    파일 이름은 '문서이름_p0001.png' 형식입니다.
+
+    Returns:
+        tuple: (저장한 페이지 수, 저장한 바이트 수)
+    """
+    if image_format not in IMAGE_FORMATS:
+        raise ValueError(f"지원하지 않는 이미지 형식: {image_format}")
+    stem = os.path.splitext(os.path.basename(pdf_path))[0]
+    written = 0
+    nbytes = 0
+    doc = fitz.open(pdf_path)
+    try:
+        for page_num in pages:
+            pix = render_page_pixmap(doc, page_num, target_width)
+            target = os.path.join(out_dir, f"{stem}_p{page_num + 1:04d}.{image_format}")
+            if image_format == "jpg":
+                pix.save(target, jpg_quality=jpg_quality)
+            else:
+                pix.save(target)
+            written += 1
+            nbytes += os.path.getsize(target)
+    finally:
+        doc.close()
+    return written, nbytes
@@ -0,0 +1,111 @@
+import sqlite3
+
+# FTS5 rowid = 문서 번호 * PAGE_STRIDE + 페이지 번호 (문서 하나를 rowid 범위로 바로 지울 수 있음)
+PAGE_STRIDE = 1_000_000
+MIN_QUERY_LEN = 3  # trigram 토크나이저는 3글자 이상부터 색인을 사용
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS docs (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS pages USING fts5(text, tokenize='trigram');
+"""
+
+
+def _quote(term):
+    return '"' + term.replace('"', '""') + '"'
+
+
+class TextIndex:
+    """책 본문 전체 검색용 색인 (SQLite FTS5, trigram 토크나이저)
+
+    trigram 방식이라 띄어쓰기 없는 한글도 부분 문자열로 찾을 수 있습니다.
+    """
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self._conn = None
+
+    @property
+    def conn(self):
+        # 색인 파일은 처음 검색/색인할 때 엶 (프로그램 시작을 빠르게)
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.db_path)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(SCHEMA)
+            self._conn.commit()
+        return self._conn
+
+    def _doc_id(self, path):
+        row = self.conn.execute("SELECT id FROM docs WHERE path = ?", (path,)).fetchone()
+        return row[0] if row else None
+
+    def add_documents(self, documents):
+        """[(path, [페이지 텍스트, ...]), ...]를 한 트랜잭션으로 색인"""
+        with self.conn:
+            for path, pages_text in documents:
+                self._delete(path)
+                cur = self.conn.execute("INSERT INTO docs(path) VALUES (?)", (path,))
+                base = cur.lastrowid * PAGE_STRIDE
+                self.conn.executemany(
+                    "INSERT INTO pages(rowid, text) VALUES (?, ?)",
+                    [(base + i, text) for i, text in enumerate(pages_text[:PAGE_STRIDE]) if text])
+
+    def remove_document(self, path):
+        with self.conn:
+            self._delete(path)
+
+    def remove_documents(self, paths):
+        with self.conn:
+            for path in paths:
+                self._delete(path)
+
+    def _delete(self, path):
+        doc_id = self._doc_id(path)
+        if doc_id is None:
+            return
+        base = doc_id * PAGE_STRIDE
+        self.conn.execute("DELETE FROM pages WHERE rowid >= ? AND rowid < ?", (base, base + PAGE_STRIDE))
+        self.conn.execute("DELETE FROM docs WHERE id = ?", (doc_id,))
+
+    def rename_document(self, old_path, new_path):
+        """책 경로만 바뀐 경우 (update_book_path) 다시 색인하지 않고 경로만 갱신"""
+        with self.conn:
+            if old_path != new_path:
+                self._delete(new_path)
+            self.conn.execute("UPDATE docs SET path = ? WHERE path = ?", (new_path, old_path))
+
+    def search(self, query, limit=200):
+        """본문 검색. 관련도 순으로 [{'path', 'page', 'snippet', 'score'}, ...] 반환
+
+        query를 공백으로 나눈 단어가 모두 들어 있는 페이지를 찾습니다.
+        3글자보다 짧은 단어가 섞여 있으면 query 전체를 하나의 문구로 찾습니다.
+        """
+        terms = query.split()
+        if terms and all(len(t) >= MIN_QUERY_LEN for t in terms):
+            match = " AND ".join(_quote(t) for t in terms)
+        elif len(" ".join(terms)) >= MIN_QUERY_LEN:
+            match = _quote(" ".join(terms))
+        else:
+            return []
+        rows = self.conn.execute(
+            "SELECT pages.rowid, bm25(pages), snippet(pages, 0, '[', ']', '…', 12), docs.path "
+            "FROM pages JOIN docs ON docs.id = pages.rowid / ? "
+            "WHERE pages MATCH ? ORDER BY bm25(pages) LIMIT ?",
+            (PAGE_STRIDE, match, limit)).fetchall()
+        return [{'path': path, 'page': rowid % PAGE_STRIDE, 'snippet': snippet, 'score': -score}
+                for rowid, score, snippet, path in rows]
+
+    def search_books(self, query, limit=200):
+        """책 단위로 묶은 검색 결과 (책마다 가장 관련도 높은 페이지 하나)"""
+        best = {}
+        for hit in self.search(query, limit):
+            if hit['path'] not in best:
+                best[hit['path']] = hit
+        return list(best.values())
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
@@ -0,0 +1,113 @@
+from PyQt6.QtCore import QObject, QRect, pyqtSignal
+from PyQt6.QtGui import QPainter, QColor, QImage
+from PyQt6.QtWidgets import QWidget
+from render_core import TILE_SIZE, tile_rect
+from night_mode import cached_night_image
+
+# 페이지 전체 이미지가 이보다 크면(픽셀 수) 타일로 나눠서 보이는 부분만 렌더링 (RGB32 기준 약 32MB)
+TILED_MIN_PIXELS = 2048 * 4096
+BACKGROUND = QColor("#505050")
+PLACEHOLDER = QColor("#3d3d3d")
+
+
+class _TileSignals(QObject):
+    # 작업 스레드에서 GUI 스레드로 렌더링 결과 전달 (cache_key, QImage 또는 None)
+    rendered = pyqtSignal(object, object)
+
+
+class TiledPageWidget(QWidget):
+    """크게 확대한 페이지 한 장 - QScrollArea 안에서 화면에 보이는 타일만 렌더링
+
+    위젯 크기는 페이지 전체 크기로 잡고, 보이는 타일(과 주변 한 칸)만 백그라운드에서 clip 렌더링해
+    도착하는 대로 채워 넣습니다. 화면 밖으로 나간 타일은 놓아주고 대기 중인 렌더링도 취소합니다.
+    """
+
+    def __init__(self, engine, prefetcher, parent=None):
+        super().__init__(parent)
+        self.engine = engine
+        self.prefetcher = prefetcher
+        self.page_num = 0
+        self.target_width = 0
+        self.target_height = 0
+        self.night_mode = "off"
+        self._tiles = {}  # 화면 근처 타일만 보관 {(col, row): QImage}
+        self._requested = set()
+        self._signals = _TileSignals()
+        self._signals.rendered.connect(self._on_rendered)
+
+    def set_page(self, page_num, target_width, target_height, night_mode):
+        if (page_num, target_width, target_height, night_mode) == \
+                (self.page_num, self.target_width, self.target_height, self.night_mode):
+            return
+        self.page_num = page_num
+        self.target_width = target_width
+        self.target_height = target_height
+        self.night_mode = night_mode
+        self._tiles.clear()
+        self._requested.clear()
+        self.prefetcher.retain(())
+        self.setFixedSize(target_width, target_height)
+        self.update()
+
+    def _key(self, tile):
+        return self.engine.cache_key(self.page_num, self.target_width, tile=tile)
+
+    def _tiles_in(self, rect, margin=0):
+        if rect.isEmpty():
+            return []
+        first_col = max(0, rect.left() // TILE_SIZE - margin)
+        first_row = max(0, rect.top() // TILE_SIZE - margin)
+        last_col = min((self.target_width - 1) // TILE_SIZE, rect.right() // TILE_SIZE + margin)
+        last_row = min((self.target_height - 1) // TILE_SIZE, rect.bottom() // TILE_SIZE + margin)
+        return [(c, r) for r in range(first_row, last_row + 1) for c in range(first_col, last_col + 1)]
+
+    def _tile_image(self, tile):
+        image = self._tiles.get(tile)
+        if image is not None:
+            return image
+        key = self._key(tile)
+        image = self.engine.cache.get(key)
+        if image is not None:
+            image = cached_night_image(self.engine.cache, key, image, self.night_mode)
+            self._tiles[tile] = image
+            return image
+        if key not in self._requested:
+            self._requested.add(key)
+            self.prefetcher.request(self.page_num, self.target_width, self._signals.rendered.emit, tile=tile)
+        return None
+
+    def _on_rendered(self, key, image):
+        self._requested.discard(key)
+        tile = key[-1]
+        if key != self._key(tile):
+            return  # 다른 페이지/배율의 결과
+        if not isinstance(image, QImage) or image.isNull():
+            return
+        self._tiles[tile] = cached_night_image(self.engine.cache, key, image, self.night_mode)
+        self.update(QRect(*tile_rect(self.target_width, self.target_height, tile)))
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.fillRect(event.rect(), BACKGROUND)
+        if self.target_width <= 0 or self.target_height <= 0:
+            return
+
+        # 스크롤할 때는 새로 드러난 띠만 다시 그리므로, 놓아줄 타일은 보이는 영역 전체로 판단
+        visible_rect = self.visibleRegion().boundingRect()
+        visible = self._tiles_in(visible_rect)
+        wanted = visible + [t for t in self._tiles_in(visible_rect, margin=1) if t not in visible]  # 보이는 타일 먼저
+        for tile in [t for t in self._tiles if t not in wanted]:
+            del self._tiles[tile]
+        wanted_keys = {self._key(t) for t in wanted}
+        self._requested &= wanted_keys
+        self.prefetcher.retain(wanted_keys)
+
+        for tile in wanted:
+            image = self._tile_image(tile)  # 주변 한 칸도 미리 렌더링 요청
+            rect = QRect(*tile_rect(self.target_width, self.target_height, tile))
+            if not rect.intersects(event.rect()):
+                continue
+            if image is not None:
+                painter.drawImage(rect, image)
+            else:
+                painter.fillRect(rect.adjusted(1, 1, -1, -1), PLACEHOLDER)
@@ -0,0 +1,68 @@
+"""LibraryManager 회귀 테스트
+
+실행: python -m unittest discover tests
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+import fitz  # PyMuPDF
+from library_manager import LibraryManager
+
+
+class DeleteCategoryTest(unittest.TestCase):
+    """분류 이동을 아직 DB에 기록하지 않은 상태(3초마다 기록)에서 분류를 지우는 경우"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        # 데이터 폴더(get_data_directory)를 임시 폴더 안으로
+        self._env = {k: os.environ.get(k) for k in ('HOME', 'LOCALAPPDATA')}
+        os.environ['HOME'] = os.environ['LOCALAPPDATA'] = self.tmp.name
+        self.paths = []
+        for name in ('a.pdf', 'b.pdf'):
+            path = os.path.join(self.tmp.name, name)
+            doc = fitz.open()
+            doc.new_page().insert_text((72, 72), name)
+            doc.save(path)
+            doc.close()
+            self.paths.append(os.path.normpath(path))
+        self.manager = LibraryManager()
+        self.manager.add_category("X")
+        self.manager.add_category("Y")
+        self.manager.add_books([self.paths[0]], "X", max_workers=1)
+        self.manager.add_books([self.paths[1]], "Y", max_workers=1)
+        self.manager.flush()
+
+    def tearDown(self):
+        self.manager.store.close()
+        for key, value in self._env.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+        self.tmp.cleanup()
+
+    def reloaded(self):
+        manager = LibraryManager()
+        try:
+            return {b['path']: b['category'] for b in manager.get_books()}
+        finally:
+            manager.store.close()
+
+    def test_move_out_then_delete_category(self):
+        self.manager.move_book(self.paths[0], "Y")
+        self.manager.delete_category("X")
+        self.assertEqual(self.reloaded(), {self.paths[0]: "Y", self.paths[1]: "Y"})
+
+    def test_move_in_then_delete_category(self):
+        self.manager.move_book(self.paths[1], "X")
+        self.manager.delete_category("X")
+        self.assertEqual(self.reloaded(), {})
+
+
+if __name__ == '__main__':
+    unittest.main()